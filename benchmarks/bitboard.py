@@ -0,0 +1,39 @@
+import random
+import sys
+from timeit import timeit
+from typing import List, Tuple
+
+from pycross.bitboard import BitBoard
+
+BOARD_DIMENSIONS: Tuple[int] = (10, 50, 100, 200)
+REPEAT: int = 200
+
+
+def nested_size(matrix: List[List[int]]) -> int:
+    # Small ints are cached by the interpreter, so only the list storage counts
+    return sys.getsizeof(matrix) + sum(sys.getsizeof(row) for row in matrix)
+
+
+def packed_size(board: BitBoard) -> int:
+    return sys.getsizeof(board.rows) + sum(sys.getsizeof(row) for row in board.rows)
+
+
+def main() -> None:
+    print(f"{'dimension':>10} {'lists (B)':>10} {'packed (B)':>11} {'lists cmp (us)':>15} {'packed cmp (us)':>16}")
+    for dimension in BOARD_DIMENSIONS:
+        rng = random.Random(dimension)
+        matrix = [[rng.randint(0, 1) for _ in range(dimension)] for _ in range(dimension)]
+        other = [row[:] for row in matrix]
+        board, other_board = BitBoard.from_matrix(matrix), BitBoard.from_matrix(other)
+
+        lists_us: float = timeit(lambda matrix=matrix, other=other: matrix == other, number=REPEAT) / REPEAT * 1e6
+        packed_us: float = timeit(lambda board=board, other_board=other_board: board == other_board, number=REPEAT) / REPEAT * 1e6
+
+        print(
+            f"{dimension:>10} {nested_size(matrix):>10} {packed_size(board):>11} "
+            f"{lists_us:>15.2f} {packed_us:>16.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
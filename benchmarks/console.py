@@ -0,0 +1,57 @@
+import os
+import random
+from timeit import timeit
+from typing import Final, List, Tuple
+
+from benchmarks.puzzles import random_puzzle
+from pycross.console_mode.game import Grid
+
+BOARD_DIMENSIONS: Final[Tuple[int]] = (5, 25, 50, 100)
+MOVES: Final[int] = 200
+CLEAR_COMMAND: Final[str] = "cls > nul" if os.name == "nt" else "clear > /dev/null 2>&1"
+
+
+def bench(dimension: int) -> Tuple[float]:
+    top_guides, left_guides, solution = random_puzzle(dimension)
+    grid = Grid([guide[::-1] for guide in left_guides], [guide[::-1] for guide in top_guides], solution)
+    rng = random.Random(dimension)
+
+    moves: List[str] = []
+    for _ in range(MOVES // 2):
+        move: str = f"{rng.randint(1, dimension)},{rng.randint(1, dimension)}"
+        moves.extend((move, f"d/{move}"))
+
+    def full_redraw() -> None:
+        for move in moves:
+            grid.draw_pixel(move)
+            grid._row_lines = [grid._draw_row(row) for row in range(dimension)]
+            grid._draw_board()
+
+    def full_redraw_with_clear() -> None:
+        for move in moves[:20]:
+            grid.draw_pixel(move)
+            os.system(CLEAR_COMMAND)
+            grid._row_lines = [grid._draw_row(row) for row in range(dimension)]
+            grid._draw_board()
+
+    def incremental() -> None:
+        for move in moves:
+            grid.draw_pixel(move)
+            grid._draw_changed_rows()
+
+    full_us: float = timeit(full_redraw, number=1) / len(moves) * 1e6
+    clear_us: float = timeit(full_redraw_with_clear, number=1) / 20 * 1e6
+    incremental_us: float = timeit(incremental, number=1) / len(moves) * 1e6
+
+    return full_us, clear_us, incremental_us
+
+
+def main() -> None:
+    print(f"{'dimension':>10} {'redraw (us)':>12} {'clear + redraw (us)':>20} {'incremental (us)':>17}")
+    for dimension in BOARD_DIMENSIONS:
+        full_us, clear_us, incremental_us = bench(dimension)
+        print(f"{dimension:>10} {full_us:>12.1f} {clear_us:>20.1f} {incremental_us:>17.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import json
+import random
+import tempfile
+from pathlib import Path
+from time import perf_counter
+from typing import Final, List
+
+from pycross.bitboard import BitBoard
+from pycross.library import load_pack, open_library
+
+PUZZLES: Final[int] = 10_000
+DIMENSION: Final[int] = 15
+
+
+def random_entry(rng: random.Random, index: int) -> dict:
+    solution: List[List[int]] = [[rng.randint(0, 1) for _ in range(DIMENSION)] for _ in range(DIMENSION)]
+    board = BitBoard.from_matrix(solution)
+    columns = board.transpose()
+
+    return {
+        "name": f"puzzle-{index}",
+        "top_guides": [columns.row_clue(x) for x in range(DIMENSION)],
+        "left_guides": [board.row_clue(y) for y in range(DIMENSION)],
+        "solution": solution,
+    }
+
+
+def main() -> None:
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as directory:
+        pack = Path(directory) / "pack.json"
+        pack.write_text(json.dumps([random_entry(rng, i) for i in range(PUZZLES)]))
+
+        start: float = perf_counter()
+        load_pack(pack)
+        parse_ms: float = (perf_counter() - start) * 1000
+
+        open_library(pack).close()
+
+        start = perf_counter()
+        with open_library(pack) as library:
+            open_ms: float = (perf_counter() - start) * 1000
+
+            start = perf_counter()
+            library[rng.randrange(len(library))]
+            pick_ms: float = (perf_counter() - start) * 1000
+
+    print(f"{PUZZLES} puzzles of {DIMENSION}x{DIMENSION}")
+    print(f"parse pack:     {parse_ms:10.2f} ms")
+    print(f"open cache:     {open_ms:10.2f} ms")
+    print(f"pick a puzzle:  {pick_ms:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
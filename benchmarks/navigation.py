@@ -0,0 +1,43 @@
+import asyncio
+from time import perf_counter
+from timeit import timeit
+from typing import Final, Tuple
+
+from benchmarks.puzzles import random_puzzle
+from pycross import Pycross
+from pycross.app import TILE_ID_TEMPLATE, GameGrid
+
+BOARD_DIMENSIONS: Final[Tuple[int]] = (5, 15, 30)
+KEY_PRESSES: Final[int] = 40
+LOOKUPS: Final[int] = 2_000
+
+
+async def bench(dimension: int) -> Tuple[float]:
+    app = Pycross(*random_puzzle(dimension), virtual_grid=False)
+    async with app.run_test(size=(dimension * 6 + 60, dimension * 3 + 40)) as pilot:
+        x, y = dimension - 1, dimension - 1
+
+        def query_lookup() -> None:
+            app.query_exactly_one(GameGrid)
+            app.query_exactly_one(f"#{TILE_ID_TEMPLATE % (x, y)}")
+
+        query_us: float = timeit(query_lookup, number=LOOKUPS) / LOOKUPS * 1e6
+        index_us: float = timeit(lambda: app._grid.tile(x, y), number=LOOKUPS) / LOOKUPS * 1e6
+
+        start: float = perf_counter()
+        for i in range(KEY_PRESSES):
+            await pilot.press("right" if (i // (dimension - 1)) % 2 == 0 else "left")
+        key_ms: float = (perf_counter() - start) / KEY_PRESSES * 1000
+
+    return query_us, index_us, key_ms
+
+
+def main() -> None:
+    print(f"{'dimension':>10} {'query (us)':>11} {'index (us)':>11} {'key press (ms)':>15}")
+    for dimension in BOARD_DIMENSIONS:
+        query_us, index_us, key_ms = asyncio.run(bench(dimension))
+        print(f"{dimension:>10} {query_us:>11.2f} {index_us:>11.2f} {key_ms:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
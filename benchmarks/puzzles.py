@@ -0,0 +1,18 @@
+import random
+from typing import List, Tuple
+
+from pycross.clues import generate_clues
+
+
+def random_solution(width: int, height: int, density: float = 0.5, seed: int = 0) -> List[List[int]]:
+    rng = random.Random(seed)
+    return [[int(rng.random() < density) for _ in range(width)] for _ in range(height)]
+
+
+def puzzle_from_solution(solution: List[List[int]]) -> Tuple[Tuple[Tuple[int]], Tuple[Tuple[int]], List[List[int]]]:
+    top_guides, left_guides = generate_clues(solution)
+    return top_guides, left_guides, solution
+
+
+def random_puzzle(dimension: int, density: float = 0.5, seed: int = 0):
+    return puzzle_from_solution(random_solution(dimension, dimension, density, seed))
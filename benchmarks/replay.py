@@ -0,0 +1,227 @@
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+from argparse import ArgumentParser
+from time import perf_counter
+from typing import Final, List, Optional, Tuple
+
+from textual.geometry import Region
+
+from benchmarks.puzzles import puzzle_from_solution, random_solution
+from benchmarks.suite import DEFAULT_TOLERANCE, Result, benchmark_result, compare, metadata
+from pycross import Pycross
+from pycross.app import GameGrid
+from pycross.engine import WIN_MODES, GameState
+from pycross.library import load_puzzle
+from pycross.recording import (
+    REDO,
+    REGION,
+    RESET,
+    SET,
+    TOGGLE,
+    UNDO,
+    LoggedMove,
+    MoveLog,
+    MoveRecorder,
+    read_move_log,
+    replay_moves,
+)
+from pycross.session import Session, save_session
+
+MODES: Final[Tuple[str]] = ("engine", "tiles", "virtual")
+BOT_MOVES: Final[int] = 20_000
+UI_MOVES: Final[int] = 1_000 # The UI modes replay the first moves only
+DRAIN_EVERY: Final[int] = 256 # Toggles posted before waiting for the app to handle them
+DEFAULT_OUTPUT: Final[str] = "replay-results.json"
+
+
+def bot_moves(width: int, height: int, count: int, seed: int = 0) -> List[LoggedMove]:
+    """Random play: mostly single toggles, with some drags, undos and redos."""
+    rng = random.Random(seed)
+    moves: List[LoggedMove] = []
+    for _ in range(count):
+        roll: float = rng.random()
+        if roll < 0.9:
+            moves.append(LoggedMove(TOGGLE, rng.randrange(width), rng.randrange(height)))
+        elif roll < 0.95:
+            x, y = rng.randrange(width), rng.randrange(height)
+            moves.append(
+                LoggedMove(
+                    REGION, x, y, rng.randint(0, 1), rng.randint(1, min(5, width - x)), rng.randint(1, min(5, height - y))
+                )
+            )
+        else:
+            moves.append(LoggedMove(UNDO if roll < 0.98 else REDO))
+
+    return moves
+
+
+def write_moves(recorder: MoveRecorder, moves: List[LoggedMove]) -> None:
+    for kind, x, y, value, width, height in moves:
+        if kind == TOGGLE:
+            recorder.toggle(x, y)
+        elif kind == SET:
+            recorder.set(x, y, value)
+        elif kind == REGION:
+            recorder.region(x, y, width, height, value)
+        elif kind == UNDO:
+            recorder.undo()
+        elif kind == REDO:
+            recorder.redo()
+        elif kind == RESET:
+            recorder.reset()
+
+
+def replay_engine(puzzle: Tuple, start: Optional[Session], moves: List[LoggedMove], win_mode: Optional[str]) -> float:
+    game = GameState(puzzle[2], puzzle[0], puzzle[1], win_mode=win_mode)
+    if start is not None:
+        replay_moves(game, (), start)
+
+    begin: float = perf_counter()
+    replay_moves(game, moves)
+    # The UI reads the guide statuses after every move, a script reads them once
+    game.line_changes()
+
+    return perf_counter() - begin
+
+
+async def replay_app(
+    puzzle: Tuple, start: Optional[Session], moves: List[LoggedMove], mode: str, win_mode: Optional[str]
+) -> float:
+    with tempfile.TemporaryDirectory() as directory:
+        # The app resumes from the log's starting board through its own session restore
+        session_path: Optional[str] = None
+        if start is not None:
+            session_path = os.path.join(directory, "start.session")
+            save_session(session_path, *start)
+
+        app = Pycross(*puzzle, virtual_grid=mode == "virtual", session_path=session_path, win_mode=win_mode)
+        width, height = app.game_state.width, app.game_state.height
+        async with app.run_test(size=(min(width * 6 + 60, 400), min(height * 3 + 40, 200))) as pilot:
+            grid = app._grid
+            await pilot.pause()
+
+            begin: float = perf_counter()
+            posted: int = 0
+            for kind, x, y, value, region_width, region_height in moves:
+                if kind == TOGGLE:
+                    # The same path as a key press or a click: the tile is restyled and posts Tile.Painted
+                    if isinstance(grid, GameGrid):
+                        grid.tile(x, y)._toggle()
+                    else:
+                        grid._toggle(x, y)
+                    posted += 1
+                    if posted % DRAIN_EVERY == 0:
+                        await pilot.pause()
+                    continue
+
+                # Every other move is applied directly, once the toggles before it are handled
+                await pilot.pause()
+                if kind == SET:
+                    if app.game_state.set_cell(x, y, value) != value:
+                        app._apply_moves([(x, y)])
+                elif kind == REGION:
+                    app._paint_region(Region(x, y, region_width, region_height), value)
+                elif kind == UNDO:
+                    app.action_undo()
+                elif kind == REDO:
+                    app.action_redo()
+                elif kind == RESET:
+                    app.action_replay()
+            await pilot.pause()
+
+            return perf_counter() - begin
+
+
+def _load_game(options) -> Tuple[Tuple, Optional[Session], List[LoggedMove]]:
+    if options.log is None:
+        width, height = options.size
+        puzzle = puzzle_from_solution(random_solution(width, height, seed=options.seed))
+        moves: List[LoggedMove] = bot_moves(width, height, options.moves, options.seed)
+        if options.record is not None:
+            with MoveRecorder(options.record, GameState(puzzle[2], puzzle[0], puzzle[1])) as recorder:
+                write_moves(recorder, moves)
+        return puzzle, None, moves
+
+    log: MoveLog = read_move_log(options.log)
+    if options.pack is not None:
+        loaded = load_puzzle(options.pack, options.puzzle)
+        puzzle = (loaded.top_guides, loaded.left_guides, loaded.solution)
+    else:
+        board = log.start.board
+        puzzle = puzzle_from_solution(random_solution(board.width, board.height, seed=options.seed))
+
+    # Checks the log belongs to the puzzle before anything is timed
+    replay_moves(GameState(puzzle[2], puzzle[0], puzzle[1]), (), log.start)
+
+    return puzzle, log.start, log.moves
+
+
+def run_replay(
+    puzzle: Tuple, start: Optional[Session], moves: List[LoggedMove], modes: Tuple[str], win_mode: Optional[str]
+) -> dict:
+    size: str = f"{len(puzzle[0])}x{len(puzzle[1])}"
+    results: List[Result] = []
+    for mode in modes:
+        played: List[LoggedMove] = moves if mode == "engine" else moves[:UI_MOVES]
+        if mode == "engine":
+            elapsed: float = replay_engine(puzzle, start, played, win_mode)
+        else:
+            elapsed = asyncio.run(replay_app(puzzle, start, played, mode, win_mode))
+
+        # Time per move, so the suite's regression check applies; the table shows moves per second
+        result: Result = benchmark_result("replay", mode, size, elapsed / max(len(played), 1) * 1e6, "us")
+        result["moves"] = len(played)
+        results.append(result)
+
+    return {"meta": metadata(), "results": results}
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    parser = ArgumentParser(prog="benchmarks.replay", description="Replay a move log, or a bot's moves, and report moves per second")
+    parser.add_argument("--log", help="move log to replay, as written with --record; a bot plays when omitted")
+    parser.add_argument("--pack", help="puzzle pack the log was recorded on; a random puzzle of the log's size otherwise")
+    parser.add_argument("-p", "--puzzle", type=int, default=0, help="index of the puzzle within the pack")
+    parser.add_argument("--size", type=int, nargs=2, default=(50, 50), metavar=("WIDTH", "HEIGHT"), help="board the bot plays on")
+    parser.add_argument("--moves", type=int, default=BOT_MOVES, help="moves the bot plays")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the random puzzle and the bot")
+    parser.add_argument("--record", help="move log the bot's moves are written to")
+    parser.add_argument("--modes", choices=MODES, nargs="+", default=("engine",), help="replay through the engine or the UI")
+    parser.add_argument("--win-mode", choices=WIN_MODES, help="win mode of the replayed game")
+    parser.add_argument("-o", "--output", default=DEFAULT_OUTPUT, help="JSON file the results are written to")
+    parser.add_argument("--compare", help="earlier results file to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="allowed slowdown before a regression is reported")
+    options = parser.parse_args(args)
+
+    try:
+        puzzle, start, moves = _load_game(options)
+    except ValueError as error:
+        parser.error(str(error))
+
+    report: dict = run_replay(puzzle, start, moves, tuple(options.modes), options.win_mode)
+    with open(options.output, "w", encoding="utf-8") as output:
+        json.dump(report, output, indent=2)
+
+    print(f"{'mode':>8} {'size':>10} {'moves':>8} {'us/move':>10} {'moves/s':>12}")
+    for result in report["results"]:
+        per_second: float = 1e6 / result["value"] if result["value"] else 0.0
+        print(
+            f"{result['mode']:>8} {result['dimension']:>10} {result['moves']:>8} "
+            f"{result['value']:>10.3f} {per_second:>12.1f}"
+        )
+
+    if options.compare is not None:
+        with open(options.compare, encoding="utf-8") as baseline:
+            regressions: List[str] = compare(report, json.load(baseline), options.tolerance)
+
+        for regression in regressions:
+            print(f"Regression: {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
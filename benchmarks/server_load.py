@@ -0,0 +1,128 @@
+import asyncio
+import os
+import random
+import tempfile
+from argparse import ArgumentParser
+from statistics import quantiles
+from time import perf_counter, perf_counter_ns
+from typing import List, Optional, Tuple
+
+from benchmarks.puzzles import random_puzzle
+from pycross.library import Puzzle
+from pycross.server import DEFAULT_SESSION_HISTORY, GameServer
+
+DEFAULT_CONNECTIONS: int = 50
+DEFAULT_SESSIONS: int = 2_000
+DEFAULT_MOVES: int = 50
+BOARD_DIMENSIONS: Tuple[int] = (5, 10, 15, 25)
+
+
+async def _request(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, command: str) -> str:
+    writer.write(f"{command}\n".encode("ascii"))
+    reply: str = (await reader.readline()).decode("ascii").strip()
+    if not reply.startswith("ok"):
+        raise RuntimeError(f"{command!r} failed: {reply}")
+
+    return reply
+
+
+async def _player(
+    connect, sessions: int, moves: int, puzzles: int, seed: int, latencies_ns: List[int], barrier: asyncio.Barrier
+) -> None:
+    reader, writer = await connect()
+    rng = random.Random(seed)
+
+    games: List[Tuple[int, int, int]] = []
+    for _ in range(sessions):
+        _, session, width, height = (await _request(reader, writer, f"new {rng.randrange(puzzles)}")).split()
+        games.append((int(session), int(width), int(height)))
+
+    for i in range(moves * sessions):
+        session, width, height = games[i % sessions]
+        command: str = (
+            f"undo {session}" if rng.random() < 0.1 else f"move {session} {rng.randrange(width)} {rng.randrange(height)}"
+        )
+        start: int = perf_counter_ns()
+        await _request(reader, writer, command)
+        latencies_ns.append(perf_counter_ns() - start)
+
+    # Sessions stay open until the server stats have been read
+    await barrier.wait()
+    await barrier.wait()
+    await _request(reader, writer, "quit")
+    writer.close()
+    await writer.wait_closed()
+
+
+async def run_load(
+    connections: int, sessions: int, moves: int, unix: bool = False, history_limit: int = DEFAULT_SESSION_HISTORY
+) -> dict:
+    """Serve random puzzles on localhost and drive `sessions` games spread over `connections` clients."""
+    puzzles: List[Puzzle] = [
+        Puzzle(f"load-{dimension}", *random_puzzle(dimension, seed=dimension)) for dimension in BOARD_DIMENSIONS
+    ]
+    game_server = GameServer(puzzles, history_limit)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path: Optional[str] = os.path.join(directory, "pycross.sock") if unix else None
+        server = await game_server.start(port=0, path=path)
+        if path is not None:
+            def connect():
+                return asyncio.open_unix_connection(path)
+        else:
+            host, port = server.sockets[0].getsockname()[:2]
+
+            def connect():
+                return asyncio.open_connection(host, port)
+
+        latencies_ns: List[int] = []
+        per_connection, extra = divmod(sessions, connections)
+        counts: List[int] = [per_connection + (i < extra) for i in range(connections) if per_connection + (i < extra)]
+        barrier = asyncio.Barrier(len(counts) + 1)
+        start: float = perf_counter()
+        async with server:
+            players = asyncio.gather(
+                *(
+                    _player(connect, count, moves, len(puzzles), i, latencies_ns, barrier)
+                    for i, count in enumerate(counts)
+                )
+            )
+            await barrier.wait()
+            elapsed: float = perf_counter() - start
+            server_stats: str = game_server.execute("stats")
+            await barrier.wait()
+            await players
+
+    cuts: List[float] = quantiles(latencies_ns, n=100) if len(latencies_ns) > 1 else [0.0] * 99
+    return {
+        "sessions": sessions,
+        "connections": connections,
+        "requests": len(latencies_ns),
+        "requests_per_second": len(latencies_ns) / elapsed,
+        "p50_us": cuts[49] / 1000,
+        "p99_us": cuts[98] / 1000,
+        "server": server_stats,
+    }
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    parser = ArgumentParser(prog="benchmarks.server_load", description="Load test the game server on localhost")
+    parser.add_argument("-c", "--connections", type=int, default=DEFAULT_CONNECTIONS)
+    parser.add_argument("-s", "--sessions", type=int, default=DEFAULT_SESSIONS, help="games spread over the connections")
+    parser.add_argument("-m", "--moves", type=int, default=DEFAULT_MOVES, help="commands sent to every game")
+    parser.add_argument("--unix", action="store_true", help="connect over a Unix socket instead of TCP")
+    parser.add_argument("--history", type=int, default=DEFAULT_SESSION_HISTORY, help="undoable moves kept per session")
+    options = parser.parse_args(args)
+
+    report: dict = asyncio.run(
+        run_load(options.connections, options.sessions, options.moves, options.unix, options.history)
+    )
+    print(
+        f"{report['requests']} requests from {report['sessions']} sessions over {report['connections']} connections: "
+        f"{report['requests_per_second']:.0f} req/s, p50 {report['p50_us']:.0f} us, p99 {report['p99_us']:.0f} us"
+    )
+    print(f"Server: {report['server']}")
+
+
+if __name__ == "__main__":
+    main()
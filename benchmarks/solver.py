@@ -0,0 +1,29 @@
+from time import perf_counter
+from typing import List, Tuple
+
+from benchmarks.puzzles import random_puzzle
+from pycross.solver import SolveStatus, solve
+
+BOARD_DIMENSIONS: Tuple[int] = (10, 20, 30, 40, 50)
+PUZZLES: int = 20
+DENSITY: float = 0.6
+
+
+def main() -> None:
+    print(f"{'dimension':>10} {'ms/puzzle':>10} {'unique':>7} {'ambiguous':>10}")
+    for dimension in BOARD_DIMENSIONS:
+        statuses: List[SolveStatus] = []
+        start: float = perf_counter()
+        for seed in range(PUZZLES):
+            top_guides, left_guides, _ = random_puzzle(dimension, DENSITY, seed)
+            statuses.append(solve(top_guides, left_guides).status)
+        elapsed_ms: float = (perf_counter() - start) * 1000 / PUZZLES
+
+        print(
+            f"{dimension:>10} {elapsed_ms:>10.2f} "
+            f"{statuses.count(SolveStatus.UNIQUE):>7} {statuses.count(SolveStatus.AMBIGUOUS):>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+import asyncio
+import json
+import platform
+import random
+import sys
+from argparse import ArgumentParser, ArgumentTypeError
+from datetime import datetime, timezone
+from importlib.metadata import version
+from statistics import median
+from time import perf_counter
+from typing import Dict, Final, List, Optional, Tuple, Union
+
+from benchmarks.puzzles import random_puzzle
+from pycross import Pycross
+from pycross.app import TILE_ID_TEMPLATE, VirtualGameGrid
+from pycross.console_mode.game import Grid
+
+BOARD_DIMENSIONS: Final[Tuple[int]] = (5, 10, 25, 50, 100)
+MODES: Final[Tuple[str]] = ("tiles", "virtual")
+KEY_PRESSES: Final[int] = 40
+CLICKS: Final[int] = 20
+PLAYS: Final[int] = 2_000
+DRAWS: Final[int] = 200
+DEFAULT_OUTPUT: Final[str] = "benchmark-results.json"
+DEFAULT_TOLERANCE: Final[float] = 0.25
+
+Result = Dict[str, object]
+
+
+def benchmark_result(benchmark: str, mode: str, dimension: Union[int, str], value: float, unit: str) -> Result:
+    return {"benchmark": benchmark, "mode": mode, "dimension": dimension, "value": round(value, 3), "unit": unit}
+
+
+def _screen_size(dimension: int) -> Tuple[int]:
+    return dimension * 6 + 60, dimension * 3 + 40
+
+
+def _click_target(app: Pycross, x: int, y: int) -> Tuple[object, Tuple[int]]:
+    if app.virtual_grid:
+        # One cell of border on the top and left of the virtual grid
+        return VirtualGameGrid, (1 + x * VirtualGameGrid.TILE_WIDTH, 1 + y * VirtualGameGrid.TILE_HEIGHT)
+
+    return f"#{TILE_ID_TEMPLATE % (x, y)}", (0, 0)
+
+
+async def bench_app(dimension: int, mode: str, repeat: int) -> List[Result]:
+    puzzle = random_puzzle(dimension)
+    mount_ms: List[float] = []
+    key_ms: List[float] = []
+    traverse_us: List[float] = []
+    click_ms: List[float] = []
+    play_us: List[float] = []
+
+    for _ in range(repeat):
+        app = Pycross(*puzzle, virtual_grid=mode == "virtual")
+
+        start: float = perf_counter()
+        async with app.run_test(size=_screen_size(dimension)) as pilot:
+            mount_ms.append((perf_counter() - start) * 1000)
+
+            # Arrow keys go through action_traverse_grid on tiles and the cursor bindings on the virtual grid
+            target, offset = _click_target(app, 0, 0)
+            await pilot.click(target, offset=offset)
+            start = perf_counter()
+            for i in range(KEY_PRESSES):
+                await pilot.press("right" if (i // (dimension - 1)) % 2 == 0 else "left")
+            key_ms.append((perf_counter() - start) / KEY_PRESSES * 1000)
+
+            # The navigation action alone, without the pilot's wait for the screen to settle
+            grid = app.query_one(VirtualGameGrid) if app.virtual_grid else None
+            start = perf_counter()
+            for i in range(PLAYS):
+                step: int = 1 if (i // (dimension - 1)) % 2 == 0 else -1
+                if grid is not None:
+                    grid.action_move_cursor(step, 0)
+                else:
+                    app.action_traverse_grid(step, 0)
+            traverse_us.append((perf_counter() - start) / PLAYS * 1e6)
+
+            # Every click paints a tile, updates the guides and checks for a win
+            rng = random.Random(dimension)
+            cells: List[Tuple[int]] = [(rng.randrange(min(dimension, 10)), rng.randrange(min(dimension, 10))) for _ in range(CLICKS)]
+            start = perf_counter()
+            for x, y in cells:
+                target, offset = _click_target(app, x, y)
+                await pilot.click(target, offset=offset)
+                await pilot.pause()
+            click_ms.append((perf_counter() - start) / CLICKS * 1000)
+
+            # The same work without the message queue in between
+            moves: List[Tuple[int]] = [(rng.randrange(dimension), rng.randrange(dimension)) for _ in range(PLAYS)]
+            start = perf_counter()
+            for x, y in moves:
+                app._play(x, y)
+            play_us.append((perf_counter() - start) / PLAYS * 1e6)
+
+    return [
+        benchmark_result("mount", mode, dimension, median(mount_ms), "ms"),
+        benchmark_result("key_press", mode, dimension, median(key_ms), "ms"),
+        benchmark_result("traverse", mode, dimension, median(traverse_us), "us"),
+        benchmark_result("click_to_win_check", mode, dimension, median(click_ms), "ms"),
+        benchmark_result("play", mode, dimension, median(play_us), "us"),
+    ]
+
+
+def bench_console(dimension: int, repeat: int) -> List[Result]:
+    top_guides, left_guides, solution = random_puzzle(dimension)
+    grid = Grid([guide[::-1] for guide in left_guides], [guide[::-1] for guide in top_guides], solution)
+    rng = random.Random(dimension)
+    moves: List[Tuple[int]] = [(rng.randrange(dimension), rng.randrange(dimension), rng.randint(0, 1)) for _ in range(DRAWS)]
+
+    draw_us: List[float] = []
+    move_us: List[float] = []
+    for _ in range(repeat):
+        start: float = perf_counter()
+        for _ in range(DRAWS):
+            grid._draw_board()
+        draw_us.append((perf_counter() - start) / DRAWS * 1e6)
+
+        start = perf_counter()
+        for move in moves:
+            grid._set_pixel(*move)
+            grid._draw_changed_rows()
+            grid.check_solved()
+        move_us.append((perf_counter() - start) / DRAWS * 1e6)
+
+    return [
+        benchmark_result("draw_board", "console", dimension, median(draw_us), "us"),
+        benchmark_result("move_and_redraw", "console", dimension, median(move_us), "us"),
+    ]
+
+
+def run_suite(dimensions: Tuple[int], modes: Tuple[str], repeat: int) -> dict:
+    results: List[Result] = []
+    for dimension in dimensions:
+        for mode in modes:
+            results.extend(asyncio.run(bench_app(dimension, mode, repeat)))
+        results.extend(bench_console(dimension, repeat))
+
+    return {"meta": metadata(), "results": results}
+
+
+def metadata() -> Dict[str, str]:
+    return {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "textual": version("textual"),
+    }
+
+
+def _key(result: Result) -> Tuple:
+    return result["benchmark"], result["mode"], result["dimension"]
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> List[str]:
+    baseline_values: Dict[Tuple, float] = {_key(result): result["value"] for result in baseline["results"]}
+
+    regressions: List[str] = []
+    for result in report["results"]:
+        previous: Optional[float] = baseline_values.get(_key(result))
+        if previous and result["value"] > previous * (1 + tolerance):
+            benchmark, mode, dimension = _key(result)
+            # Square boards are measured by their side, other boards by their width x height
+            size: str = f"{dimension}x{dimension}" if isinstance(dimension, int) else dimension
+            regressions.append(
+                f"{benchmark} ({mode}, {size}): "
+                f"{previous} -> {result['value']} {result['unit']}"
+            )
+
+    return regressions
+
+
+def _board_dimension(value: str) -> int:
+    # Navigation sweeps back and forth across a row, which needs two tiles
+    dimension: int = int(value)
+    if dimension < 2:
+        raise ArgumentTypeError(f"board dimension must be at least 2, not {dimension}")
+
+    return dimension
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    parser = ArgumentParser(prog="benchmarks.suite", description="Time the game engine and UI hot paths")
+    parser.add_argument("-o", "--output", default=DEFAULT_OUTPUT, help="JSON file the results are written to")
+    parser.add_argument("--sizes", type=_board_dimension, nargs="+", default=BOARD_DIMENSIONS, help="board dimensions to measure")
+    parser.add_argument("--modes", choices=MODES, nargs="+", default=MODES, help="grid modes to measure")
+    parser.add_argument("--repeat", type=int, default=1, help="runs per measurement, the median is kept")
+    parser.add_argument("--compare", help="earlier results file to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="allowed slowdown before a regression is reported")
+    options = parser.parse_args(args)
+
+    report: dict = run_suite(tuple(options.sizes), tuple(options.modes), options.repeat)
+    with open(options.output, "w", encoding="utf-8") as output:
+        json.dump(report, output, indent=2)
+
+    print(f"{'benchmark':>20} {'mode':>8} {'dimension':>10} {'value':>12}")
+    for result in report["results"]:
+        print(
+            f"{result['benchmark']:>20} {result['mode']:>8} {result['dimension']:>10} "
+            f"{result['value']:>9.2f} {result['unit']}"
+        )
+
+    if options.compare is not None:
+        with open(options.compare, encoding="utf-8") as baseline:
+            regressions: List[str] = compare(report, json.load(baseline), options.tolerance)
+
+        for regression in regressions:
+            print(f"Regression: {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+import random
+from timeit import timeit
+from typing import List, Optional, Tuple
+
+from pycross.engine import CLUES_WIN, GameState
+from pycross.console_mode.game import Grid
+
+BOARD_DIMENSIONS: Tuple[int] = (5, 10, 25, 50, 100)
+MOVES: int = 20_000
+
+
+def random_solution(dimension: int, seed: int = 0) -> List[List[int]]:
+    rng = random.Random(seed)
+    return [[rng.randint(0, 1) for _ in range(dimension)] for _ in range(dimension)]
+
+
+def bench_game_state(dimension: int, win_mode: Optional[str] = None) -> float:
+    game_state = GameState(random_solution(dimension), win_mode=win_mode)
+    rng = random.Random(dimension)
+    moves = [(rng.randrange(dimension), rng.randrange(dimension)) for _ in range(MOVES)]
+    moves_iter = iter(moves)
+
+    return timeit(lambda: game_state.update_state(*next(moves_iter)), number=MOVES) / MOVES
+
+
+def bench_console_grid(dimension: int) -> float:
+    guides = [[1]] * dimension
+    grid = Grid(guides, guides, random_solution(dimension))
+    rng = random.Random(dimension)
+    moves = [(rng.randrange(dimension), rng.randrange(dimension), rng.randint(0, 1)) for _ in range(MOVES)]
+    moves_iter = iter(moves)
+
+    def move() -> None:
+        grid._set_pixel(*next(moves_iter))
+        grid.check_solved()
+
+    return timeit(move, number=MOVES) / MOVES
+
+
+def main() -> None:
+    print(f"{'dimension':>10} {'GameState (ns/move)':>20} {'by clues (ns/move)':>20} {'Grid (ns/move)':>16}")
+    for dimension in BOARD_DIMENSIONS:
+        game_state_ns: float = bench_game_state(dimension) * 1e9
+        clues_ns: float = bench_game_state(dimension, CLUES_WIN) * 1e9
+        console_grid_ns: float = bench_console_grid(dimension) * 1e9
+        print(f"{dimension:>10} {game_state_ns:>20.0f} {clues_ns:>20.0f} {console_grid_ns:>16.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,16 @@
-from .app import PycrossApp as Pycross
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .app import PycrossApp as Pycross
 
 __all__ = ["Pycross"]
+
+
+def __getattr__(name: str) -> Any:
+    # Textual is only imported once the app is needed, so console mode and tools start fast
+    if name == "Pycross":
+        from .app import PycrossApp
+
+        return PycrossApp
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,4 +1,18 @@
+from argparse import ArgumentParser
+
 from pycross import play
+from pycross.engine import WIN_MODES
 
 if __name__ == "__main__":
-    play.start()
+    parser = ArgumentParser(prog="pycross")
+    parser.add_argument("pack", nargs="?", help="puzzle pack: a .json or .non file, or a directory of them")
+    parser.add_argument("-p", "--puzzle", type=int, default=0, help="index of the puzzle within the pack")
+    parser.add_argument("--session", help="file the game is saved to with 's' and resumed from on start")
+    parser.add_argument("--win-mode", choices=WIN_MODES, help="win by matching the solution, or any board that fits the clues")
+    parser.add_argument(
+        "--profile", action="store_true", default=None, help="time every stage of a move and print the latencies on exit"
+    )
+    parser.add_argument("--record", help="file every move of the game is logged to, for benchmarks.replay")
+    args = parser.parse_args()
+
+    play.start(args.pack, args.puzzle, args.session, args.win_mode, args.profile, args.record)
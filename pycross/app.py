@@ -1,17 +1,34 @@
-from itertools import cycle
+import os
+from functools import lru_cache
 from textwrap import dedent
-from typing import Final, Iterator, List, Tuple
+from typing import Final, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple, Union
 
+from rich.segment import Segment
+from rich.style import Style
 from textual.app import App, ComposeResult, RenderResult
 from textual.binding import Binding
 from textual.containers import Container, HorizontalGroup
-from textual.events import Key
+from textual.events import Key, MouseDown, MouseUp, Resize
+from textual.geometry import Region, Size
 from textual.message import Message
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
 from textual.widget import Widget
 from textual.widgets import Label
 
+from pycross.bitboard import BitBoard
+from pycross.clues import ROW, LineChange, LineStatus, generate_clues
+from pycross.engine import GameState
+from pycross.hints import Hint
+from pycross.history import Move
+from pycross.paths import PathLike
+from pycross.profiling import DISPATCH, MOVE, NULL_PROFILER, PLAY, RESTYLE, SOLVED, Profiler, profile_requested
+from pycross.recording import MoveRecorder
+
 DEFAULT_GRID_DIMENSION: Final[int] = 5
 TILE_ID_TEMPLATE: Final[str] = "tile_%s_%s"
+VIRTUAL_GRID_THRESHOLD: Final[int] = 15 # Boards larger than this are drawn on a single surface
+TILE_SIZES: Final[Tuple[Tuple[int]]] = ((6, 3), (4, 2), (2, 1)) # Largest first, the first one to fit the screen is used
 
 
 class WinnerMessage(Label):
@@ -30,9 +47,16 @@ class WinnerMessage(Label):
 
 class Tile(Widget, can_focus=True):
     class Painted(Message): 
-        def __init__(self, x: int, y: int) -> None:
+        def __init__(self, x: int, y: int, posted_ns: int = 0) -> None:
             self.x = x
             self.y = y
+            self.posted_ns = posted_ns # Profiler clock when posted, for the dispatch latency
+            super().__init__()
+
+    class PaintedRegion(Message):
+        def __init__(self, region: Region, value: int) -> None:
+            self.region = region
+            self.value = value
             super().__init__()
 
     def __init__(self, x: int, y: int, *args, **kwargs):
@@ -53,97 +77,546 @@ class Tile(Widget, can_focus=True):
             self._toggle()
 
     def _toggle(self) -> None:
-        self.toggle_class("painted")
-        self.post_message(self.Painted(self.x, self.y))
+        profiler: Profiler = self.app.profiler
+        with profiler.stage(RESTYLE):
+            self.toggle_class("painted")
+        self.post_message(self.Painted(self.x, self.y, profiler.clock()))
+
+
+def _stroke_region(start_x: int, start_y: int, end_x: int, end_y: int) -> Region:
+    # A drag covers the rectangle between the pressed and released tiles
+    return Region(
+        min(start_x, end_x), min(start_y, end_y), abs(end_x - start_x) + 1, abs(end_y - start_y) + 1
+    )
+
+
+def _viewport_strip(segments: List[Segment], cell_length: int, crop_start: int, width: int) -> Strip:
+    # Segments are whole tiles of single cell characters, so only the first and the last one
+    # can stick out of the viewport. Trimming them is much cheaper than Strip.crop on long lines
+    if crop_start and segments:
+        first: Segment = segments[0]
+        segments[0] = Segment(first.text[crop_start:], first.style)
+    overflow: int = cell_length - crop_start - width
+    if overflow > 0:
+        last: Segment = segments[-1]
+        segments[-1] = Segment(last.text[:len(last.text) - overflow], last.style)
+
+    return Strip(segments, max(0, min(width, cell_length - crop_start)))
 
 
 class GameGrid(Container):
     CHECKERBOARD_PATTERN: Tuple[str] = ["checkerboard-a", "checkerboard-b"]
 
-    def __init__(self, dimension: int = DEFAULT_GRID_DIMENSION):
-        self.dimension: int = dimension
+    def __init__(self, columns: int = DEFAULT_GRID_DIMENSION, rows: Optional[int] = None):
+        self.columns: int = columns
+        self.rows: int = rows if rows is not None else columns
+        # Row-major: the tile at (x, y) is tiles[y * columns + x]
+        self.tiles: List[Tile] = []
+        self._stroke_start: Optional[Tile] = None
         super().__init__()
 
-        self.styles.grid_size_rows = self.styles.grid_size_columns = dimension
+        self.styles.grid_size_columns = self.columns
+        self.styles.grid_size_rows = self.rows
+
+    def set_tile_size(self, tile_width: int, tile_height: int, width: int, height: int) -> None:
+        # Tiles fill their grid cell, so resizing them is a style change on the grid alone
+        self.styles.grid_columns = (tile_width,)
+        self.styles.grid_rows = (tile_height,)
+        self.styles.width = width
+        self.styles.height = height
+        self.set_class(tile_height < TILE_SIZES[0][1], "compact")
 
     def compose(self) -> ComposeResult:
-        pattern_iterator: Iterator[str] = cycle(self.CHECKERBOARD_PATTERN)
+        self.tiles = [
+            Tile(x, y, classes=self.CHECKERBOARD_PATTERN[(x + y) % 2])
+            for y in range(self.rows)
+            for x in range(self.columns)
+        ]
+        yield from self.tiles
+
+    def tile(self, x: int, y: int) -> Tile:
+        return self.tiles[y * self.columns + x]
+
+    def on_mouse_down(self, event: MouseDown) -> None:
+        self._stroke_start = self._tile_at(event)
+
+    def on_mouse_up(self, event: MouseUp) -> None:
+        start, self._stroke_start = self._stroke_start, None
+        end: Optional[Tile] = self._tile_at(event)
+
+        # Releasing on the pressed tile is a click, which the tile handles itself
+        if start is not None and end is not None and end is not start:
+            value: int = 0 if start.has_class("painted") else 1
+            self.post_message(Tile.PaintedRegion(_stroke_region(start.x, start.y, end.x, end.y), value))
+
+    def _tile_at(self, event: Union[MouseDown, MouseUp]) -> Optional[Tile]:
+        widget, _ = self.screen.get_widget_at(event.screen_x, event.screen_y)
+        return widget if isinstance(widget, Tile) else None
 
-        q_tiles: int = self.dimension**2
-        for i in range(q_tiles):
-            x = i % self.dimension
-            y = int(i / self.dimension)
+    def sync_cells(self, cells: Iterable[Tuple[int]], board: BitBoard) -> None:
+        with self.app.profiler.stage(RESTYLE), self.app.batch_update():
+            for x, y, *_ in cells:
+                self.tiles[y * self.columns + x].set_class(bool((board.rows[y] >> x) & 1), "painted")
 
-            yield Tile(x, y, classes=f"{next(pattern_iterator)}")
+    def set_board(self, board: BitBoard) -> None:
+        with self.app.batch_update():
+            for tile in self.tiles:
+                tile.set_class(bool((board.rows[tile.y] >> tile.x) & 1), "painted")
+
+
+class VirtualGameGrid(ScrollView, can_focus=True):
+    TILE_WIDTH: Final[int] = 2
+    TILE_HEIGHT: Final[int] = 1
+
+    COMPONENT_CLASSES = {
+        "virtual-grid--checkerboard-a",
+        "virtual-grid--checkerboard-b",
+        "virtual-grid--painted",
+        "virtual-grid--cursor",
+    }
+    BINDINGS = [
+        Binding("up", "move_cursor(0,-1)", "Move Up", show=False),
+        Binding("down", "move_cursor(0,1)", "Move Down", show=False),
+        Binding("left", "move_cursor(-1,0)", "Move Left", show=False),
+        Binding("right", "move_cursor(1,0)", "Move Right", show=False),
+    ]
+
+    def __init__(self, columns: int = DEFAULT_GRID_DIMENSION, rows: Optional[int] = None):
+        self.columns: int = columns
+        self.rows: int = rows if rows is not None else columns
+        self.painted: BitBoard = BitBoard(self.columns, self.rows)
+        self.cursor_x: int = 0
+        self.cursor_y: int = 0
+        self._stroke_start: Optional[Tuple[int]] = None
+        self._styles: Optional[Tuple[Style]] = None
+        super().__init__()
+
+        self.virtual_size = Size(self.columns * self.TILE_WIDTH, self.rows * self.TILE_HEIGHT)
+
+    def render_line(self, y: int) -> Strip:
+        scroll_x, scroll_y = self.scroll_offset
+        width: int = self.size.width
+        base_style, checkerboard_a, checkerboard_b, painted_style, cursor_style = self._tile_styles()
+        tile_y: int = (scroll_y + y) // self.TILE_HEIGHT
+        if tile_y >= self.rows:
+            return Strip.blank(width, base_style)
+
+        # Only the tiles within the viewport are turned into segments
+        first_x: int = scroll_x // self.TILE_WIDTH
+        last_x: int = min(self.columns, -(-(scroll_x + width) // self.TILE_WIDTH))
+
+        checkerboard: Tuple[Style] = (checkerboard_a, checkerboard_b)
+        painted_row: int = self.painted.rows[tile_y]
+        cursor_x: int = self.cursor_x if tile_y == self.cursor_y and self.has_focus else -1
+        blank: str = " " * self.TILE_WIDTH
+
+        segments: List[Segment] = []
+        for tile_x in range(first_x, last_x):
+            if (painted_row >> tile_x) & 1:
+                style = painted_style
+            else:
+                style = checkerboard[(tile_x + tile_y) % 2]
+
+            if tile_x == cursor_x:
+                segments.append(Segment("[]", style + cursor_style))
+            else:
+                segments.append(Segment(blank, style))
+
+        strip: Strip = _viewport_strip(
+            segments, (last_x - first_x) * self.TILE_WIDTH, scroll_x - first_x * self.TILE_WIDTH, width
+        )
+        return strip.extend_cell_length(width, base_style)
+
+    def _tile_styles(self) -> Tuple[Style]:
+        # Resolving component styles is costly and every line needs them, they are kept until the CSS changes
+        if self._styles is None:
+            self._styles = (
+                self.rich_style,
+                self.get_component_rich_style("virtual-grid--checkerboard-a"),
+                self.get_component_rich_style("virtual-grid--checkerboard-b"),
+                self.get_component_rich_style("virtual-grid--painted"),
+                self.get_component_rich_style("virtual-grid--cursor", partial=True),
+            )
+
+        return self._styles
+
+    def notify_style_update(self) -> None:
+        self._styles = None
+        super().notify_style_update()
+
+    def _refresh_tile(self, y: int) -> None:
+        self.refresh_lines(y * self.TILE_HEIGHT, self.TILE_HEIGHT)
+
+    def on_focus(self) -> None:
+        self._refresh_tile(self.cursor_y)
+
+    def on_blur(self) -> None:
+        self._refresh_tile(self.cursor_y)
+
+    def on_mouse_down(self, event: MouseDown) -> None:
+        self._stroke_start = self._tile_at(event)
+
+    def on_mouse_up(self, event: MouseUp) -> None:
+        start, self._stroke_start = self._stroke_start, None
+        end: Optional[Tuple[int]] = self._tile_at(event)
+        if start is None or end is None:
+            return
+
+        self.move_cursor_to(*end)
+        if start == end:
+            self._toggle(*end)
+        else:
+            value: int = 1 - self.painted.get(*start)
+            self.post_message(Tile.PaintedRegion(_stroke_region(*start, *end), value))
+
+    def _tile_at(self, event: Union[MouseDown, MouseUp]) -> Optional[Tuple[int]]:
+        offset = event.get_content_offset(self)
+        if offset is None:
+            return None
+
+        scroll_x, scroll_y = self.scroll_offset
+        tile_x: int = (offset.x + scroll_x) // self.TILE_WIDTH
+        tile_y: int = (offset.y + scroll_y) // self.TILE_HEIGHT
+        if 0 <= tile_x < self.columns and 0 <= tile_y < self.rows:
+            return tile_x, tile_y
+
+        return None
+
+    def on_key(self, event: Key) -> None:
+        if event.key == "z":
+            self._toggle(self.cursor_x, self.cursor_y)
+
+    def action_move_cursor(self, move_x: int, move_y: int) -> None:
+        with self.app.profiler.stage(MOVE):
+            self.move_cursor_to(self.cursor_x + move_x, self.cursor_y + move_y)
+
+    def move_cursor_to(self, x: int, y: int) -> None:
+        if not (0 <= x < self.columns and 0 <= y < self.rows):
+            return
+
+        previous_y: int = self.cursor_y
+        self.cursor_x, self.cursor_y = x, y
+        self._refresh_tile(previous_y)
+        self._refresh_tile(y)
+
+        self.scroll_to_region(
+            Region(x * self.TILE_WIDTH, y * self.TILE_HEIGHT, self.TILE_WIDTH, self.TILE_HEIGHT),
+            animate=False,
+        )
+
+    def _toggle(self, x: int, y: int) -> None:
+        profiler: Profiler = self.app.profiler
+        with profiler.stage(RESTYLE):
+            self.painted.toggle(x, y)
+            self._refresh_tile(y)
+        self.post_message(Tile.Painted(x, y, profiler.clock()))
+
+    def sync_cells(self, cells: Iterable[Tuple[int]], board: BitBoard) -> None:
+        with self.app.profiler.stage(RESTYLE):
+            rows: Set[int] = set()
+            for x, y, *_ in cells:
+                self.painted.set(x, y, (board.rows[y] >> x) & 1)
+                rows.add(y)
+
+            for y in rows:
+                self._refresh_tile(y)
+
+    def set_board(self, board: BitBoard) -> None:
+        self.painted = BitBoard(board.width, board.height, board.rows)
+        self.refresh()
+
+    def reset(self) -> None:
+        self.painted.clear()
+        self.cursor_x = self.cursor_y = 0
+        self.scroll_to(0, 0, animate=False)
+        self.refresh()
+
+
+class GuideLabel(Label):
+    def set_status(self, status: LineStatus) -> None:
+        self.set_class(status is LineStatus.COMPLETE, "guide-complete")
+        self.set_class(status is LineStatus.ERROR, "guide-error")
 
 
 class TopFrame(Container):
-    def __init__(self, guides: Tuple[Tuple[int]], left_offset: int, height: int):
+    def __init__(self, guides: Tuple[Tuple[int]], height: int):
         self.guides = guides
+        self.labels: List[GuideLabel] = []
         super().__init__()
 
         self.styles.grid_size_columns = len(guides)
-        self.styles.margin = (0, 0, 0, left_offset)
         self.styles.height = height
 
     def compose(self) -> ComposeResult:
-        for col in self.guides:
-            yield Label("\n".join(map(str, col)))
+        self.labels = [GuideLabel("\n".join(map(str, col))) for col in self.guides]
+        yield from self.labels
+
+    def set_status(self, index: int, status: LineStatus) -> None:
+        self.labels[index].set_status(status)
 
 
 class LeftFrame(Container):
     def __init__(self, guides: Tuple[Tuple[int]], width: int):
         self.guides = guides
+        self.labels: List[GuideLabel] = []
         super().__init__()
 
         self.styles.grid_size_rows = len(guides)
         self.styles.width = width
 
     def compose(self) -> ComposeResult:
-        for row in self.guides:
-            yield Label(" ".join(map(str, row)))
+        self.labels = [GuideLabel(" ".join(map(str, row))) for row in self.guides]
+        yield from self.labels
+
+    def set_status(self, index: int, status: LineStatus) -> None:
+        self.labels[index].set_status(status)
+
+
+class VirtualGuides(ScrollView, can_focus=False):
+    """Guides of a virtual grid drawn line by line, instead of a label per guide.
+
+    The frame follows the grid scroll along the guides and scrolls on its own across them.
+    """
+    COMPONENT_CLASSES = {
+        "virtual-guides--complete",
+        "virtual-guides--error",
+    }
+
+    def __init__(self, guides: Tuple[Tuple[int]]):
+        self.guides = guides
+        self.statuses: List[LineStatus] = [LineStatus.PENDING] * len(guides)
+        self._styles: Optional[Tuple[Style]] = None
+        super().__init__()
+
+    def set_status(self, index: int, status: LineStatus) -> None:
+        if self.statuses[index] is not status:
+            self.statuses[index] = status
+            self.refresh()
+
+    def _status_styles(self) -> Tuple[Style]:
+        if self._styles is None:
+            self._styles = (
+                self.rich_style,
+                self.rich_style + self.get_component_rich_style("virtual-guides--complete"),
+                self.rich_style + self.get_component_rich_style("virtual-guides--error"),
+            )
+
+        return self._styles
+
+    def notify_style_update(self) -> None:
+        self._styles = None
+        super().notify_style_update()
+
+    def _style(self, styles: Tuple[Style], index: int) -> Style:
+        status: LineStatus = self.statuses[index]
+        return styles[1] if status is LineStatus.COMPLETE else styles[2] if status is LineStatus.ERROR else styles[0]
+
+
+class VirtualTopFrame(VirtualGuides):
+    def __init__(self, guides: Tuple[Tuple[int]], height: int):
+        super().__init__(guides)
+
+        self.virtual_size = Size(len(guides) * VirtualGameGrid.TILE_WIDTH, height)
+
+    def render_line(self, y: int) -> Strip:
+        scroll_x, scroll_y = self.scroll_offset
+        width: int = self.size.width
+        tile_width: int = VirtualGameGrid.TILE_WIDTH
+        line: int = scroll_y + y
+
+        first_x: int = scroll_x // tile_width
+        last_x: int = min(len(self.guides), -(-(scroll_x + width) // tile_width))
+        styles: Tuple[Style] = self._status_styles()
+
+        segments: List[Segment] = []
+        for x in range(first_x, last_x):
+            guide: Tuple[int] = self.guides[x]
+            text: str = str(guide[line]) if line < len(guide) else ""
+            segments.append(Segment(text.ljust(tile_width)[:tile_width], self._style(styles, x)))
+
+        strip: Strip = _viewport_strip(segments, (last_x - first_x) * tile_width, scroll_x - first_x * tile_width, width)
+        return strip.extend_cell_length(width, styles[0])
+
+
+class VirtualLeftFrame(VirtualGuides):
+    def __init__(self, guides: Tuple[Tuple[int]], width: int):
+        super().__init__(guides)
+
+        self.texts: List[str] = [" ".join(map(str, guide)).rjust(width) for guide in guides]
+        self.virtual_size = Size(width, len(guides) * VirtualGameGrid.TILE_HEIGHT)
+
+    def render_line(self, y: int) -> Strip:
+        scroll_x, scroll_y = self.scroll_offset
+        width: int = self.size.width
+        styles: Tuple[Style] = self._status_styles()
+        row: int = (scroll_y + y) // VirtualGameGrid.TILE_HEIGHT
+        if row >= len(self.guides):
+            return Strip.blank(width, styles[0])
+
+        text: str = self.texts[row][scroll_x:scroll_x + width]
+        strip = Strip([Segment(text, self._style(styles, row))], len(text))
+        return strip.extend_cell_length(width, styles[0])
+
+
+class BoardLayout(NamedTuple):
+    tile_width: int
+    tile_height: int
+    grid_width: int
+    grid_height: int
+    top_frame_offset: int
+    top_frame_width: int
+    top_frame_height: int
+    left_frame_width: int
+    left_frame_height: int
+
+
+@lru_cache(maxsize=64)
+def board_layout(
+    columns: int, rows: int, left_frame_width: int, top_frame_height: int, available: Optional[Size], virtual_grid: bool
+) -> BoardLayout:
+    """Tile size and frame geometry for a board drawn within `available` cells (unbounded when None).
+
+    Layouts only depend on their arguments, so a board is measured once per screen size.
+    """
+    if virtual_grid:
+        # The virtual grid scrolls, its tiles are always the smallest ones
+        tile_width, tile_height = VirtualGameGrid.TILE_WIDTH, VirtualGameGrid.TILE_HEIGHT
+        content_width: int = columns * tile_width
+        content_height: int = rows * tile_height
+        top_height, left_width = top_frame_height, left_frame_width
+        view_width, view_height = content_width, content_height
+        if available is not None:
+            # Long guides get at most a third of the screen and scroll across, a spare
+            # cell on each axis is kept for the grid scrollbars
+            top_height = min(top_frame_height, max(1, available.height // 3))
+            left_width = min(left_frame_width, max(1, available.width // 3))
+            view_width = max(
+                tile_width, min(content_width, available.width - left_width - Board.VIRTUAL_TOP_FRAME_OFFSET - 1)
+            )
+            view_height = max(tile_height, min(content_height, available.height - top_height - 2))
+
+        # Every scrollbar is one cell thick (see pycross.tcss)
+        scroll_x, scroll_y = int(view_width < content_width), int(view_height < content_height)
+        return BoardLayout(
+            tile_width,
+            tile_height,
+            view_width + scroll_y + 1,
+            view_height + scroll_x + 1,
+            Board.VIRTUAL_TOP_FRAME_OFFSET + left_width,
+            view_width + int(top_height < top_frame_height),
+            top_height,
+            left_width,
+            view_height + int(left_width < left_frame_width),
+        )
+
+    for tile_width, tile_height in TILE_SIZES:
+        # GameGrid border and left padding, plus a spare cell on each axis
+        grid_width: int = columns * tile_width + 3
+        grid_height: int = rows * tile_height + 2
+        fits: bool = available is None or (
+            left_frame_width + Board.LEFT_FRAME_MARGIN + grid_width <= available.width
+            and top_frame_height + grid_height <= available.height
+        )
+        if fits:
+            break
+
+    return BoardLayout(
+        tile_width,
+        tile_height,
+        grid_width,
+        grid_height,
+        Board.TOP_FRAME_OFFSET + (tile_width - 1) // 2 + left_frame_width,
+        columns * tile_width + 1,
+        top_frame_height,
+        left_frame_width,
+        grid_height,
+    )
 
 
 class Board(Container):
-    BASE_TOP_FRAME_OFFSET: Final[int] = 5 # LeftFrame right mirgin (1) + GameGrid left padding (1) + Tile half width (6/2)
+    LEFT_FRAME_MARGIN: Final[int] = 1
+    TOP_FRAME_OFFSET: Final[int] = 3 # LeftFrame right margin (1) + GameGrid left border (1) + GameGrid left padding (1)
+    VIRTUAL_TOP_FRAME_OFFSET: Final[int] = 2 # LeftFrame right mirgin (1) + VirtualGameGrid left border (1)
 
-    def __init__(self, top_guides: Tuple[Tuple[int]], left_guides: Tuple[Tuple[int]]):
+    def __init__(self, top_guides: Tuple[Tuple[int]], left_guides: Tuple[Tuple[int]], virtual_grid: bool = False):
         self.top_guides = top_guides
         self.left_guides = left_guides
+        self.virtual_grid = virtual_grid
 
         self._max_top_guides_len: int = len(max(top_guides, key=len))
-        self._max_left_guides_len: int = len(max(left_guides, key=len))
-
-        self._left_frame_width: int = (self._max_left_guides_len * 2) - 1
-        self._top_frame_offset: int = self.BASE_TOP_FRAME_OFFSET + self._left_frame_width
+        self._left_frame_width: int = max(len(" ".join(map(str, guide))) for guide in left_guides)
         super().__init__()
 
+        self.grid: Union[GameGrid, VirtualGameGrid]
+        self.top_frame: Union[TopFrame, VirtualTopFrame]
+        self.left_frame: Union[LeftFrame, VirtualLeftFrame]
+        self.winner_message = WinnerMessage()
+        if virtual_grid:
+            self.grid = VirtualGameGrid(len(top_guides), len(left_guides))
+            self.top_frame = VirtualTopFrame(self.top_guides, self._max_top_guides_len)
+            self.left_frame = VirtualLeftFrame(self.left_guides, self._left_frame_width)
+        else:
+            self.grid = GameGrid(len(top_guides), len(left_guides))
+            self.top_frame = TopFrame(self.top_guides, self._max_top_guides_len)
+            self.left_frame = LeftFrame(self.left_guides, self._left_frame_width)
+        self.layout_for(None)
+
+    def layout_for(self, available: Optional[Size]) -> BoardLayout:
+        """Size the tiles and frames to fit `available` cells, restyling only when the layout changes."""
+        layout: BoardLayout = board_layout(
+            len(self.top_guides),
+            len(self.left_guides),
+            self._left_frame_width,
+            self._max_top_guides_len,
+            available,
+            self.virtual_grid,
+        )
+        if layout == getattr(self, "board_layout", None):
+            return layout
+
+        self.board_layout: BoardLayout = layout
+        if isinstance(self.grid, GameGrid):
+            self.grid.set_tile_size(layout.tile_width, layout.tile_height, layout.grid_width, layout.grid_height)
+        else:
+            self.grid.styles.width = layout.grid_width
+            self.grid.styles.height = layout.grid_height
+        self.top_frame.styles.margin = (0, 0, 0, layout.top_frame_offset)
+        self.top_frame.styles.width = layout.top_frame_width
+        self.top_frame.styles.height = layout.top_frame_height
+        self.left_frame.styles.width = layout.left_frame_width
+        self.left_frame.styles.height = layout.left_frame_height
+
+        return layout
+
     def compose(self) -> ComposeResult:
-        yield TopFrame(self.top_guides, self._top_frame_offset, self._max_top_guides_len)
-        yield HorizontalGroup(LeftFrame(self.left_guides, self._left_frame_width), GameGrid(5))
-        yield WinnerMessage()
+        # Sized for the screen up front, so the first frame is laid out only once
+        self.layout_for(self.app.size - self.screen.styles.gutter.totals)
 
+        yield self.top_frame
+        yield HorizontalGroup(self.left_frame, self.grid)
+        yield self.winner_message
 
-class GameState():
-    def __init__(self, solution: Tuple[Tuple[int]]):
-        self.solution = solution
-        self.solved: bool = False
-        self.state: List[List[int]] = [
-            [0] * len(self.solution) for _ in range(len(self.solution[0]))
-        ]
+    def on_mount(self) -> None:
+        if self.virtual_grid:
+            # The guides scroll along with the grid, never on their own along the board
+            self.watch(self.grid, "scroll_x", self._follow_grid_x)
+            self.watch(self.grid, "scroll_y", self._follow_grid_y)
 
-    def update_state(self, x: int, y: int) -> bool:
-        self.state[y][x] = 1 - self.state[y][x]
+    def _follow_grid_x(self, scroll_x: float) -> None:
+        self.top_frame.set_scroll(scroll_x, None)
 
-        self._check_solved()
+    def _follow_grid_y(self, scroll_y: float) -> None:
+        self.left_frame.set_scroll(None, scroll_y)
 
-    def _check_solved(self) -> None:
-        for y in range(len(self.state)):
-            for x in range(len(self.state[y])):
-                if self.state[y][x] != self.solution[y][x]:
-                    return
+    def on_resize(self, event: Resize) -> None:
+        self.layout_for(event.size)
 
-        self.solved = True
+    def update_guides(self, changes: List[LineChange]) -> None:
+        for axis, index, status in changes:
+            frame: Union[TopFrame, LeftFrame, VirtualTopFrame, VirtualLeftFrame] = (
+                self.left_frame if axis == ROW else self.top_frame
+            )
+            frame.set_status(index, status)
 
 
 class PycrossApp(App):
@@ -154,28 +627,87 @@ class PycrossApp(App):
         Binding("down", "traverse_grid(0,1)", "Move Down"),
         Binding("left", "traverse_grid(-1,0)", "Move Left"),
         Binding("right", "traverse_grid(1,0)", "Move Right"),
-        Binding("r", "replay", "Replay Game")
+        Binding("r", "replay", "Replay Game"),
+        Binding("u", "undo", "Undo"),
+        Binding("y", "redo", "Redo"),
+        Binding("s", "save_session", "Save Game"),
+        Binding("f", "fill_row", "Fill Row"),
+        Binding("g", "fill_column", "Fill Column"),
+        Binding("h", "hint", "Hint"),
     ]
 
-    def __init__(self, top_guides: Tuple[Tuple[int]], left_guides: Tuple[Tuple[int]], solution: Tuple[Tuple[int]]):
+    def __init__(
+        self,
+        top_guides: Tuple[Tuple[int]],
+        left_guides: Tuple[Tuple[int]],
+        solution: Optional[Tuple[Tuple[int]]],
+        virtual_grid: Optional[bool] = None,
+        session_path: Optional[PathLike] = None,
+        win_mode: Optional[str] = None,
+        profile: Optional[bool] = None,
+        record_path: Optional[PathLike] = None,
+    ):
         self.top_guides = top_guides
         self.left_guides = left_guides
-        self.game_state = GameState(solution)
+        self.game_state = GameState(solution, top_guides, left_guides, win_mode=win_mode)
+        self.virtual_grid: bool = (
+            max(len(top_guides), len(left_guides)) > VIRTUAL_GRID_THRESHOLD if virtual_grid is None else virtual_grid
+        )
+        self.session_path: Optional[PathLike] = session_path
+        # Stage latencies are only measured on request, the null profiler reads no clock
+        profile = profile_requested() if profile is None else profile
+        self.profiler: Profiler = Profiler() if profile else NULL_PROFILER
+        self.record_path: Optional[PathLike] = record_path
+        self.recorder: Optional[MoveRecorder] = None
 
-        self._check_game_parameters(solution)
         super().__init__()
 
-    def _check_game_parameters(self, solution: Tuple[Tuple[int]]):
-        if len(solution) != len(self.left_guides):
-            raise ValueError("Unmatching number of rows between Solution and Left Guide")
+    @classmethod
+    def from_solution(cls, solution: Tuple[Tuple[int]], **kwargs) -> "PycrossApp":
+        top_guides, left_guides = generate_clues(solution)
+        solution = tuple(tuple(int(cell) for cell in row) for row in solution)
 
-        top_guides_len: int = len(self.top_guides)
-        for row in solution:
-            if len(row) != top_guides_len:
-                raise ValueError("Unmatching number of columns between Solution and Top Guide")
+        return cls(top_guides, left_guides, solution, **kwargs)
 
     def compose(self) -> ComposeResult:
-        yield Board(self.top_guides, self.left_guides)
+        board = Board(self.top_guides, self.left_guides, self.virtual_grid)
+        self._board: Board = board
+        self._grid: Union[GameGrid, VirtualGameGrid] = board.grid
+        self._winner_message: WinnerMessage = board.winner_message
+
+        yield board
+
+    def on_mount(self) -> None:
+        if self.session_path is not None and os.path.exists(self.session_path):
+            self.restore_session(self.session_path)
+        else:
+            self._board.update_guides(self.game_state.line_changes())
+        # Started once a saved session is restored, so the log holds the board play resumes from
+        if self.record_path is not None:
+            self.recorder = MoveRecorder(self.record_path, self.game_state)
+
+    def on_unmount(self) -> None:
+        if self.recorder is not None:
+            self.recorder.close()
+
+    def action_save_session(self) -> None:
+        if self.session_path is None:
+            self.notify("Start the game with a session file to save it", severity="warning")
+            return
+
+        self.game_state.save(self.session_path)
+        self.notify("Game saved")
+
+    def restore_session(self, path: PathLike) -> None:
+        self.game_state.restore(path)
+        self._grid.set_board(self.game_state.state)
+        self._board.update_guides(self.game_state.line_changes())
+
+        self._grid.disabled = self.game_state.solved
+        if self.game_state.solved:
+            self._winner_message.show()
+        else:
+            self._winner_message.hide()
 
     def action_traverse_grid(self, move_x: int, move_y: int) -> None:
         if isinstance(self.focused, Tile):
@@ -192,31 +724,120 @@ class PycrossApp(App):
         return next_x, next_y
     
     def _move(self, next_x: int, next_y: int) -> None:
-        grid: GameGrid = self.query_exactly_one(GameGrid)
+        grid: GameGrid = self._grid
 
-        if 0 <= next_x < grid.dimension and 0 <= next_y < grid.dimension:
-            tile_id: str = TILE_ID_TEMPLATE % (next_x, next_y)
-            next_tile: Tile = self.query_exactly_one(f"#{tile_id}")
-
-            self.set_focus(next_tile)
+        if 0 <= next_x < grid.columns and 0 <= next_y < grid.rows:
+            with self.profiler.stage(MOVE):
+                self.set_focus(grid.tile(next_x, next_y))
 
     def action_replay(self):
-        if self.query_one(GameGrid).disabled:
-            self.game_state = GameState(self.game_state.solution)
-
-            self.query(Tile).remove_class("painted")
-            self.query_one(WinnerMessage).hide()
-            self.query_one(GameGrid).disabled = False
+        grid: Union[GameGrid, VirtualGameGrid] = self._grid
+        if grid.disabled:
+            # Only the painted cells are cleared, and only their guides are checked again
+            painted: List[Tuple[int]] = self.game_state.reset()
+            if self.recorder is not None:
+                self.recorder.reset()
+            with self.batch_update():
+                self._board.update_guides(self.game_state.line_changes())
+                self._winner_message.hide()
+                grid.disabled = False
+
+                if isinstance(grid, VirtualGameGrid):
+                    grid.reset()
+                    self.set_focus(grid)
+                    return
 
-            tile_id: str = TILE_ID_TEMPLATE % (0, 0)
-            self.set_focus(self.query_exactly_one(f"#{tile_id}"))
+                grid.sync_cells(painted, self.game_state.state)
+                self.set_focus(grid.tile(0, 0))
 
     def on_tile_painted(self, message: Tile.Painted) -> None:
+        profiler: Profiler = self.profiler
+        profiler.record(DISPATCH, profiler.clock() - message.posted_ns)
         self._play(message.x, message.y)
 
-    def _play(self, x: int, y: int) -> None:
-        self.game_state.update_state(x, y)
+    def on_tile_painted_region(self, message: Tile.PaintedRegion) -> None:
+        self._paint_region(message.region, message.value)
+
+    def action_fill_row(self) -> None:
+        position: Optional[Tuple[int]] = self._cursor_position()
+        if position is not None:
+            self._fill(Region(0, position[1], self.game_state.state.width, 1))
+
+    def action_fill_column(self) -> None:
+        position: Optional[Tuple[int]] = self._cursor_position()
+        if position is not None:
+            self._fill(Region(position[0], 0, 1, self.game_state.state.height))
+
+    def _cursor_position(self) -> Optional[Tuple[int]]:
+        grid: Union[GameGrid, VirtualGameGrid] = self._grid
+        if grid.disabled:
+            return None
+        if isinstance(grid, VirtualGameGrid):
+            return grid.cursor_x, grid.cursor_y
+        if isinstance(self.focused, Tile):
+            return self.focused.x, self.focused.y
 
-        if self.game_state.solved:
-            self.query_one(GameGrid).disabled = True
-            self.query_one(WinnerMessage).show()
+        return None
+
+    def _fill(self, region: Region) -> None:
+        # A line that is already full is cleared instead
+        filled: int = self.game_state.state.filled_in(*region)
+        self._paint_region(region, 0 if filled == region.area else 1)
+
+    def _paint_region(self, region: Region, value: int) -> None:
+        if self.recorder is not None:
+            self.recorder.region(region.x, region.y, region.width, region.height, value)
+        self._apply_moves(
+            self.game_state.paint_region(region.x, region.y, region.width, region.height, value)
+        )
+
+    def action_hint(self) -> None:
+        grid: Union[GameGrid, VirtualGameGrid] = self._grid
+        if grid.disabled:
+            return
+
+        hint: Optional[Hint] = self.game_state.hint()
+        if hint is None:
+            self.notify("No hint available", severity="warning")
+            return
+
+        if isinstance(grid, VirtualGameGrid):
+            grid.move_cursor_to(hint.x, hint.y)
+            self.set_focus(grid)
+        else:
+            self.set_focus(grid.tile(hint.x, hint.y))
+        self.notify(f"{'Paint' if hint.value else 'Clear'} the tile at column {hint.x + 1}, row {hint.y + 1}")
+
+    def action_undo(self) -> None:
+        if not self._grid.disabled:
+            if self.recorder is not None:
+                self.recorder.undo()
+            self._apply_moves(self.game_state.undo())
+
+    def action_redo(self) -> None:
+        if not self._grid.disabled:
+            if self.recorder is not None:
+                self.recorder.redo()
+            self._apply_moves(self.game_state.redo())
+
+    def _apply_moves(self, moves: Sequence[Move]) -> None:
+        if not moves:
+            return
+
+        self._grid.sync_cells(moves, self.game_state.state)
+        self._board.update_guides(self.game_state.line_changes())
+        self._check_winner()
+
+    def _play(self, x: int, y: int) -> None:
+        with self.profiler.stage(PLAY):
+            if self.recorder is not None:
+                self.recorder.toggle(x, y)
+            self.game_state.update_state(x, y)
+            self._board.update_guides(self.game_state.line_changes())
+            self._check_winner()
+
+    def _check_winner(self) -> None:
+        with self.profiler.stage(SOLVED):
+            if self.game_state.solved:
+                self._grid.disabled = True
+                self._winner_message.show()
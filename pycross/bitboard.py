@@ -0,0 +1,179 @@
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
+
+
+def mask_clue(mask: int) -> Tuple[int]:
+    clue: List[int] = []
+    while mask:
+        mask >>= (mask & -mask).bit_length() - 1
+        run: int = (mask ^ (mask + 1)).bit_length() - 1
+        clue.append(run)
+        mask >>= run
+
+    return tuple(clue)
+
+
+def pack_line(line: Sequence[int]) -> int:
+    mask: int = 0
+    for x, cell in enumerate(line):
+        if cell:
+            mask |= 1 << x
+
+    return mask
+
+
+class BoardRow:
+    __slots__ = ("_board", "_y")
+
+    def __init__(self, board: "BitBoard", y: int):
+        self._board = board
+        self._y = y
+
+    def __getitem__(self, x: int) -> int:
+        return self._board.get(x, self._y)
+
+    def __setitem__(self, x: int, value: int) -> None:
+        self._board.set(x, self._y, value)
+
+    def __len__(self) -> int:
+        return self._board.width
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._board.row_cells(self._y))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, BoardRow):
+            return other._board.width == self._board.width and int(other) == int(self)
+        if isinstance(other, Sequence):
+            return self._board.row_cells(self._y) == list(other)
+        return NotImplemented
+
+    def __int__(self) -> int:
+        return self._board.rows[self._y]
+
+    def __repr__(self) -> str:
+        return repr(self._board.row_cells(self._y))
+
+
+class BitBoard:
+    __slots__ = ("width", "height", "rows")
+
+    def __init__(self, width: int, height: int, rows: Optional[Sequence[int]] = None):
+        self.width: int = width
+        self.height: int = height
+        # Bit x of rows[y] holds the cell at column x of row y
+        self.rows: List[int] = list(rows) if rows is not None else [0] * height
+
+    @classmethod
+    def from_matrix(cls, matrix: Sequence[Sequence[int]]) -> "BitBoard":
+        width: int = len(matrix[0]) if matrix else 0
+        return cls(width, len(matrix), [pack_line(row) for row in matrix])
+
+    def to_matrix(self) -> List[List[int]]:
+        return [self.row_cells(y) for y in range(self.height)]
+
+    def _index(self, x: int, y: int) -> Tuple[int]:
+        # Same indexing rules as nested lists, negative positions included
+        if x < 0:
+            x += self.width
+        if y < 0:
+            y += self.height
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise IndexError("board index out of range")
+
+        return x, y
+
+    def get(self, x: int, y: int) -> int:
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            x, y = self._index(x, y)
+
+        return (self.rows[y] >> x) & 1
+
+    def set(self, x: int, y: int, value: int) -> int:
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            x, y = self._index(x, y)
+
+        mask: int = self.rows[y]
+        if value:
+            self.rows[y] = mask | (1 << x)
+        else:
+            self.rows[y] = mask & ~(1 << x)
+
+        return (mask >> x) & 1
+
+    def toggle(self, x: int, y: int) -> int:
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            x, y = self._index(x, y)
+
+        mask: int = self.rows[y] ^ (1 << x)
+        self.rows[y] = mask
+
+        return (mask >> x) & 1
+
+    def clear(self) -> None:
+        self.rows = [0] * self.height
+
+    def row_cells(self, y: int) -> List[int]:
+        mask: int = self.rows[y]
+        return [(mask >> x) & 1 for x in range(self.width)]
+
+    def row_clue(self, y: int) -> Tuple[int]:
+        return mask_clue(self.rows[y])
+
+    def transpose(self) -> "BitBoard":
+        columns: List[int] = [0] * self.width
+        for y, mask in enumerate(self.rows):
+            while mask:
+                low: int = mask & -mask
+                columns[low.bit_length() - 1] |= 1 << y
+                mask ^= low
+
+        return BitBoard(self.height, self.width, columns)
+
+    def column_clue(self, x: int) -> Tuple[int]:
+        return mask_clue(pack_line([(mask >> x) & 1 for mask in self.rows]))
+
+    def mismatches(self, other: "BitBoard") -> int:
+        return sum((row ^ other_row).bit_count() for row, other_row in zip(self.rows, other.rows, strict=True))
+
+    def filled(self) -> int:
+        return sum(row.bit_count() for row in self.rows)
+
+    def filled_cells(self) -> Iterator[Tuple[int]]:
+        """Coordinates of the filled cells, row by row. Empty cells cost nothing, so a
+        sparse board is walked in time proportional to what is filled."""
+        for y, mask in enumerate(self.rows):
+            while mask:
+                low: int = mask & -mask
+                yield low.bit_length() - 1, y
+                mask ^= low
+
+    def filled_in(self, x: int, y: int, width: int, height: int) -> int:
+        mask: int = (1 << width) - 1
+        return sum(((row >> x) & mask).bit_count() for row in self.rows[y:y + height])
+
+    def __getitem__(self, y: int) -> BoardRow:
+        if y < 0:
+            y += self.height
+        if not 0 <= y < self.height:
+            raise IndexError("board index out of range")
+
+        return BoardRow(self, y)
+
+    def __iter__(self) -> Iterator[BoardRow]:
+        return (BoardRow(self, y) for y in range(self.height))
+
+    def __len__(self) -> int:
+        return self.height
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, BitBoard):
+            return (self.width, self.height, self.rows) == (other.width, other.height, other.rows)
+        if isinstance(other, Sequence):
+            return self.to_matrix() == [list(row) for row in other]
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"BitBoard({self.width}, {self.height}, {self.rows!r})"
+
+
+BoardLike = Union[BitBoard, Sequence[Sequence[int]]]
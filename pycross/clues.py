@@ -0,0 +1,176 @@
+import sys
+from enum import Enum
+from typing import Any, Final, Iterable, List, NamedTuple, Sequence, Set, Tuple
+
+from pycross.bitboard import BitBoard, mask_clue, pack_line
+from pycross.solver import FILLED, UNKNOWN, normalize_clue, solve_line
+
+ROW: Final[str] = "row"
+COLUMN: Final[str] = "column"
+
+
+class LineStatus(Enum):
+    PENDING = "pending"
+    COMPLETE = "complete"
+    ERROR = "error"
+
+
+class LineChange(NamedTuple):
+    axis: str
+    index: int
+    status: LineStatus
+
+
+Guides = Tuple[Tuple[int]]
+
+
+def _numpy_line_clues(matrix: Any) -> Guides:
+    import numpy as np
+
+    # Runs start where a row steps 0 -> 1 and end where it steps 1 -> 0
+    padded = np.pad(np.asarray(matrix, dtype=np.int8) != 0, ((0, 0), (1, 1))).astype(np.int8)
+    steps = np.diff(padded, axis=1)
+    start_rows, start_columns = np.nonzero(steps == 1)
+    _, end_columns = np.nonzero(steps == -1)
+
+    lengths: List[int] = (end_columns - start_columns).tolist()
+    splits = np.cumsum(np.bincount(start_rows, minlength=padded.shape[0]))
+
+    clues: List[Tuple[int]] = []
+    start: int = 0
+    for end in splits.tolist():
+        clues.append(tuple(lengths[start:end]))
+        start = end
+
+    return tuple(clues)
+
+
+def generate_clues(solution: Any) -> Tuple[Guides, Guides]:
+    """Return the (top_guides, left_guides) run-length clues of a solution matrix.
+
+    NumPy arrays are processed in bulk when NumPy is installed; any other
+    matrix goes through the bit-packed board.
+    """
+    # An array can only come from a process that has imported NumPy already, so others never load it
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(solution, numpy.ndarray):
+        if solution.ndim != 2:
+            raise ValueError("Solution must be a two-dimensional matrix")
+        return _numpy_line_clues(solution.T), _numpy_line_clues(solution)
+
+    width: int = len(solution[0]) if len(solution) else 0
+    for row in solution:
+        if len(row) != width:
+            raise ValueError("Unmatching number of columns between Solution rows")
+
+    board = BitBoard(width, len(solution), [pack_line(row) for row in solution])
+    columns: BitBoard = board.transpose()
+
+    return tuple(map(mask_clue, columns.rows)), tuple(map(mask_clue, board.rows))
+
+
+def line_status(mask: int, length: int, clue: Tuple[int]) -> LineStatus:
+    if mask_clue(mask) == clue:
+        return LineStatus.COMPLETE
+
+    if mask.bit_count() > sum(clue):
+        return LineStatus.ERROR
+
+    # Painted cells that no placement of the clue can cover are a mistake
+    cells: List[int] = [FILLED if (mask >> i) & 1 else UNKNOWN for i in range(length)]
+    if solve_line(cells, clue) is None:
+        return LineStatus.ERROR
+
+    return LineStatus.PENDING
+
+
+def _column_mask(board: BitBoard, x: int) -> int:
+    mask: int = 0
+    for y, row in enumerate(board.rows):
+        mask |= ((row >> x) & 1) << y
+
+    return mask
+
+
+class ClueTracker:
+    def __init__(self, top_guides: Sequence[Sequence[int]], left_guides: Sequence[Sequence[int]]):
+        self.columns_clues: List[Tuple[int]] = [normalize_clue(clue) for clue in top_guides]
+        self.rows_clues: List[Tuple[int]] = [normalize_clue(clue) for clue in left_guides]
+
+        self.rows_status: List[LineStatus] = [LineStatus.PENDING] * len(self.rows_clues)
+        self.columns_status: List[LineStatus] = [LineStatus.PENDING] * len(self.columns_clues)
+
+    def update_lines(self, board: BitBoard, rows: Iterable[int], columns: Iterable[int]) -> List[LineChange]:
+        changes: List[LineChange] = []
+        for y in rows:
+            changes.extend(self._update_row(board, y))
+        for x in columns:
+            changes.extend(self._update_column(board, x))
+
+        return changes
+
+    def _update_row(self, board: BitBoard, y: int) -> List[LineChange]:
+        status: LineStatus = line_status(board.rows[y], board.width, self.rows_clues[y])
+        if status is self.rows_status[y]:
+            return []
+
+        self.rows_status[y] = status
+        return [LineChange(ROW, y, status)]
+
+    def _update_column(self, board: BitBoard, x: int) -> List[LineChange]:
+        status: LineStatus = line_status(_column_mask(board, x), board.height, self.columns_clues[x])
+        if status is self.columns_status[x]:
+            return []
+
+        self.columns_status[x] = status
+        return [LineChange(COLUMN, x, status)]
+
+
+class RunLengths:
+    """Run-length encoding of every row and column of a board, set against its clue.
+
+    Only the lines holding a changed cell are encoded again, so keeping track of
+    whether the board spells out every clue costs O(width + height) per move.
+    """
+
+    def __init__(self, top_guides: Sequence[Sequence[int]], left_guides: Sequence[Sequence[int]]):
+        self.columns_clues: List[Tuple[int]] = [normalize_clue(clue) for clue in top_guides]
+        self.rows_clues: List[Tuple[int]] = [normalize_clue(clue) for clue in left_guides]
+
+        self.reset(BitBoard(len(self.columns_clues), len(self.rows_clues)))
+
+    @property
+    def matches(self) -> bool:
+        return self.unmatched == 0
+
+    def reset(self, board: BitBoard) -> None:
+        self._columns: List[int] = board.transpose().rows
+        self.rows_runs: List[Tuple[int]] = [mask_clue(row) for row in board.rows]
+        self.columns_runs: List[Tuple[int]] = [mask_clue(column) for column in self._columns]
+        self.unmatched: int = sum(
+            runs != clue for runs, clue in zip(
+                (*self.rows_runs, *self.columns_runs), (*self.rows_clues, *self.columns_clues), strict=True
+            )
+        )
+
+    def update(self, board: BitBoard, cells: Iterable[Tuple[int]]) -> None:
+        rows: Set[int] = set()
+        columns: Set[int] = set()
+        for x, y, *_ in cells:
+            # Columns are kept as masks of their own, so a changed cell only flips one bit
+            if (board.rows[y] >> x) & 1:
+                self._columns[x] |= 1 << y
+            else:
+                self._columns[x] &= ~(1 << y)
+            rows.add(y)
+            columns.add(x)
+
+        for y in rows:
+            self._encode(self.rows_runs, self.rows_clues, y, board.rows[y])
+        for x in columns:
+            self._encode(self.columns_runs, self.columns_clues, x, self._columns[x])
+
+    def _encode(self, runs: List[Tuple[int]], clues: List[Tuple[int]], index: int, mask: int) -> None:
+        matched: bool = runs[index] == clues[index]
+        runs[index] = mask_clue(mask)
+        self.unmatched += matched - (runs[index] == clues[index])
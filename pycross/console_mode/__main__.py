@@ -1,7 +1,22 @@
+import os
+from argparse import ArgumentParser
+
+from pycross.engine import CLUES_WIN, WIN_MODES
+from pycross.library import load_puzzle
+
 from .game import Grid
 
 
 if __name__ == "__main__":
+    parser = ArgumentParser(prog="pycross.console_mode")
+    parser.add_argument("pack", nargs="?", help="puzzle pack: a .json or .non file, or a directory of them")
+    parser.add_argument("-p", "--puzzle", type=int, default=0, help="index of the puzzle within the pack")
+    parser.add_argument("--session", help="file the game is saved to with 's' and resumed from on start")
+    parser.add_argument("--win-mode", choices=WIN_MODES, help="win by matching the solution, or any board that fits the clues")
+    parser.add_argument("--full-redraw", action="store_true", help="clear and redraw the whole screen after every move")
+    parser.add_argument("--record", help="file every move of the game is logged to, for benchmarks.replay")
+    args = parser.parse_args()
+
     rows = [
         [3],
         [1],
@@ -26,5 +41,17 @@ if __name__ == "__main__":
         [0, 1, 0, 1, 0],
     ]
 
-    game = Grid(rows, columns, solution)
-    game.start_game()
+    if args.pack is not None:
+        # Console guides are listed from the grid outwards
+        puzzle = load_puzzle(args.pack, args.puzzle, solve_missing=args.win_mode != CLUES_WIN)
+        rows = [guide[::-1] for guide in puzzle.left_guides]
+        columns = [guide[::-1] for guide in puzzle.top_guides]
+        solution = puzzle.solution
+
+    game = Grid(rows, columns, solution, args.win_mode, args.record)
+    if args.session is not None and os.path.exists(args.session):
+        game.restore_session(args.session)
+    try:
+        game.start_game(incremental=not args.full_redraw, session_path=args.session)
+    finally:
+        game.close()
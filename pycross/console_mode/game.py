@@ -1,11 +1,30 @@
 import os
+import sys
+from typing import Final
+
+from pycross.bitboard import BitBoard, BoardLike
+from pycross.clues import generate_clues
+from pycross.engine import GameState
+from pycross.history import Move
+from pycross.paths import PathLike
+from pycross.recording import MoveRecorder
+
+CLEAR_SCREEN: Final[str] = "\x1b[2J\x1b[H"
+CLEAR_LINE: Final[str] = "\x1b[K"
+MOVE_CURSOR: Final[str] = "\x1b[%d;1H"
+INPUT_PROMPT: Final[str] = "Enter coordinates to paint <x,y> (Prefix 'd/' to delete pixel, 'u' to undo, 'r' to redo, 's' to save): "
+UNDO_COMMAND: Final[str] = "u"
+REDO_COMMAND: Final[str] = "r"
+SAVE_COMMAND: Final[str] = "s"
 
 class Grid:
     def __init__(
         self,
         rows_guides: list[int],
         columns_guides: list[int],
-        solution_matrix: list[list[int]] = None,
+        solution_matrix: list[list[int]] | None = None,
+        win_mode: str | None = None,
+        record_path: PathLike | None = None,
     ):
         self._max_row_len: int = len(max(rows_guides, key=len))
         self._max_col_len: int = len(max(columns_guides, key=len))
@@ -13,30 +32,54 @@ class Grid:
         self._rows_guides: list[int] = rows_guides
         self._columns_guides: list[int] = columns_guides
 
-        total_rows: int = len(rows_guides)
-        total_cols: int = len(columns_guides)
-        self._board_matrix: list[list[int]] = [
-            [0] * total_cols for _ in range(total_rows)
-        ]
-
-        self._solution_matrix: list[list[int]] = self._check_solution_matrix(
-            solution_matrix, total_rows, total_cols
+        self._solution_matrix: list[list[int]] | None = solution_matrix
+        # Console guides are listed from the grid outwards, the engine reads them inwards
+        self._game: GameState = GameState(
+            solution_matrix,
+            [guide[::-1] for guide in columns_guides],
+            [guide[::-1] for guide in rows_guides],
+            win_mode=win_mode,
         )
 
+        self._record_path: PathLike | None = record_path
+        self._recorder: MoveRecorder | None = None
+        self._start_recording()
+
         self._top_board, self._left_board = self._draw_frame()
-        self._screen_board: str = self._draw_board()
+        self._reset_screen()
+
+    @classmethod
+    def from_solution(cls, solution_matrix: list[list[int]]) -> "Grid":
+        columns_guides, rows_guides = generate_clues(solution_matrix)
+
+        # Console guides are listed from the grid outwards
+        return cls(
+            [list(guide[::-1]) for guide in rows_guides],
+            [list(guide[::-1]) for guide in columns_guides],
+            [[int(cell) for cell in row] for row in solution_matrix],
+        )
+
+    @property
+    def _board_matrix(self) -> BitBoard:
+        return self._game.state
+
+    @_board_matrix.setter
+    def _board_matrix(self, board_matrix: BoardLike) -> None:
+        self._game.state = board_matrix
+        self._reset_screen()
 
-    def _check_solution_matrix(
-        self, solution_matrix: list[list[int]], total_rows: int, total_columns: int
-    ) -> list[list[int]]:
-        if len(solution_matrix) != total_rows:
-            raise ValueError("Unmatching number of rows")
+    def _reset_screen(self) -> None:
+        height: int = self._game.height
+        self._row_lines: list[str] = [self._draw_row(i) for i in range(height)]
+        self._changed_rows: set[int] = set(range(height))
+        self._screen_cache: str | None = None
 
-        for row in solution_matrix:
-            if len(row) != total_columns:
-                raise ValueError("Unmatching number of columns")
+    @property
+    def _screen_board(self) -> str:
+        if self._screen_cache is None:
+            self._screen_cache = self._draw_board()
 
-        return solution_matrix
+        return self._screen_cache
 
     def _draw_frame(self) -> tuple[str, list[int]]:
         top_offset: str = "   " * self._max_row_len
@@ -63,21 +106,81 @@ class Grid:
 
         return top_board, left_board
 
+    def _draw_row(self, row: int) -> str:
+        cells = "][".join("\u25a0" if _ else " " for _ in self._board_matrix.row_cells(row))
+        return f"{self._left_board[row]}[{cells}]"
+
     def _draw_board(self):
-        bottom_board: str = ""
-        for i, guides_row in enumerate(self._left_board):
-            cells = "][".join("\u25a0" if _ else " " for _ in self._board_matrix[i])
-            bottom_board += f"{guides_row}[{cells}]\n"
+        bottom_board: str = "".join(f"{row_line}\n" for row_line in self._row_lines)
 
         return f"{self._top_board}\n{bottom_board}"
 
+    def _draw_changed_rows(self) -> str:
+        # Rows are redrawn in place: the top frame takes the first lines of the screen
+        updates: str = "".join(
+            f"{MOVE_CURSOR % (self._max_col_len + 1 + row)}{self._row_lines[row]}{CLEAR_LINE}"
+            for row in sorted(self._changed_rows)
+        )
+        self._changed_rows.clear()
+
+        return updates
+
     def check_solved(self) -> bool:
-        for i in range(len(self._board_matrix)):
-            for j in range(len(self._board_matrix[i])):
-                if self._board_matrix[i][j] != self._solution_matrix[i][j]:
-                    return False
+        return self._game.solved
+
+    def undo(self) -> bool:
+        if self._recorder is not None:
+            self._recorder.undo()
+        return self._redraw_moves(self._game.undo())
+
+    def redo(self) -> bool:
+        if self._recorder is not None:
+            self._recorder.redo()
+        return self._redraw_moves(self._game.redo())
+
+    def close(self) -> None:
+        """Write out the moves recorded so far."""
+        if self._recorder is not None:
+            self._recorder.close()
 
-        return True
+    def _redraw_moves(self, moves: list[Move]) -> bool:
+        for row in {move.y for move in moves}:
+            self._redraw_row(row)
+
+        return bool(moves)
+
+    def save_session(self, path: PathLike) -> None:
+        self._game.save(path)
+
+    def restore_session(self, path: PathLike) -> None:
+        self._game.restore(path)
+        self._reset_screen()
+        # The log starts again from the restored board
+        self._start_recording()
+
+    def _start_recording(self) -> None:
+        if self._record_path is None:
+            return
+        if self._recorder is not None:
+            self._recorder.close()
+        self._recorder = MoveRecorder(self._record_path, self._game)
+
+    def handle_input(self, input: str, session_path: PathLike | None = None) -> None:
+        command: str = input.strip().lower()
+        if command == SAVE_COMMAND:
+            if session_path is None:
+                print("Start the game with --session to save it")
+            else:
+                self.save_session(session_path)
+                print("Game saved")
+        elif command == UNDO_COMMAND:
+            if not self.undo():
+                print("Nothing to undo")
+        elif command == REDO_COMMAND:
+            if not self.redo():
+                print("Nothing to redo")
+        else:
+            self.draw_pixel(input)
 
     def draw_pixel(self, input: str) -> None:
         delete_pixel: bool = True if input.startswith("d/") else False
@@ -89,22 +192,55 @@ class Grid:
 
         try:
             x, y = int(coordinates[0]) - 1, int(coordinates[1]) - 1
-            self._board_matrix[x][y] = 0 if delete_pixel else 1
-            self._screen_board = self._draw_board()
+            self._set_pixel(x, y, 0 if delete_pixel else 1)
         except ValueError:
             print("Enter numeric (int) values for the coordinates")
         except IndexError:
             print("Enter coordinates within the grid")
 
-    def start_game(self) -> None: # pragma: no cover
+    def _set_pixel(self, row: int, column: int, value: int) -> None:
+        previous: int = self._game.set_cell(column, row, value)
+        if self._recorder is not None:
+            # Logged in engine coordinates, once the board has accepted the position
+            self._recorder.set(column % self._game.width, row % self._game.height, value)
+        if previous != value:
+            self._redraw_row(row % self._game.height)
+
+    def _redraw_row(self, row: int) -> None:
+        self._row_lines[row] = self._draw_row(row)
+        self._changed_rows.add(row)
+        self._screen_cache = None
+
+    def start_game(self, incremental: bool = True, session_path: PathLike | None = None) -> None: # pragma: no cover
+        if not incremental:
+            self._start_game_full_redraw(session_path)
+            return
+
+        prompt_line: int = self._max_col_len + len(self._row_lines) + 1
+        sys.stdout.write(f"{CLEAR_SCREEN}{self}")
+        self._changed_rows.clear()
+
+        win = None
+        while not win:
+            sys.stdout.write(f"{MOVE_CURSOR % prompt_line}{CLEAR_LINE}")
+            coordinates = input(INPUT_PROMPT)
+            # The cursor now sits on the line below the prompt, where errors are printed
+            sys.stdout.write(CLEAR_LINE)
+            self.handle_input(coordinates, session_path)
+            sys.stdout.write(self._draw_changed_rows())
+            sys.stdout.flush()
+            win = self.check_solved()
+
+        sys.stdout.write(f"{MOVE_CURSOR % prompt_line}{CLEAR_LINE}You won!!!\n{CLEAR_LINE}")
+        sys.stdout.flush()
+
+    def _start_game_full_redraw(self, session_path: PathLike | None = None) -> None: # pragma: no cover
         win = None
         while not win:
             print(self)
-            coordinates = input(
-                "Enter coordinates to paint <x,y> (Prefix 'd/' to delete pixel): "
-            )
+            coordinates = input(INPUT_PROMPT)
             os.system("cls" if os.name == "nt" else "clear")
-            self.draw_pixel(coordinates)
+            self.handle_input(coordinates, session_path)
             win = self.check_solved()
 
         os.system("cls" if os.name == "nt" else "clear")
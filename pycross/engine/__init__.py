@@ -0,0 +1,3 @@
+from pycross.engine.state import CLUES_WIN, SOLUTION_WIN, WIN_MODES, GameState, check_game_parameters
+
+__all__ = ["CLUES_WIN", "SOLUTION_WIN", "WIN_MODES", "GameState", "check_game_parameters"]
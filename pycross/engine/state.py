@@ -0,0 +1,233 @@
+from typing import Final, List, Optional, Sequence, Set, Tuple
+
+from pycross.bitboard import BitBoard, BoardLike
+from pycross.clues import ClueTracker, LineChange, RunLengths, generate_clues
+from pycross.hints import Hint, HintEngine
+from pycross.history import DEFAULT_HISTORY_LIMIT, Move, MoveHistory
+from pycross.paths import PathLike
+from pycross.session import guides_checksum, load_session, save_session
+
+SOLUTION_WIN: Final[str] = "solution"
+CLUES_WIN: Final[str] = "clues"
+WIN_MODES: Final[Tuple[str]] = (SOLUTION_WIN, CLUES_WIN)
+
+
+def check_game_parameters(
+    top_guides: Sequence[Sequence[int]], left_guides: Sequence[Sequence[int]], solution: Sequence[Sequence[int]]
+) -> None:
+    if len(solution) != len(left_guides):
+        raise ValueError("Unmatching number of rows between Solution and Left Guide")
+
+    top_guides_len: int = len(top_guides)
+    for row in solution:
+        if len(row) != top_guides_len:
+            raise ValueError("Unmatching number of columns between Solution and Top Guide")
+
+
+class GameState():
+    """A game in progress, free of any front end.
+
+    Holds the painted board, the undo history, the status of every guide and
+    whether the puzzle is solved. Guide statuses are only worked out for the
+    lines touched since the last call to `line_changes`.
+
+    With the `solution` win mode the board must match the stored solution cell
+    by cell. With `clues` any board whose rows and columns spell out the guides
+    wins, and no solution is needed.
+    """
+
+    def __init__(
+        self,
+        solution: Optional[Tuple[Tuple[int]]],
+        top_guides: Optional[Tuple[Tuple[int]]] = None,
+        left_guides: Optional[Tuple[Tuple[int]]] = None,
+        history_limit: int = DEFAULT_HISTORY_LIMIT,
+        win_mode: Optional[str] = None,
+    ):
+        win_mode = win_mode or (SOLUTION_WIN if solution is not None else CLUES_WIN)
+        if win_mode not in WIN_MODES:
+            raise ValueError(f"Unknown win mode: {win_mode}")
+        if solution is None and win_mode == SOLUTION_WIN:
+            raise ValueError("A solution is needed to win by matching it")
+
+        if top_guides is None or left_guides is None:
+            if solution is None:
+                raise ValueError("Guides are needed when there is no solution")
+            top_guides, left_guides = generate_clues(solution)
+        if solution is not None:
+            check_game_parameters(top_guides, left_guides, solution)
+
+        self.solution = solution
+        self.top_guides = top_guides
+        self.left_guides = left_guides
+        self.win_mode: str = win_mode
+        self._solution_board: Optional[BitBoard] = BitBoard.from_matrix(solution) if solution is not None else None
+        self._runs: Optional[RunLengths] = RunLengths(top_guides, left_guides) if win_mode == CLUES_WIN else None
+
+        self.clues: ClueTracker = ClueTracker(top_guides, left_guides)
+        self._dirty_rows: Set[int] = set()
+        self._dirty_columns: Set[int] = set()
+        self._hints: Optional[HintEngine] = None
+
+        self.state: BitBoard = BitBoard(len(top_guides), len(left_guides))
+        self.history: MoveHistory = MoveHistory(history_limit)
+
+    @property
+    def state(self) -> BitBoard:
+        return self._state
+
+    @state.setter
+    def state(self, state: BoardLike) -> None:
+        self._state = state if isinstance(state, BitBoard) else BitBoard.from_matrix(state)
+        if self._runs is not None:
+            self._runs.reset(self._state)
+        else:
+            self._mismatches: int = self._state.mismatches(self._solution_board)
+        self._dirty_rows = set(range(self._state.height))
+        self._dirty_columns = set(range(self._state.width))
+        self._check_solved()
+
+    @property
+    def width(self) -> int:
+        return self._state.width
+
+    @property
+    def height(self) -> int:
+        return self._state.height
+
+    def reset(self) -> List[Tuple[int]]:
+        """Clear the board and the history, returning the cells that were painted.
+
+        Only the lines of those cells await `line_changes`, so clearing a board
+        with a few painted cells does not work out every guide again.
+        """
+        cells: List[Tuple[int]] = list(self._state.filled_cells())
+        self._state.clear()
+        self._changed(cells)
+        self.history.clear()
+
+        return cells
+
+    def update_state(self, x: int, y: int) -> int:
+        value: int = self._state.toggle(x, y)
+        # Same wrap-around as set_cell, so a negative index is recorded as the cell it toggled
+        x %= self._state.width
+        y %= self._state.height
+        self.history.record(x, y, 1 - value)
+        self._changed_cell(x, y)
+
+        return value
+
+    def set_cell(self, x: int, y: int, value: int) -> int:
+        value = 1 if value else 0
+        previous: int = self._state.set(x, y, value)
+        if previous != value:
+            # Same wrap-around as list indexing, once the board has validated the position
+            x %= self._state.width
+            y %= self._state.height
+            self.history.record(x, y, previous)
+            self._changed_cell(x, y)
+
+        return previous
+
+    def paint_region(self, x: int, y: int, width: int, height: int, value: int) -> List[Move]:
+        """Set every cell of the region to `value`, returning the cells that changed."""
+        if not (0 <= x and 0 <= y and 0 < width and 0 < height and
+                x + width <= self._state.width and y + height <= self._state.height):
+            raise IndexError("region out of the board")
+
+        rows: List[int] = self._state.rows
+        mask: int = ((1 << width) - 1) << x
+        previous: int = 1 - value
+
+        moves: List[Move] = []
+        for row_y in range(y, y + height):
+            old: int = rows[row_y]
+            new: int = old | mask if value else old & ~mask
+            changed: int = old ^ new
+            rows[row_y] = new
+            while changed:
+                low: int = changed & -changed
+                moves.append(Move(low.bit_length() - 1, row_y, previous))
+                changed ^= low
+
+        self.history.record_stroke(moves)
+        self._changed(moves)
+
+        return moves
+
+    def undo(self) -> List[Move]:
+        moves: List[Move] = self.history.undo_stroke()
+        for move in moves:
+            self._state.toggle(move.x, move.y)
+        self._changed(moves)
+
+        return moves
+
+    def redo(self) -> List[Move]:
+        moves: List[Move] = self.history.redo_stroke()
+        for move in moves:
+            self._state.toggle(move.x, move.y)
+        self._changed(moves)
+
+        return moves
+
+    def line_changes(self) -> List[LineChange]:
+        """Guide statuses that changed since the last call, for the touched lines only."""
+        changes: List[LineChange] = self.clues.update_lines(
+            self._state, sorted(self._dirty_rows), sorted(self._dirty_columns)
+        )
+        self._dirty_rows.clear()
+        self._dirty_columns.clear()
+
+        return changes
+
+    def hint(self) -> Optional[Hint]:
+        # Deduced from the guides and the painted tiles, never from the solution
+        if self._hints is None:
+            self._hints = HintEngine(self.top_guides, self.left_guides)
+
+        return self._hints.hint(self._state)
+
+    def save(self, path: PathLike) -> None:
+        save_session(path, self._state, self.history, self.checksum())
+
+    def restore(self, path: PathLike) -> None:
+        board, history, checksum = load_session(path)
+        if checksum != self.checksum() or (board.width, board.height) != (self.width, self.height):
+            raise ValueError(f"{path}: Session belongs to a different puzzle")
+
+        self.state = board
+        self.history = history
+
+    def checksum(self) -> int:
+        """Identifies the puzzle in saved sessions and move logs, by its guides in either win mode."""
+        return guides_checksum(self.top_guides, self.left_guides)
+
+    def _changed_cell(self, x: int, y: int) -> None:
+        # The single cell case of _changed, on the path of every click
+        self._dirty_rows.add(y)
+        self._dirty_columns.add(x)
+        if self._runs is None:
+            self._mismatches += 1 if (self._state.rows[y] ^ self._solution_board.rows[y]) >> x & 1 else -1
+            self.solved = self._mismatches == 0
+        else:
+            self._runs.update(self._state, ((x, y),))
+            self.solved = self._runs.matches
+
+    def _changed(self, cells: Sequence[Tuple[int]]) -> None:
+        """Bring the win check and the lines awaiting `line_changes` up to date with cells just flipped."""
+        rows: List[int] = self._state.rows
+        solution_rows: Optional[List[int]] = self._solution_board.rows if self._runs is None else None
+        for x, y, *_ in cells:
+            self._dirty_rows.add(y)
+            self._dirty_columns.add(x)
+            if solution_rows is not None:
+                self._mismatches += 1 if (rows[y] ^ solution_rows[y]) >> x & 1 else -1
+
+        if self._runs is not None:
+            self._runs.update(self._state, cells)
+        self._check_solved()
+
+    def _check_solved(self) -> None:
+        self.solved: bool = self._runs.matches if self._runs is not None else self._mismatches == 0
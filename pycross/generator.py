@@ -0,0 +1,131 @@
+import random
+from argparse import ArgumentParser
+from typing import Final, Iterator, List, Optional, Tuple
+
+from pycross.clues import generate_clues
+from pycross.library import Puzzle, puzzle_to_json
+from pycross.solver import SolveStatus, solve
+from pycross.workers import run_in_processes
+
+NO_SYMMETRY: Final[str] = "none"
+HORIZONTAL: Final[str] = "horizontal"
+VERTICAL: Final[str] = "vertical"
+BOTH: Final[str] = "both"
+ROTATIONAL: Final[str] = "rotational"
+SYMMETRIES: Final[Tuple[str]] = (NO_SYMMETRY, HORIZONTAL, VERTICAL, BOTH, ROTATIONAL)
+
+DEFAULT_DENSITY: Final[float] = 0.6
+DEFAULT_ATTEMPTS: Final[int] = 50
+
+
+def random_solution(
+    width: int, height: int, density: float = DEFAULT_DENSITY, symmetry: str = NO_SYMMETRY, rng: Optional[random.Random] = None
+) -> List[List[int]]:
+    if symmetry not in SYMMETRIES:
+        raise ValueError(f"Unknown symmetry: {symmetry}")
+
+    rng = rng or random.Random()
+    grid: List[List[int]] = [[int(rng.random() < density) for _ in range(width)] for _ in range(height)]
+
+    if symmetry in (HORIZONTAL, BOTH):
+        for row in grid:
+            for x in range(width // 2):
+                row[width - 1 - x] = row[x]
+
+    if symmetry in (VERTICAL, BOTH):
+        for y in range(height // 2):
+            grid[height - 1 - y] = grid[y][:]
+
+    if symmetry == ROTATIONAL:
+        for y in range(height):
+            for x in range(width):
+                if (y, x) < (height - 1 - y, width - 1 - x):
+                    grid[height - 1 - y][width - 1 - x] = grid[y][x]
+
+    return grid
+
+
+def generate_puzzle(
+    width: int,
+    height: int,
+    density: float = DEFAULT_DENSITY,
+    symmetry: str = NO_SYMMETRY,
+    seed: Optional[int] = None,
+    attempts: int = DEFAULT_ATTEMPTS,
+) -> Optional[Puzzle]:
+    rng = random.Random(seed)
+    # Unseeded puzzles are told apart by a token from the same OS-seeded generator
+    label: str = str(seed) if seed is not None else f"{rng.getrandbits(32):08x}"
+
+    for _ in range(attempts):
+        solution: List[List[int]] = random_solution(width, height, density, symmetry, rng)
+        top_guides, left_guides = generate_clues(solution)
+
+        result = solve(top_guides, left_guides)
+        if result.status is SolveStatus.UNIQUE:
+            return Puzzle(f"generated-{width}x{height}-{label}", top_guides, left_guides, result.solution)
+
+    return None
+
+
+def generate_puzzles(
+    count: int,
+    min_size: int,
+    max_size: int,
+    density: float = DEFAULT_DENSITY,
+    symmetry: str = NO_SYMMETRY,
+    seed: int = 0,
+    attempts: int = DEFAULT_ATTEMPTS,
+    workers: Optional[int] = None,
+) -> Iterator[Optional[Puzzle]]:
+    """Yield puzzles as soon as a worker finishes them, None for every board that
+    failed to reach a unique solution within `attempts` random grids."""
+    sizes = random.Random(seed)
+    tasks = (
+        (size, size, density, symmetry, seed + i, attempts)
+        for i, size in enumerate(sizes.randint(min_size, max_size) for _ in range(count))
+    )
+
+    return run_in_processes(generate_puzzle, tasks, workers)
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    parser = ArgumentParser(prog="pycross.generator", description="Generate puzzles with a unique solution")
+    parser.add_argument("output", help="JSON Lines pack the puzzles are appended to")
+    parser.add_argument("-n", "--count", type=int, default=10, help="number of puzzles to generate")
+    parser.add_argument("--min-size", type=int, default=15, help="smallest board dimension")
+    parser.add_argument("--max-size", type=int, default=None, help="largest board dimension (defaults to --min-size)")
+    parser.add_argument("--density", type=float, default=DEFAULT_DENSITY, help="share of painted cells")
+    parser.add_argument("--symmetry", choices=SYMMETRIES, default=NO_SYMMETRY)
+    parser.add_argument("--seed", type=int, default=None, help="seed of the run (defaults to a random one, printed)")
+    parser.add_argument("--attempts", type=int, default=DEFAULT_ATTEMPTS, help="random boards tried per puzzle")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="worker processes (defaults to every core)")
+    options = parser.parse_args(args)
+
+    max_size: int = options.max_size or options.min_size
+    seed: int = random.randrange(2**32) if options.seed is None else options.seed
+    print(f"Seed {seed}")
+    generated: int = 0
+    with open(options.output, "a", encoding="utf-8") as output:
+        for puzzle in generate_puzzles(
+            options.count,
+            options.min_size,
+            max_size,
+            options.density,
+            options.symmetry,
+            seed,
+            options.attempts,
+            options.workers,
+        ):
+            if puzzle is None:
+                continue
+
+            output.write(f"{puzzle_to_json(puzzle)}\n")
+            output.flush()
+            generated += 1
+
+    print(f"Generated {generated} of {options.count} puzzles into {options.output}")
+
+
+if __name__ == "__main__":
+    main()
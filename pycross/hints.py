@@ -0,0 +1,130 @@
+from typing import Dict, Final, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from pycross.bitboard import BitBoard
+from pycross.solver import EMPTY, FILLED, UNKNOWN, normalize_clue, solve_line
+
+ROWS: Final[int] = 0
+COLUMNS: Final[int] = 1
+
+# (axis, index, known filled, known empty) -> (filled, empty) after solving the line,
+# (None, None) when the line contradicts its clue
+LineCache = Dict[Tuple[int, int, int, int], Tuple[Optional[int], Optional[int]]]
+Deduction = Tuple[List[int], List[int], List[Tuple[int]]]
+
+
+class Hint(NamedTuple):
+    x: int
+    y: int
+    value: int
+
+
+def _line_cells(filled: int, empty: int, length: int) -> List[int]:
+    return [FILLED if (filled >> i) & 1 else EMPTY if (empty >> i) & 1 else UNKNOWN for i in range(length)]
+
+
+def _line_masks(cells: Sequence[int]) -> Tuple[int]:
+    filled: int = 0
+    empty: int = 0
+    for i, cell in enumerate(cells):
+        if cell == FILLED:
+            filled |= 1 << i
+        elif cell == EMPTY:
+            empty |= 1 << i
+
+    return filled, empty
+
+
+class HintEngine:
+    """Line-by-line deduction over a player's board, driven by the clues only.
+
+    Line results are kept from one hint to the next, so after a move only the
+    lines whose known cells changed are solved again.
+    """
+
+    def __init__(self, top_guides: Sequence[Sequence[int]], left_guides: Sequence[Sequence[int]]):
+        self.clues: Tuple[List[Tuple[int]]] = (
+            [normalize_clue(clue) for clue in left_guides],
+            [normalize_clue(clue) for clue in top_guides],
+        )
+        self.width: int = len(top_guides)
+        self.height: int = len(left_guides)
+        self._cache: LineCache = {}
+        self._previous_cache: LineCache = {}
+        self._clues_only: Optional[Deduction] = None
+
+    def hint(self, board: BitBoard) -> Optional[Hint]:
+        """Return a cell the clues prove must change: an unpainted cell that is filled,
+        or, when the painted cells contradict the clues, a painted cell that is empty."""
+        # Only the lines solved for the latest hint are worth keeping around
+        self._previous_cache, self._cache = self._cache, {}
+
+        deduced: Optional[Deduction] = self._deduce(board.rows)
+        if deduced is not None:
+            rows_filled, _, order = deduced
+            for x, y in order:
+                if (rows_filled[y] >> x) & 1 and not (board.rows[y] >> x) & 1:
+                    return Hint(x, y, FILLED)
+            return None
+
+        # Some painted cell is wrong: look for one the clues alone rule out
+        if self._clues_only is None:
+            self._clues_only = self._deduce([0] * self.height)
+            if self._clues_only is None:
+                return None
+
+        _, rows_empty, _ = self._clues_only
+        for y, mask in enumerate(board.rows):
+            wrong: int = mask & rows_empty[y]
+            if wrong:
+                return Hint((wrong & -wrong).bit_length() - 1, y, EMPTY)
+
+        return None
+
+    def _solve(self, axis: int, index: int, filled: int, empty: int) -> Tuple[Optional[int], Optional[int]]:
+        key: Tuple[int] = (axis, index, filled, empty)
+        result: Optional[Tuple[Optional[int], Optional[int]]] = self._cache.get(key) or self._previous_cache.get(key)
+        if result is None:
+            length: int = self.width if axis == ROWS else self.height
+            cells: Optional[List[int]] = solve_line(_line_cells(filled, empty, length), self.clues[axis][index])
+            result = _line_masks(cells) if cells is not None else (None, None)
+        self._cache[key] = result
+
+        return result
+
+    def _deduce(self, painted_rows: Sequence[int]) -> Optional[Deduction]:
+        width, height = self.width, self.height
+        masks: Tuple[List[List[int]]] = (
+            [list(painted_rows), [0] * height],
+            [BitBoard(width, height, painted_rows).transpose().rows, [0] * width],
+        )
+        order: List[Tuple[int]] = []
+
+        dirty: List[Set[int]] = [set(range(height)), set(range(width))]
+        while dirty[ROWS] or dirty[COLUMNS]:
+            axis: int = ROWS if dirty[ROWS] else COLUMNS
+            index: int = dirty[axis].pop()
+            filled, empty = masks[axis][0][index], masks[axis][1][index]
+
+            solved_filled, solved_empty = self._solve(axis, index, filled, empty)
+            if solved_filled is None:
+                return None
+
+            new_filled: int = solved_filled & ~filled
+            new_empty: int = solved_empty & ~empty
+            if not (new_filled or new_empty):
+                continue
+
+            masks[axis][0][index] = solved_filled
+            masks[axis][1][index] = solved_empty
+            other: int = COLUMNS if axis == ROWS else ROWS
+            for value, new in ((0, new_filled), (1, new_empty)):
+                while new:
+                    low: int = new & -new
+                    position: int = low.bit_length() - 1
+                    masks[other][value][position] |= 1 << index
+                    dirty[other].add(position)
+                    if value == 0:
+                        order.append((position, index) if axis == ROWS else (index, position))
+                    new ^= low
+
+        return masks[ROWS][0], masks[ROWS][1], order
@@ -0,0 +1,143 @@
+import sys
+from array import array
+from typing import Final, List, NamedTuple, Optional, Sequence
+
+DEFAULT_HISTORY_LIMIT: Final[int] = 1024
+COORDINATE_BITS: Final[int] = 16
+# Set on moves made in the same stroke as the move recorded before them
+JOINED_FLAG: Final[int] = 1 << (2 * COORDINATE_BITS + 1)
+
+
+class Move(NamedTuple):
+    x: int
+    y: int
+    previous: int
+
+    @property
+    def value(self) -> int:
+        return 1 - self.previous
+
+
+def _encode(x: int, y: int, previous: int, joined: bool = False) -> int:
+    return (JOINED_FLAG if joined else 0) | (((y << COORDINATE_BITS) | x) << 1) | previous
+
+
+def _decode(delta: int) -> Move:
+    coordinates: int = delta >> 1
+    return Move(
+        coordinates & ((1 << COORDINATE_BITS) - 1),
+        (coordinates >> COORDINATE_BITS) & ((1 << COORDINATE_BITS) - 1),
+        delta & 1,
+    )
+
+
+class MoveHistory:
+    """Ring buffer of cell changes, each packed into a single 64 bit integer.
+
+    Once `limit` moves are stored, recording a new one forgets the oldest.
+    """
+
+    def __init__(self, limit: int = DEFAULT_HISTORY_LIMIT):
+        if limit < 1:
+            raise ValueError("History limit must be at least 1")
+
+        self.limit: int = limit
+        self._deltas = array("Q", bytes(8 * limit))
+        self._start: int = 0
+        self._undoable: int = 0
+        self._redoable: int = 0
+
+    def __len__(self) -> int:
+        return self._undoable
+
+    def __sizeof__(self) -> int:
+        return object.__sizeof__(self) + sys.getsizeof(self._deltas)
+
+    @property
+    def can_undo(self) -> bool:
+        return self._undoable > 0
+
+    @property
+    def can_redo(self) -> bool:
+        return self._redoable > 0
+
+    def record(self, x: int, y: int, previous: int, joined: bool = False) -> None:
+        if not (0 <= x < 1 << COORDINATE_BITS and 0 <= y < 1 << COORDINATE_BITS):
+            raise ValueError("Move coordinates out of range")
+
+        self._deltas[(self._start + self._undoable) % self.limit] = _encode(x, y, previous, joined)
+        if self._undoable < self.limit:
+            self._undoable += 1
+        else:
+            self._start = (self._start + 1) % self.limit
+        self._redoable = 0
+
+    def record_stroke(self, moves: Sequence[Move]) -> None:
+        for i, (x, y, previous) in enumerate(moves):
+            self.record(x, y, previous, joined=i > 0)
+
+    def undo(self) -> Optional[Move]:
+        delta: Optional[int] = self._undo_delta()
+        return _decode(delta) if delta is not None else None
+
+    def redo(self) -> Optional[Move]:
+        delta: Optional[int] = self._redo_delta()
+        return _decode(delta) if delta is not None else None
+
+    def undo_stroke(self) -> List[Move]:
+        """Undo moves back to the first one of the latest stroke, newest first."""
+        moves: List[Move] = []
+        delta: Optional[int] = self._undo_delta()
+        while delta is not None:
+            moves.append(_decode(delta))
+            delta = self._undo_delta() if delta & JOINED_FLAG else None
+
+        return moves
+
+    def redo_stroke(self) -> List[Move]:
+        moves: List[Move] = []
+        delta: Optional[int] = self._redo_delta()
+        while delta is not None:
+            moves.append(_decode(delta))
+            delta = self._redo_delta() if self._redo_joined() else None
+
+        return moves
+
+    def _undo_delta(self) -> Optional[int]:
+        if not self._undoable:
+            return None
+
+        self._undoable -= 1
+        self._redoable += 1
+        return self._deltas[(self._start + self._undoable) % self.limit]
+
+    def _redo_joined(self) -> bool:
+        return self._redoable > 0 and bool(self._deltas[(self._start + self._undoable) % self.limit] & JOINED_FLAG)
+
+    def _redo_delta(self) -> Optional[int]:
+        if not self._redoable:
+            return None
+
+        delta: int = self._deltas[(self._start + self._undoable) % self.limit]
+        self._undoable += 1
+        self._redoable -= 1
+        return delta
+
+    def deltas(self) -> array:
+        """Packed moves oldest first: the undoable ones, then those that can be redone."""
+        ordered = self._deltas[self._start:] + self._deltas[:self._start]
+        return ordered[:self._undoable + self._redoable]
+
+    @classmethod
+    def from_deltas(cls, deltas: Sequence[int], undoable: int, limit: int = DEFAULT_HISTORY_LIMIT) -> "MoveHistory":
+        if not 0 <= undoable <= len(deltas) <= limit:
+            raise ValueError("Move deltas do not fit the history")
+
+        history = cls(limit)
+        history._deltas[:len(deltas)] = array("Q", deltas)
+        history._undoable = undoable
+        history._redoable = len(deltas) - undoable
+        return history
+
+    def clear(self) -> None:
+        self._start = self._undoable = self._redoable = 0
@@ -0,0 +1,410 @@
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Final, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from pycross.bitboard import BitBoard, pack_line
+from pycross.paths import PathLike
+from pycross.solver import SolveStatus, solve
+
+CACHE_SUFFIX: Final[str] = ".cache"
+CACHE_MAGIC: Final[bytes] = b"PYXL"
+CACHE_VERSION: Final[int] = 1
+# magic, version, puzzles count, index offset, source mtime (ns), source size
+CACHE_HEADER: Final[struct.Struct] = struct.Struct("<4sH2xIQqq")
+# width, height, has solution, name length, clue values count
+RECORD_HEADER: Final[struct.Struct] = struct.Struct("<HHBxHI")
+PACK_SUFFIXES: Final[Tuple[str]] = (".json", ".jsonl", ".non")
+
+
+class Puzzle(NamedTuple):
+    name: str
+    top_guides: Tuple[Tuple[int]]
+    left_guides: Tuple[Tuple[int]]
+    solution: Optional[Tuple[Tuple[int]]] = None
+
+    @property
+    def width(self) -> int:
+        return len(self.top_guides)
+
+    @property
+    def height(self) -> int:
+        return len(self.left_guides)
+
+
+class MalformedPuzzle(NamedTuple):
+    """A pack entry that could not be read as a puzzle."""
+    name: str
+    error: str
+
+
+PackEntry = Union[Puzzle, MalformedPuzzle]
+
+
+def _clues(guides: Sequence[Sequence[int]]) -> Tuple[Tuple[int]]:
+    return tuple(tuple(block for block in map(int, guide) if block) for guide in guides)
+
+
+def check_puzzle(puzzle: Puzzle) -> Puzzle:
+    if puzzle.solution is None:
+        return puzzle
+
+    if len(puzzle.solution) != puzzle.height:
+        raise ValueError(f"{puzzle.name}: Unmatching number of rows between Solution and Left Guide")
+
+    for row in puzzle.solution:
+        if len(row) != puzzle.width:
+            raise ValueError(f"{puzzle.name}: Unmatching number of columns between Solution and Top Guide")
+
+    board = BitBoard.from_matrix(puzzle.solution)
+    for y, guide in enumerate(puzzle.left_guides):
+        if board.row_clue(y) != guide:
+            raise ValueError(f"{puzzle.name}: Left Guide does not match Solution at row {y}")
+
+    columns = board.transpose()
+    for x, guide in enumerate(puzzle.top_guides):
+        if columns.row_clue(x) != guide:
+            raise ValueError(f"{puzzle.name}: Top Guide does not match Solution at column {x}")
+
+    return puzzle
+
+
+def puzzle_to_json(puzzle: Puzzle) -> str:
+    entry: dict = puzzle._asdict()
+    if puzzle.solution is None:
+        del entry["solution"]
+
+    return json.dumps(entry, separators=(",", ":"))
+
+
+def _puzzle_from_json(entry: dict, default_name: str) -> Puzzle:
+    name: str = str(entry.get("name", default_name)) if isinstance(entry, dict) else default_name
+    try:
+        solution = entry.get("solution")
+        return Puzzle(
+            name,
+            _clues(entry["top_guides"]),
+            _clues(entry["left_guides"]),
+            tuple(tuple(int(cell) for cell in row) for row in solution) if solution is not None else None,
+        )
+    except KeyError as error:
+        raise ValueError(f"{name}: Missing {error.args[0]}") from error
+    except (AttributeError, TypeError, ValueError) as error:
+        raise ValueError(f"{name}: Malformed puzzle: {error}") from error
+
+
+def _json_entries(text: str) -> list:
+    data = json.loads(text)
+    entries = data["puzzles"] if isinstance(data, dict) and "puzzles" in data else data
+    return [entries] if isinstance(entries, dict) else entries
+
+
+def parse_json_pack(text: str, pack_name: str = "pack", check: bool = True) -> List[Puzzle]:
+    puzzles: List[Puzzle] = [
+        _puzzle_from_json(entry, f"{pack_name}#{i}") for i, entry in enumerate(_json_entries(text))
+    ]
+    return [check_puzzle(puzzle) for puzzle in puzzles] if check else puzzles
+
+
+def iter_json_lines(
+    lines: Iterable[str], pack_name: str = "pack", check: bool = True, malformed: bool = False
+) -> Iterator[PackEntry]:
+    for i, line in enumerate(lines):
+        if not line.strip():
+            continue
+
+        try:
+            puzzle: Puzzle = _puzzle_from_json(json.loads(line), f"{pack_name}#{i}")
+        except ValueError as error:
+            if not malformed:
+                raise
+            yield MalformedPuzzle(f"{pack_name}#{i}", str(error))
+            continue
+
+        yield check_puzzle(puzzle) if check else puzzle
+
+
+def _parse_non_clue(line: str) -> Tuple[int]:
+    return tuple(int(block) for block in line.replace(",", " ").split() if int(block))
+
+
+def parse_non(text: str, name: str = "puzzle", check: bool = True) -> Puzzle:
+    fields: dict = {}
+    sections: dict = {"rows": [], "columns": []}
+    section: Optional[str] = None
+
+    for raw_line in text.splitlines():
+        line: str = raw_line.split("#", 1)[0].strip()
+        if not line:
+            continue
+
+        key, _, value = line.partition(" ")
+        if key in sections:
+            section = key
+        elif section is not None and (line[0].isdigit() or line == "-"):
+            sections[section].append(_parse_non_clue(line.strip("-")))
+        else:
+            section = None
+            fields[key] = value.strip().strip('"')
+
+    width: int = int(fields.get("width", len(sections["columns"])))
+    height: int = int(fields.get("height", len(sections["rows"])))
+    if len(sections["columns"]) != width or len(sections["rows"]) != height:
+        raise ValueError(f"{name}: Clue sections do not match the declared width and height")
+
+    solution: Optional[Tuple[Tuple[int]]] = None
+    goal: Optional[str] = fields.get("goal")
+    if goal is not None:
+        cells: List[int] = [int(cell) for cell in goal if cell in "01"]
+        if len(cells) != width * height:
+            raise ValueError(f"{name}: Goal does not match the declared width and height")
+        solution = tuple(tuple(cells[y * width:(y + 1) * width]) for y in range(height))
+
+    puzzle = Puzzle(fields.get("title", name), tuple(sections["columns"]), tuple(sections["rows"]), solution)
+    return check_puzzle(puzzle) if check else puzzle
+
+
+def _pack_files(source: Path) -> List[Path]:
+    if source.is_dir():
+        return sorted(path for path in source.iterdir() if path.suffix in PACK_SUFFIXES)
+
+    return [source]
+
+
+def _iter_json_pack(text: str, pack_name: str, check: bool, malformed: bool) -> Iterator[PackEntry]:
+    try:
+        entries: list = _json_entries(text)
+    except ValueError as error:
+        if not malformed:
+            raise
+        yield MalformedPuzzle(pack_name, str(error))
+        return
+
+    for i, entry in enumerate(entries):
+        try:
+            puzzle: Puzzle = _puzzle_from_json(entry, f"{pack_name}#{i}")
+        except ValueError as error:
+            if not malformed:
+                raise
+            yield MalformedPuzzle(f"{pack_name}#{i}", str(error))
+            continue
+
+        yield check_puzzle(puzzle) if check else puzzle
+
+
+def iter_pack(source: PathLike, check: bool = True, malformed: bool = False) -> Iterator[PackEntry]:
+    """Yield every puzzle of a pack. With `check` off, guides that contradict the
+    solution are passed through instead of raising. With `malformed` on, entries
+    that cannot be read are yielded as MalformedPuzzle and the pack goes on."""
+    for path in _pack_files(Path(source)):
+        if path.suffix == ".jsonl":
+            # JSON Lines packs are streamed instead of read whole
+            with open(path, encoding="utf-8") as lines:
+                yield from iter_json_lines(lines, path.stem, check, malformed)
+        elif path.suffix == ".non":
+            try:
+                puzzle: Puzzle = parse_non(path.read_text(encoding="utf-8"), path.stem, check=False)
+            except ValueError as error:
+                if not malformed:
+                    raise
+                yield MalformedPuzzle(path.stem, str(error))
+                continue
+
+            yield check_puzzle(puzzle) if check else puzzle
+        else:
+            yield from _iter_json_pack(path.read_text(encoding="utf-8"), path.stem, check, malformed)
+
+
+def load_pack(source: PathLike) -> List[Puzzle]:
+    return list(iter_pack(source))
+
+
+def _fingerprint(source: Path) -> Tuple[int]:
+    # A directory pack changes whenever any of its files does
+    stats = [path.stat() for path in _pack_files(source)]
+    return max((stat.st_mtime_ns for stat in stats), default=0), sum(stat.st_size for stat in stats)
+
+
+def _encode_puzzle(puzzle: Puzzle) -> bytes:
+    name: bytes = puzzle.name.encode("utf-8")
+    clues = array("H")
+    for guide in (*puzzle.top_guides, *puzzle.left_guides):
+        clues.append(len(guide))
+        clues.extend(guide)
+    if sys.byteorder == "big":
+        clues.byteswap()
+
+    solution: bytes = b""
+    if puzzle.solution is not None:
+        row_bytes: int = (puzzle.width + 7) // 8
+        solution = b"".join(
+            pack_line(row).to_bytes(row_bytes, "little") for row in puzzle.solution
+        )
+
+    header: bytes = RECORD_HEADER.pack(
+        puzzle.width, puzzle.height, puzzle.solution is not None, len(name), len(clues)
+    )
+    return header + name + clues.tobytes() + solution
+
+
+def write_cache(puzzles: Iterable[Puzzle], cache_path: PathLike, fingerprint: Tuple[int] = (0, 0)) -> None:
+    # Written aside and moved into place so concurrent readers never map a partial file
+    partial_path: str = f"{cache_path}.{os.getpid()}.tmp"
+    offsets = array("Q")
+    try:
+        with open(partial_path, "wb") as cache:
+            cache.write(b"\0" * CACHE_HEADER.size)
+            for puzzle in puzzles:
+                offsets.append(cache.tell())
+                cache.write(_encode_puzzle(puzzle))
+
+            index_offset: int = cache.tell()
+            offsets.append(index_offset)
+            count: int = len(offsets) - 1
+            if sys.byteorder == "big":
+                offsets.byteswap()
+            cache.write(offsets.tobytes())
+
+            cache.seek(0)
+            cache.write(
+                CACHE_HEADER.pack(CACHE_MAGIC, CACHE_VERSION, count, index_offset, *fingerprint)
+            )
+    except BaseException:
+        # A pack that fails partway leaves no partial file behind
+        Path(partial_path).unlink(missing_ok=True)
+        raise
+
+    os.replace(partial_path, cache_path)
+
+
+class PuzzleLibrary:
+    def __init__(self, cache_path: PathLike):
+        self.cache_path: Path = Path(cache_path)
+
+        with open(self.cache_path, "rb") as cache:
+            self._map: mmap.mmap = mmap.mmap(cache.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self._read_index()
+        except ValueError:
+            # A truncated or foreign file is reported like any other bad cache, so it gets rebuilt
+            self._map.close()
+            raise
+
+    def _read_index(self) -> None:
+        if len(self._map) < CACHE_HEADER.size:
+            raise ValueError(f"{self.cache_path}: Not a puzzle library cache")
+
+        magic, version, self._count, index_offset, *fingerprint = CACHE_HEADER.unpack_from(self._map)
+        if magic != CACHE_MAGIC or version != CACHE_VERSION:
+            raise ValueError(f"{self.cache_path}: Not a puzzle library cache")
+
+        index_end: int = index_offset + (self._count + 1) * 8
+        if not CACHE_HEADER.size <= index_offset <= index_end <= len(self._map):
+            raise ValueError(f"{self.cache_path}: Puzzle index out of the cache")
+
+        self.fingerprint: Tuple[int] = tuple(fingerprint)
+        self._offsets = array("Q")
+        self._offsets.frombytes(self._map[index_offset:index_end])
+        if sys.byteorder == "big":
+            self._offsets.byteswap()
+        if self._offsets[0] != CACHE_HEADER.size or self._offsets[-1] != index_offset:
+            raise ValueError(f"{self.cache_path}: Puzzle index out of the cache")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> Puzzle:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("puzzle index out of range")
+
+        return self._decode(index)
+
+    def __iter__(self) -> Iterator[Puzzle]:
+        return (self._decode(i) for i in range(self._count))
+
+    def _decode(self, index: int) -> Puzzle:
+        offset, end = self._offsets[index], self._offsets[index + 1]
+        if not offset + RECORD_HEADER.size <= end:
+            raise ValueError(f"{self.cache_path}: Puzzle {index} out of the cache")
+
+        width, height, has_solution, name_len, clues_len = RECORD_HEADER.unpack_from(self._map, offset)
+        offset += RECORD_HEADER.size
+        row_bytes: int = (width + 7) // 8
+        if offset + name_len + clues_len * 2 + (height * row_bytes if has_solution else 0) > end:
+            raise ValueError(f"{self.cache_path}: Puzzle {index} out of the cache")
+
+        name: str = self._map[offset:offset + name_len].decode("utf-8")
+        offset += name_len
+
+        values = array("H")
+        values.frombytes(self._map[offset:offset + clues_len * 2])
+        if sys.byteorder == "big":
+            values.byteswap()
+        offset += clues_len * 2
+
+        guides: List[Tuple[int]] = []
+        position: int = 0
+        for _ in range(width + height):
+            blocks: int = values[position]
+            guides.append(tuple(values[position + 1:position + 1 + blocks]))
+            position += blocks + 1
+
+        solution: Optional[Tuple[Tuple[int]]] = None
+        if has_solution:
+            rows: List[int] = [
+                int.from_bytes(self._map[offset + y * row_bytes:offset + (y + 1) * row_bytes], "little")
+                for y in range(height)
+            ]
+            solution = tuple(map(tuple, BitBoard(width, height, rows).to_matrix()))
+
+        return Puzzle(name, tuple(guides[:width]), tuple(guides[width:]), solution)
+
+    def close(self) -> None:
+        self._map.close()
+
+    def __enter__(self) -> "PuzzleLibrary":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def open_library(source: PathLike, cache_path: Optional[PathLike] = None) -> PuzzleLibrary:
+    source = Path(source)
+    cache_path = Path(cache_path) if cache_path is not None else source.with_name(source.name + CACHE_SUFFIX)
+    fingerprint: Tuple[int] = _fingerprint(source)
+
+    if cache_path.exists():
+        try:
+            library = PuzzleLibrary(cache_path)
+        except ValueError:
+            pass
+        else:
+            if library.fingerprint == fingerprint:
+                return library
+            library.close()
+
+    write_cache(iter_pack(source), cache_path, fingerprint)
+    return PuzzleLibrary(cache_path)
+
+
+def load_puzzle(source: PathLike, index: int = 0, solve_missing: bool = True) -> Puzzle:
+    """Load one puzzle of a pack, solving it from its guides when the pack has no
+    solution (unless `solve_missing` is off)."""
+    with open_library(source) as library:
+        puzzle: Puzzle = library[index]
+
+    if puzzle.solution is None and solve_missing:
+        result = solve(puzzle.top_guides, puzzle.left_guides)
+        if result.status is not SolveStatus.UNIQUE:
+            raise ValueError(f"{puzzle.name}: Puzzle is {result.status.value}")
+        puzzle = puzzle._replace(solution=result.solution)
+
+    return puzzle
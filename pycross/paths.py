@@ -0,0 +1,4 @@
+import os
+from typing import Union
+
+PathLike = Union[str, os.PathLike]
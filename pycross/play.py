@@ -1,8 +1,41 @@
-from typing import Tuple
+import sys
+from typing import Optional, Tuple
 
 from pycross import Pycross
+from pycross.engine import CLUES_WIN
+from pycross.library import load_puzzle
+from pycross.paths import PathLike
+
+def _run(app: Pycross) -> None:
+    app.run()
+    # The report is printed once the terminal is back to normal
+    if app.profiler.enabled:
+        print(app.profiler.report(), file=sys.stderr)
+
+def start(
+    pack: Optional[PathLike] = None,
+    puzzle_index: int = 0,
+    session_path: Optional[PathLike] = None,
+    win_mode: Optional[str] = None,
+    profile: Optional[bool] = None,
+    record_path: Optional[PathLike] = None,
+) -> None:
+    if pack is not None:
+        # Winning by the clues does not need a solution, so none is worked out
+        puzzle = load_puzzle(pack, puzzle_index, solve_missing=win_mode != CLUES_WIN)
+        _run(
+            Pycross(
+                puzzle.top_guides,
+                puzzle.left_guides,
+                puzzle.solution,
+                session_path=session_path,
+                win_mode=win_mode,
+                profile=profile,
+                record_path=record_path,
+            )
+        )
+        return
 
-def start() -> None:
     top_guides: Tuple[Tuple[int]] = (
         (1,),
         (1, 1, 1),
@@ -27,8 +60,17 @@ def start() -> None:
         (0, 1, 0, 1, 0),
     )
 
-    app = Pycross(top_guides, left_guides, solution)
-    app.run()
+    _run(
+        Pycross(
+            top_guides,
+            left_guides,
+            solution,
+            session_path=session_path,
+            win_mode=win_mode,
+            profile=profile,
+            record_path=record_path,
+        )
+    )
 
 if __name__ == "__main__":
     start()
@@ -0,0 +1,118 @@
+import os
+from contextlib import nullcontext
+from time import perf_counter_ns
+from typing import ContextManager, Dict, Final, List, Tuple
+
+PROFILE_ENV: Final[str] = "PYCROSS_PROFILE"
+PROFILE_ENV_VALUES: Final[Tuple[str]] = ("1", "true", "yes")
+# Stages of a move, in the order they happen
+DISPATCH: Final[str] = "dispatch" # Tile.Painted from posted to handled
+PLAY: Final[str] = "play" # PycrossApp._play, including the solved check
+SOLVED: Final[str] = "solved" # Solved check and winner message
+MOVE: Final[str] = "move" # Focus change of PycrossApp._move, or the virtual grid's cursor move
+RESTYLE: Final[str] = "restyle" # CSS update of the tiles, or refresh of the virtual grid lines, that changed
+STAGES: Final[List[str]] = [DISPATCH, PLAY, SOLVED, MOVE, RESTYLE]
+
+
+def profile_requested() -> bool:
+    """Whether PYCROSS_PROFILE asks for profiling, so "0" or "false" leave it off."""
+    return os.environ.get(PROFILE_ENV, "").strip().lower() in PROFILE_ENV_VALUES
+
+
+class LatencyHistogram:
+    """Latencies counted in power of two nanosecond buckets, so recording takes
+    constant time and memory however long the game is played."""
+
+    __slots__ = ("buckets", "count", "total_ns", "max_ns")
+
+    def __init__(self):
+        self.buckets: List[int] = [0] * 64
+        self.count: int = 0
+        self.total_ns: int = 0
+        self.max_ns: int = 0
+
+    def record(self, elapsed_ns: int) -> None:
+        self.buckets[min(elapsed_ns.bit_length(), 63)] += 1
+        self.count += 1
+        self.total_ns += elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+
+    @property
+    def mean_ns(self) -> float:
+        return self.total_ns / self.count if self.count else 0.0
+
+    def percentile(self, fraction: float) -> int:
+        """Upper bound, in nanoseconds, of the bucket holding the given fraction of the samples."""
+        rank: float = fraction * self.count
+        seen: int = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= rank:
+                return min((1 << index) - 1, self.max_ns)
+
+        return 0
+
+
+class _Stage:
+    __slots__ = ("histogram", "start")
+
+    def __init__(self, histogram: LatencyHistogram):
+        self.histogram: LatencyHistogram = histogram
+
+    def __enter__(self) -> None:
+        self.start: int = perf_counter_ns()
+
+    def __exit__(self, *exc_info) -> None:
+        self.histogram.record(perf_counter_ns() - self.start)
+
+
+class Profiler:
+    """Latency histograms of the stages of a move, by stage name."""
+
+    enabled: bool = True
+
+    def __init__(self):
+        self.histograms: Dict[str, LatencyHistogram] = {stage: LatencyHistogram() for stage in STAGES}
+
+    def clock(self) -> int:
+        return perf_counter_ns()
+
+    def stage(self, name: str) -> ContextManager[None]:
+        """Time the body of a `with` block as one sample of `name`."""
+        return _Stage(self.histograms[name])
+
+    def record(self, name: str, elapsed_ns: int) -> None:
+        self.histograms[name].record(elapsed_ns)
+
+    def report(self) -> str:
+        lines: List[str] = [
+            f"{'stage':<10} {'count':>8} {'mean us':>10} {'p50 us':>10} {'p99 us':>10} {'max us':>10}"
+        ]
+        for name, histogram in self.histograms.items():
+            lines.append(
+                f"{name:<10} {histogram.count:>8} {histogram.mean_ns / 1000:>10.1f} "
+                f"{histogram.percentile(0.5) / 1000:>10.1f} {histogram.percentile(0.99) / 1000:>10.1f} "
+                f"{histogram.max_ns / 1000:>10.1f}"
+            )
+
+        return "\n".join(lines)
+
+
+class NullProfiler(Profiler):
+    """Stands in when profiling is off: every hook is a no-op and reads no clock."""
+
+    enabled: bool = False
+    _null_stage: ContextManager[None] = nullcontext()
+
+    def clock(self) -> int:
+        return 0
+
+    def stage(self, name: str) -> ContextManager[None]:
+        return self._null_stage
+
+    def record(self, name: str, elapsed_ns: int) -> None:
+        pass
+
+
+NULL_PROFILER: Final[NullProfiler] = NullProfiler()
@@ -0,0 +1,186 @@
+import struct
+import sys
+from array import array
+from typing import BinaryIO, Final, Iterable, Iterator, List, NamedTuple, Optional
+
+from pycross.bitboard import BitBoard
+from pycross.engine import GameState
+from pycross.history import MoveHistory
+from pycross.paths import PathLike
+from pycross.session import Session, decode_session, encode_session
+
+LOG_MAGIC: Final[bytes] = b"PYXM"
+LOG_VERSION: Final[int] = 2
+# magic, version, length of the starting session
+# The header is followed by the game as it stood when recording started, in the
+# session format, padded to a whole word, then by the moves.
+LOG_HEADER: Final[struct.Struct] = struct.Struct("<4sHxxI")
+WORD_BYTES: Final[int] = 4
+
+# A move is one 32 bit word: kind (3 bits), value (1 bit), x (14 bits) and y (14 bits).
+# A region is followed by a second word holding its width and height.
+TOGGLE: Final[int] = 0
+SET: Final[int] = 1
+REGION: Final[int] = 2
+UNDO: Final[int] = 3
+REDO: Final[int] = 4
+RESET: Final[int] = 5
+KIND_BITS: Final[int] = 3
+COORDINATE_BITS: Final[int] = 14
+MAX_COORDINATE: Final[int] = (1 << COORDINATE_BITS) - 1
+FLUSH_MOVES: Final[int] = 4096
+
+
+class LoggedMove(NamedTuple):
+    kind: int
+    x: int = 0
+    y: int = 0
+    value: int = 0
+    width: int = 1
+    height: int = 1
+
+
+class MoveLog(NamedTuple):
+    start: Session
+    moves: List[LoggedMove]
+
+
+def _encode(kind: int, x: int = 0, y: int = 0, value: int = 0) -> int:
+    if not (0 <= x <= MAX_COORDINATE and 0 <= y <= MAX_COORDINATE):
+        raise ValueError(f"({x}, {y}) does not fit a move log")
+
+    return kind | (value << KIND_BITS) | (x << (KIND_BITS + 1)) | (y << (KIND_BITS + 1 + COORDINATE_BITS))
+
+
+def _decode(words: array) -> Iterator[LoggedMove]:
+    words = iter(words)
+    for word in words:
+        kind: int = word & ((1 << KIND_BITS) - 1)
+        value: int = (word >> KIND_BITS) & 1
+        x: int = (word >> (KIND_BITS + 1)) & MAX_COORDINATE
+        y: int = word >> (KIND_BITS + 1 + COORDINATE_BITS)
+        if kind == REGION:
+            size: Optional[int] = next(words, None)
+            if size is None:
+                # A log cut short ends with the last whole move
+                return
+            yield LoggedMove(kind, x, y, value, size & 0xFFFF, size >> 16)
+        else:
+            yield LoggedMove(kind, x, y, value)
+
+
+class MoveRecorder:
+    """Appends the moves of a game to a move log, as they are played.
+
+    The log starts with the board and undo history of the game when the
+    recorder is created, so a resumed game replays to the same board. Moves
+    are buffered and written in blocks, so recording costs a few integer
+    operations per move. The log is complete once the recorder is closed.
+    """
+
+    def __init__(self, path: PathLike, game: GameState):
+        start: bytes = encode_session(game.state, game.history, game.checksum())
+        self._file: BinaryIO = open(path, "wb")
+        self._file.write(LOG_HEADER.pack(LOG_MAGIC, LOG_VERSION, len(start)))
+        self._file.write(start + b"\0" * (-len(start) % WORD_BYTES))
+        self._words: array = array("I")
+
+    def toggle(self, x: int, y: int) -> None:
+        self._append(_encode(TOGGLE, x, y))
+
+    def set(self, x: int, y: int, value: int) -> None:
+        self._append(_encode(SET, x, y, 1 if value else 0))
+
+    def region(self, x: int, y: int, width: int, height: int, value: int) -> None:
+        self._words.append(_encode(REGION, x, y, 1 if value else 0))
+        self._append(width | (height << 16))
+
+    def undo(self) -> None:
+        self._append(UNDO)
+
+    def redo(self) -> None:
+        self._append(REDO)
+
+    def reset(self) -> None:
+        self._append(RESET)
+
+    def _append(self, word: int) -> None:
+        self._words.append(word)
+        if len(self._words) >= FLUSH_MOVES:
+            self.flush()
+
+    def flush(self) -> None:
+        if sys.byteorder == "big":
+            self._words.byteswap()
+        self._file.write(self._words.tobytes())
+        self._file.flush()
+        self._words = array("I")
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self) -> "MoveRecorder":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def read_move_log(path: PathLike) -> MoveLog:
+    with open(path, "rb") as log:
+        data: bytes = log.read()
+
+    if len(data) < LOG_HEADER.size:
+        raise ValueError(f"{path}: Not a move log")
+    magic, version, start_length = LOG_HEADER.unpack_from(data)
+    if magic != LOG_MAGIC or version != LOG_VERSION:
+        raise ValueError(f"{path}: Not a move log")
+
+    offset: int = LOG_HEADER.size
+    start, _ = decode_session(data[offset:offset + start_length], path)
+    offset += start_length + (-start_length % WORD_BYTES)
+
+    words = array("I")
+    body: bytes = data[offset:]
+    words.frombytes(body[:len(body) - len(body) % words.itemsize])
+    if sys.byteorder == "big":
+        words.byteswap()
+
+    return MoveLog(start, list(_decode(words)))
+
+
+def replay_moves(game: GameState, moves: Iterable[LoggedMove], start: Optional[Session] = None) -> int:
+    """Play logged moves on a game, returning how many were played.
+
+    With the `start` of a log, the game is first set to the board and undo
+    history the log was recorded from.
+    """
+    if start is not None:
+        board, history, checksum = start
+        if checksum != game.checksum() or (board.width, board.height) != (game.width, game.height):
+            raise ValueError("Move log belongs to a different puzzle")
+        # Copied, so the same log can be replayed again
+        game.state = BitBoard(board.width, board.height, board.rows)
+        game.history = MoveHistory.from_deltas(history.deltas(), len(history), history.limit)
+
+    played: int = 0
+    for kind, x, y, value, width, height in moves:
+        if kind == TOGGLE:
+            game.update_state(x, y)
+        elif kind == SET:
+            game.set_cell(x, y, value)
+        elif kind == REGION:
+            game.paint_region(x, y, width, height, value)
+        elif kind == UNDO:
+            game.undo()
+        elif kind == REDO:
+            game.redo()
+        elif kind == RESET:
+            game.reset()
+        else:
+            raise ValueError(f"Unknown move kind: {kind}")
+        played += 1
+
+    return played
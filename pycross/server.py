@@ -0,0 +1,251 @@
+import asyncio
+import sys
+from argparse import ArgumentParser
+from collections import deque
+from contextlib import suppress
+from statistics import quantiles
+from time import perf_counter_ns
+from typing import Deque, Dict, Final, List, Optional, Sequence, Set
+
+from pycross.engine import GameState
+from pycross.library import Puzzle, open_library
+from pycross.paths import PathLike
+from pycross.solver import SolveStatus, solve
+
+DEFAULT_HOST: Final[str] = "127.0.0.1"
+DEFAULT_PORT: Final[int] = 7878
+# Thousands of sessions share the process, so each keeps a shorter undo history than a local game
+DEFAULT_SESSION_HISTORY: Final[int] = 256
+LATENCY_SAMPLES: Final[int] = 10_000
+
+OK: Final[str] = "ok"
+ERROR: Final[str] = "err"
+QUIT: Final[str] = "quit"
+
+
+def session_memory(game: GameState) -> int:
+    """Approximate bytes owned by one game: board rows, undo buffer and guide statuses."""
+    rows: List[int] = game.state.rows
+    return (
+        sys.getsizeof(game)
+        + sys.getsizeof(rows) + sum(sys.getsizeof(row) for row in rows)
+        + sys.getsizeof(game.history)
+        + sys.getsizeof(game.clues.rows_status) + sys.getsizeof(game.clues.columns_status)
+    )
+
+
+class Session:
+    __slots__ = ("id", "puzzle", "game", "commands", "total_ns", "max_ns")
+
+    def __init__(self, session_id: int, puzzle: int, game: GameState):
+        self.id: int = session_id
+        self.puzzle: int = puzzle
+        self.game: GameState = game
+        self.commands: int = 0
+        self.total_ns: int = 0
+        self.max_ns: int = 0
+
+    def record(self, elapsed_ns: int) -> None:
+        self.commands += 1
+        self.total_ns += elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+
+
+class GameServer:
+    """Independent games over a line protocol, one command and one reply per line.
+
+    Commands (replies start with `ok`, or `err` followed by the reason):
+
+        new [puzzle]            -> ok <session> <width> <height>
+        move <session> <x> <y>  -> ok <value> <solved>
+        undo <session>          -> ok <cells changed> <solved>
+        redo <session>          -> ok <cells changed> <solved>
+        status <session>        -> ok solved=<0|1> painted=<cells> undoable=<moves>
+        stats [session]         -> ok key=value pairs on memory use and command latency
+        close <session>         -> ok
+        quit                    -> ok, then the connection is closed
+
+    Sessions belong to the connection that opened them and end when it closes.
+    """
+
+    def __init__(self, puzzles: Sequence[Puzzle], history_limit: int = DEFAULT_SESSION_HISTORY):
+        self.puzzles: Sequence[Puzzle] = puzzles
+        self.history_limit: int = history_limit
+        self.sessions: Dict[int, Session] = {}
+        self._next_id: int = 1
+        # Puzzles are decoded (and solved, if the pack has no solution) once for every session
+        self._solved: Dict[int, Puzzle] = {}
+        self._latencies: Deque[int] = deque(maxlen=LATENCY_SAMPLES)
+        self.commands: int = 0
+
+    def execute(self, line: str, owned: Optional[Set[int]] = None) -> str:
+        start: int = perf_counter_ns()
+        words: List[str] = line.split()
+        session: Optional[Session] = None
+        try:
+            if not words:
+                raise ValueError("empty command")
+
+            command, arguments = words[0], [int(word) for word in words[1:]]
+            if command == "new":
+                session = self._open(arguments[0] if arguments else 0)
+                if owned is not None:
+                    owned.add(session.id)
+                reply: str = f"{OK} {session.id} {session.game.width} {session.game.height}"
+            elif command == "stats" and not arguments:
+                reply = self._server_stats()
+            else:
+                if not arguments:
+                    raise ValueError(f"{command}: session expected")
+                session = self._session(arguments[0], owned)
+                reply = self._dispatch(command, session, arguments[1:], owned)
+        except (ValueError, IndexError) as error:
+            reply = f"{ERROR} {error}"
+
+        elapsed: int = perf_counter_ns() - start
+        self.commands += 1
+        self._latencies.append(elapsed)
+        if session is not None:
+            session.record(elapsed)
+
+        return reply
+
+    def _dispatch(self, command: str, session: Session, arguments: List[int], owned: Optional[Set[int]]) -> str:
+        game: GameState = session.game
+        if command == "move":
+            if len(arguments) != 2:
+                raise ValueError("move: x and y expected")
+            x, y = arguments
+            if not (0 <= x < game.width and 0 <= y < game.height):
+                raise IndexError("move: cell out of the board")
+            value: int = game.update_state(x, y)
+            return f"{OK} {value} {int(game.solved)}"
+
+        if command in ("undo", "redo"):
+            moves = game.undo() if command == "undo" else game.redo()
+            return f"{OK} {len(moves)} {int(game.solved)}"
+
+        if command == "status":
+            painted: int = sum(row.bit_count() for row in game.state.rows)
+            return f"{OK} solved={int(game.solved)} painted={painted} undoable={len(game.history)}"
+
+        if command == "stats":
+            mean_us: float = session.total_ns / session.commands / 1000 if session.commands else 0
+            return (
+                f"{OK} memory={session_memory(game)} commands={session.commands} "
+                f"mean_us={mean_us:.1f} max_us={session.max_ns / 1000:.1f}"
+            )
+
+        if command == "close":
+            del self.sessions[session.id]
+            if owned is not None:
+                owned.discard(session.id)
+            return OK
+
+        raise ValueError(f"{command}: unknown command")
+
+    def _open(self, index: int) -> Session:
+        puzzle: Optional[Puzzle] = self._solved.get(index)
+        if puzzle is None:
+            puzzle = self.puzzles[index]
+            if puzzle.solution is None:
+                result = solve(puzzle.top_guides, puzzle.left_guides)
+                if result.status is not SolveStatus.UNIQUE:
+                    raise ValueError(f"{puzzle.name}: Puzzle is {result.status.value}")
+                puzzle = puzzle._replace(solution=result.solution)
+            self._solved[index] = puzzle
+
+        game = GameState(puzzle.solution, puzzle.top_guides, puzzle.left_guides, self.history_limit)
+        session = Session(self._next_id, index, game)
+        self.sessions[session.id] = session
+        self._next_id += 1
+
+        return session
+
+    def _session(self, session_id: int, owned: Optional[Set[int]] = None) -> Session:
+        session: Optional[Session] = self.sessions.get(session_id)
+        # Another connection's session is reported as missing, so its id can't be used to play or close it
+        if session is None or (owned is not None and session_id not in owned):
+            raise ValueError(f"{session_id}: no such session")
+
+        return session
+
+    def _server_stats(self) -> str:
+        memory: int = sum(session_memory(session.game) for session in self.sessions.values())
+        latencies: List[int] = sorted(self._latencies)
+        p50 = p99 = 0.0
+        if len(latencies) > 1:
+            cuts: List[float] = quantiles(latencies, n=100)
+            p50, p99 = cuts[49], cuts[98]
+
+        return (
+            f"{OK} sessions={len(self.sessions)} memory={memory} commands={self.commands} "
+            f"p50_us={p50 / 1000:.1f} p99_us={p99 / 1000:.1f} "
+            f"max_us={(latencies[-1] if latencies else 0) / 1000:.1f}"
+        )
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        owned: Set[int] = set()
+        try:
+            while True:
+                line: bytes = await reader.readline()
+                if not line:
+                    break
+
+                text: str = line.decode("ascii", "replace")
+                if text.strip() == QUIT:
+                    writer.write(f"{OK}\n".encode("ascii"))
+                    break
+
+                writer.write(f"{self.execute(text, owned)}\n".encode("ascii"))
+                await writer.drain()
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            for session_id in owned:
+                self.sessions.pop(session_id, None)
+            writer.close()
+            with suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def start(
+        self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, path: Optional[PathLike] = None
+    ) -> asyncio.AbstractServer:
+        """Listen on a Unix socket when `path` is given, on TCP otherwise."""
+        if path is not None:
+            return await asyncio.start_unix_server(self.handle_client, path)
+
+        return await asyncio.start_server(self.handle_client, host, port)
+
+
+async def serve(
+    pack: PathLike,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    path: Optional[PathLike] = None,
+    history_limit: int = DEFAULT_SESSION_HISTORY,
+) -> None:
+    with open_library(pack) as library:
+        server = await GameServer(library, history_limit).start(host, port, path)
+        address: str = str(path) if path is not None else f"{host}:{server.sockets[0].getsockname()[1]}"
+        print(f"Serving {len(library)} puzzles on {address}")
+        async with server:
+            await server.serve_forever()
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    parser = ArgumentParser(prog="pycross.server", description="Host many games over a line protocol")
+    parser.add_argument("pack", help="puzzle pack shared by every session")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--unix", help="listen on this Unix socket instead of TCP")
+    parser.add_argument("--history", type=int, default=DEFAULT_SESSION_HISTORY, help="undoable moves kept per session")
+    options = parser.parse_args(args)
+
+    with suppress(KeyboardInterrupt):
+        asyncio.run(serve(options.pack, options.host, options.port, options.unix, options.history))
+
+
+if __name__ == "__main__":
+    main()
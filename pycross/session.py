@@ -0,0 +1,100 @@
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+from typing import Final, NamedTuple, Sequence, Tuple, Union
+
+from pycross.bitboard import BitBoard
+from pycross.history import MoveHistory
+from pycross.paths import PathLike
+
+SESSION_MAGIC: Final[bytes] = b"PYXS"
+SESSION_VERSION: Final[int] = 2 # 2: puzzles are keyed by their guides in every win mode
+# magic, version, width, height, puzzle checksum, history limit, undoable moves, redoable moves
+SESSION_HEADER: Final[struct.Struct] = struct.Struct("<4sHHHxxIIII")
+
+Buffer = Union[bytes, memoryview, mmap.mmap]
+
+
+class Session(NamedTuple):
+    board: BitBoard
+    history: MoveHistory
+    checksum: int
+
+
+def _row_bytes(width: int) -> int:
+    return (width + 7) // 8
+
+
+def guides_checksum(top_guides: Sequence[Sequence[int]], left_guides: Sequence[Sequence[int]]) -> int:
+    # The same key whether or not the puzzle has a stored solution; blocks are separated by commas, lines by semicolons
+    lines = (*top_guides, (), *left_guides)
+    return zlib.crc32(";".join(",".join(str(block) for block in line if block) for line in lines).encode("ascii"))
+
+
+def encode_session(board: BitBoard, history: MoveHistory, checksum: int = 0) -> bytes:
+    """The board and undo history as written to a session file, header included."""
+    deltas: array = history.deltas()
+    if sys.byteorder == "big":
+        deltas.byteswap()
+
+    row_bytes: int = _row_bytes(board.width)
+    header: bytes = SESSION_HEADER.pack(
+        SESSION_MAGIC,
+        SESSION_VERSION,
+        board.width,
+        board.height,
+        checksum,
+        history.limit,
+        len(history),
+        len(deltas) - len(history),
+    )
+
+    return b"".join((header, *(row.to_bytes(row_bytes, "little") for row in board.rows), deltas.tobytes()))
+
+
+def decode_session(data: Buffer, path: PathLike = "session") -> Tuple[Session, int]:
+    """Read a session from the start of `data`, returning it and the number of bytes it took."""
+    if len(data) < SESSION_HEADER.size:
+        raise ValueError(f"{path}: Not a game session")
+
+    magic, version, width, height, checksum, limit, undoable, redoable = SESSION_HEADER.unpack_from(data)
+    if magic != SESSION_MAGIC or version != SESSION_VERSION:
+        raise ValueError(f"{path}: Not a game session")
+
+    row_bytes: int = _row_bytes(width)
+    offset: int = SESSION_HEADER.size
+    rows = [
+        int.from_bytes(data[offset + y * row_bytes:offset + (y + 1) * row_bytes], "little")
+        for y in range(height)
+    ]
+    offset += height * row_bytes
+
+    deltas = array("Q")
+    deltas.frombytes(data[offset:offset + (undoable + redoable) * deltas.itemsize])
+    if len(deltas) != undoable + redoable:
+        raise ValueError(f"{path}: Truncated game session")
+    if sys.byteorder == "big":
+        deltas.byteswap()
+    offset += len(deltas) * deltas.itemsize
+
+    session = Session(BitBoard(width, height, rows), MoveHistory.from_deltas(deltas, undoable, limit), checksum)
+    return session, offset
+
+
+def save_session(path: PathLike, board: BitBoard, history: MoveHistory, checksum: int = 0) -> None:
+    data: bytes = encode_session(board, history, checksum)
+
+    # Written aside and moved into place so a crash never leaves a truncated session
+    partial_path: str = f"{path}.{os.getpid()}.tmp"
+    with open(partial_path, "wb") as session:
+        session.write(data)
+
+    os.replace(partial_path, path)
+
+
+def load_session(path: PathLike) -> Session:
+    with open(path, "rb") as session, mmap.mmap(session.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        return decode_session(data, path)[0]
@@ -0,0 +1,218 @@
+from enum import Enum
+from typing import Final, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+UNKNOWN: Final[int] = -1
+EMPTY: Final[int] = 0
+FILLED: Final[int] = 1
+
+
+class SolveStatus(Enum):
+    UNIQUE = "unique"
+    UNSOLVABLE = "unsolvable"
+    AMBIGUOUS = "ambiguous"
+
+
+class SolveResult(NamedTuple):
+    status: SolveStatus
+    solution: Optional[Tuple[Tuple[int]]]
+
+
+def normalize_clue(clue: Sequence[int]) -> Tuple[int]:
+    # A line without blocks may be written either as () or as (0,)
+    return tuple(block for block in clue if block)
+
+
+def solve_line(line: Sequence[int], clue: Sequence[int]) -> Optional[List[int]]:
+    """Settle every cell of `line` that takes the same value in all placements of `clue`.
+
+    Returns None when no placement is consistent with the known cells.
+    """
+    clue = normalize_clue(clue)
+    length: int = len(line)
+    blocks: int = len(clue)
+
+    # Block j can only start between its left-most and right-most placement, so
+    # every table below is restricted to that window (the line's slack).
+    slack: int = length + 1 - (sum(clue) + blocks)
+    if slack < 0:
+        return None
+    lowest: List[int] = [0] * (blocks + 1)
+    for j, size in enumerate(clue):
+        lowest[j + 1] = lowest[j] + size + 1
+
+    # A trailing empty cell lets every block be placed as "run + separator".
+    padded: List[int] = [*line, EMPTY]
+    empties: List[int] = [0] * (length + 2)
+    for i, cell in enumerate(padded):
+        empties[i + 1] = empties[i] + (cell == EMPTY)
+
+    # fits[j][i]: block j can be placed starting at cell i
+    fits: List[List[bool]] = []
+    for j, size in enumerate(clue):
+        fit: List[bool] = [False] * (length + 2)
+        for i in range(lowest[j], lowest[j] + slack + 1):
+            fit[i] = empties[i + size] == empties[i] and padded[i + size] != FILLED
+        fits.append(fit)
+
+    # forward[j][i]: the first i cells can hold the first j blocks
+    forward: List[List[bool]] = [[False] * (length + 2) for _ in range(blocks + 1)]
+    forward[0][0] = True
+    for i in range(1, slack + 1):
+        forward[0][i] = forward[0][i - 1] and padded[i - 1] != FILLED
+    for j, size in enumerate(clue):
+        previous, current, fit = forward[j], forward[j + 1], fits[j]
+        for i in range(lowest[j + 1], lowest[j + 1] + slack + 1):
+            start: int = i - size - 1
+            current[i] = (previous[start] and fit[start]) or (
+                current[i - 1] and padded[i - 1] != FILLED
+            )
+
+    if not forward[blocks][length + 1]:
+        return None
+
+    # backward[j][i]: the cells from i onwards can hold the blocks from j onwards
+    backward: List[List[bool]] = [[False] * (length + 3) for _ in range(blocks + 1)]
+    backward[blocks][length + 1] = True
+    for i in range(length, lowest[blocks] - 1, -1):
+        backward[blocks][i] = padded[i] != FILLED and backward[blocks][i + 1]
+    for j in range(blocks - 1, -1, -1):
+        size, following, current, fit = clue[j], backward[j + 1], backward[j], fits[j]
+        for i in range(lowest[j] + slack, lowest[j] - 1, -1):
+            current[i] = (fit[i] and following[i + size + 1]) or (
+                padded[i] != FILLED and current[i + 1]
+            )
+
+    may_be_empty: List[bool] = [False] * (length + 1)
+    coverage: List[int] = [0] * (length + 2)
+    for j in range(blocks + 1):
+        before, after = forward[j], backward[j]
+        for i in range(lowest[j], min(lowest[j] + slack, length) + 1):
+            if not before[i]:
+                continue
+            if padded[i] != FILLED and after[i + 1]:
+                may_be_empty[i] = True
+            if j < blocks and fits[j][i] and backward[j + 1][i + clue[j] + 1]:
+                coverage[i] += 1
+                coverage[i + clue[j]] -= 1
+                may_be_empty[i + clue[j]] = True
+
+    solved: List[int] = list(line)
+    covered: int = 0
+    for i in range(length):
+        covered += coverage[i]
+        if not covered:
+            solved[i] = EMPTY
+        elif not may_be_empty[i]:
+            solved[i] = FILLED
+
+    return solved
+
+
+def _propagate(
+    grid: List[List[int]],
+    rows_clues: Sequence[Tuple[int]],
+    columns_clues: Sequence[Tuple[int]],
+    dirty_rows: Set[int],
+    dirty_columns: Set[int],
+) -> bool:
+    height: int = len(rows_clues)
+
+    while dirty_rows or dirty_columns:
+        while dirty_rows:
+            y: int = dirty_rows.pop()
+            solved = solve_line(grid[y], rows_clues[y])
+            if solved is None:
+                return False
+            for x, value in enumerate(solved):
+                if value != grid[y][x]:
+                    grid[y][x] = value
+                    dirty_columns.add(x)
+
+        while dirty_columns:
+            x: int = dirty_columns.pop()
+            solved = solve_line([grid[y][x] for y in range(height)], columns_clues[x])
+            if solved is None:
+                return False
+            for y, value in enumerate(solved):
+                if value != grid[y][x]:
+                    grid[y][x] = value
+                    dirty_rows.add(y)
+
+    return True
+
+
+def _pick_unknown(grid: List[List[int]]) -> Optional[Tuple[int]]:
+    # Branch on the row closest to being settled: it is the one most likely to
+    # collapse quickly once a guess is made.
+    best: Optional[Tuple[int]] = None
+    best_unknowns: int = 0
+    for y, row in enumerate(grid):
+        unknowns: int = row.count(UNKNOWN)
+        if unknowns and (best is None or unknowns < best_unknowns):
+            best = (row.index(UNKNOWN), y)
+            best_unknowns = unknowns
+            if unknowns == 1:
+                break
+
+    return best
+
+
+def _search(
+    grid: List[List[int]],
+    rows_clues: Sequence[Tuple[int]],
+    columns_clues: Sequence[Tuple[int]],
+    dirty_rows: Set[int],
+    dirty_columns: Set[int],
+    solutions: List[List[List[int]]],
+    limit: int,
+) -> None:
+    if not _propagate(grid, rows_clues, columns_clues, dirty_rows, dirty_columns):
+        return
+
+    unknown = _pick_unknown(grid)
+    if unknown is None:
+        solutions.append(grid)
+        return
+
+    x, y = unknown
+    for value in (FILLED, EMPTY):
+        branch: List[List[int]] = [row[:] for row in grid]
+        branch[y][x] = value
+        _search(branch, rows_clues, columns_clues, {y}, {x}, solutions, limit)
+
+        if len(solutions) >= limit:
+            return
+
+
+def find_solutions(
+    top_guides: Sequence[Sequence[int]],
+    left_guides: Sequence[Sequence[int]],
+    limit: int = 2,
+) -> List[Tuple[Tuple[int]]]:
+    rows_clues: List[Tuple[int]] = [normalize_clue(clue) for clue in left_guides]
+    columns_clues: List[Tuple[int]] = [normalize_clue(clue) for clue in top_guides]
+
+    grid: List[List[int]] = [[UNKNOWN] * len(columns_clues) for _ in rows_clues]
+    solutions: List[List[List[int]]] = []
+    _search(
+        grid,
+        rows_clues,
+        columns_clues,
+        set(range(len(rows_clues))),
+        set(range(len(columns_clues))),
+        solutions,
+        limit,
+    )
+
+    return [tuple(map(tuple, solution)) for solution in solutions]
+
+
+def solve(top_guides: Sequence[Sequence[int]], left_guides: Sequence[Sequence[int]]) -> SolveResult:
+    solutions: List[Tuple[Tuple[int]]] = find_solutions(top_guides, left_guides, limit=2)
+
+    if not solutions:
+        return SolveResult(SolveStatus.UNSOLVABLE, None)
+    if len(solutions) > 1:
+        return SolveResult(SolveStatus.AMBIGUOUS, None)
+
+    return SolveResult(SolveStatus.UNIQUE, solutions[0])
@@ -0,0 +1,142 @@
+import json
+import sys
+from argparse import ArgumentParser, ArgumentTypeError
+from enum import Enum
+from itertools import islice
+from time import perf_counter
+from typing import Dict, Final, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from pycross.library import MalformedPuzzle, PackEntry, check_puzzle, iter_pack
+from pycross.paths import PathLike
+from pycross.solver import SolveStatus, solve
+from pycross.workers import run_in_processes
+
+DEFAULT_CHUNK_SIZE: Final[int] = 64
+
+
+class VerifyStatus(Enum):
+    VALID = "valid"
+    CLUE_MISMATCH = "clue mismatch"
+    UNSOLVABLE = "unsolvable"
+    AMBIGUOUS = "ambiguous"
+    MALFORMED = "malformed"
+
+
+class Verdict(NamedTuple):
+    index: int
+    name: str
+    status: VerifyStatus
+    detail: str = ""
+
+
+def verify_puzzle(index: int, puzzle: PackEntry) -> Verdict:
+    """Check that the guides match the solution (when the puzzle has one), and that
+    the guides have exactly one solution."""
+    if isinstance(puzzle, MalformedPuzzle):
+        return Verdict(index, puzzle.name, VerifyStatus.MALFORMED, puzzle.error)
+
+    if puzzle.solution is not None:
+        try:
+            check_puzzle(puzzle)
+        except ValueError as error:
+            return Verdict(index, puzzle.name, VerifyStatus.CLUE_MISMATCH, str(error))
+
+    # Both sets of guides paint every cell once, so their totals must agree before any search
+    if sum(map(sum, puzzle.top_guides)) != sum(map(sum, puzzle.left_guides)):
+        return Verdict(index, puzzle.name, VerifyStatus.UNSOLVABLE, "Top and Left Guides paint a different number of cells")
+
+    result = solve(puzzle.top_guides, puzzle.left_guides)
+    if result.status is SolveStatus.UNSOLVABLE:
+        return Verdict(index, puzzle.name, VerifyStatus.UNSOLVABLE)
+    if result.status is SolveStatus.AMBIGUOUS:
+        return Verdict(index, puzzle.name, VerifyStatus.AMBIGUOUS)
+
+    return Verdict(index, puzzle.name, VerifyStatus.VALID)
+
+
+def _verify_chunk(start: int, puzzles: List[PackEntry]) -> List[Verdict]:
+    return [verify_puzzle(start + i, puzzle) for i, puzzle in enumerate(puzzles)]
+
+
+def _chunks(puzzles: Iterable[PackEntry], chunk_size: int) -> Iterator[Tuple[int, List[PackEntry]]]:
+    puzzles = iter(puzzles)
+    start: int = 0
+    while chunk := list(islice(puzzles, chunk_size)):
+        yield start, chunk
+        start += len(chunk)
+
+
+def verify_puzzles(
+    puzzles: Iterable[PackEntry], workers: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[Verdict]:
+    """Yield a verdict for every puzzle as soon as a worker finishes it, in no particular order."""
+    if chunk_size < 1:
+        raise ValueError(f"Chunk size must be at least 1, not {chunk_size}")
+
+    # Puzzles travel in chunks to keep the pickling overhead per puzzle low
+    for verdicts in run_in_processes(_verify_chunk, _chunks(puzzles, chunk_size), workers):
+        yield from verdicts
+
+
+def verify_pack(
+    source: PathLike, workers: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> dict:
+    """Verify every puzzle of a pack and summarise the outcome. Only the puzzles
+    with a problem are listed, ordered by their position in the pack."""
+    start: float = perf_counter()
+    counts: Dict[str, int] = {status.value: 0 for status in VerifyStatus}
+    problems: List[Verdict] = []
+
+    for verdict in verify_puzzles(iter_pack(source, check=False, malformed=True), workers, chunk_size):
+        counts[verdict.status.value] += 1
+        if verdict.status is not VerifyStatus.VALID:
+            problems.append(verdict)
+
+    elapsed: float = perf_counter() - start
+    total: int = sum(counts.values())
+    return {
+        "source": str(source),
+        "puzzles": total,
+        "seconds": round(elapsed, 3),
+        "puzzles_per_second": round(total / elapsed, 1) if elapsed else 0,
+        "counts": counts,
+        "problems": [
+            {"index": problem.index, "name": problem.name, "status": problem.status.value, "detail": problem.detail}
+            for problem in sorted(problems)
+        ],
+    }
+
+
+def _chunk_size(value: str) -> int:
+    chunk_size: int = int(value)
+    if chunk_size < 1:
+        raise ArgumentTypeError(f"chunk size must be at least 1, not {chunk_size}")
+
+    return chunk_size
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    parser = ArgumentParser(prog="pycross.verify", description="Check that every puzzle of a pack has one solution")
+    parser.add_argument("pack", help="puzzle pack: a .json, .jsonl or .non file, or a directory of them")
+    parser.add_argument("-o", "--report", help="JSON file the summary report is written to")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="worker processes (defaults to every core)")
+    parser.add_argument("--chunk-size", type=_chunk_size, default=DEFAULT_CHUNK_SIZE, help="puzzles sent to a worker at a time")
+    options = parser.parse_args(args)
+
+    report: dict = verify_pack(options.pack, options.workers, options.chunk_size)
+    if options.report is not None:
+        with open(options.report, "w", encoding="utf-8") as output:
+            json.dump(report, output, indent=2)
+
+    for problem in report["problems"]:
+        detail: str = f": {problem['detail']}" if problem["detail"] else ""
+        print(f"#{problem['index']} {problem['name']}: {problem['status']}{detail}")
+
+    counts: str = ", ".join(f"{count} {status}" for status, count in report["counts"].items())
+    print(f"Verified {report['puzzles']} puzzles in {report['seconds']}s ({counts})")
+    if report["problems"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
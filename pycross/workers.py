@@ -0,0 +1,25 @@
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Any, Callable, Iterable, Iterator, Optional, Set, Tuple
+
+
+def run_in_processes(function: Callable, arguments: Iterable[Tuple], workers: Optional[int] = None) -> Iterator[Any]:
+    """Yield `function(*args)` for every tuple of `arguments` as soon as a worker
+    process finishes it, in no particular order.
+
+    Arguments are drawn as tasks complete, and a bounded window of pending tasks
+    keeps memory flat however many there are.
+    """
+    workers = workers or os.cpu_count() or 1
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: Set[Future] = set()
+        for args in arguments:
+            pending.add(executor.submit(function, *args))
+            if len(pending) >= workers * 4:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                yield from (future.result() for future in done)
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            yield from (future.result() for future in done)
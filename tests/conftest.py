@@ -45,3 +45,7 @@ def almost_solved_state() -> Tuple[Tuple[int]]:
 @pytest.fixture()
 def pycross_app(game_parameters: Tuple[Tuple[int]]) -> Pycross:
     return Pycross(*game_parameters)
+
+@pytest.fixture()
+def virtual_pycross_app(game_parameters: Tuple[Tuple[int]]) -> Pycross:
+    return Pycross(*game_parameters, virtual_grid=True)
@@ -1,6 +1,10 @@
+import subprocess
+import sys
+
 import pytest
 
 from pycross.console_mode.game import Grid
+from pycross.recording import SET, UNDO, LoggedMove, MoveLog, read_move_log
 
 
 @pytest.fixture
@@ -36,19 +40,6 @@ def test_grid(test_grid_obj: Grid):
     assert test_grid_obj._board_matrix == board_matrix
 
 
-def test_check_solution_matrix(test_grid_obj: Grid):
-    solution: list[int] = [
-        [0, 1, 1, 1, 0],
-        [0, 0, 1, 0, 0],
-        [0, 1, 0, 1, 0],
-        [1, 0, 1, 0, 1],
-        [0, 1, 0, 1, 0],
-    ]
-
-    checked_solution: list[int] = test_grid_obj._check_solution_matrix(solution, 5, 5)
-
-    assert checked_solution == solution
-
 @pytest.mark.parametrize(
     "rows",
     [
@@ -56,7 +47,8 @@ def test_check_solution_matrix(test_grid_obj: Grid):
         ([0, 1, 1, 1], [0, 0, 1, 0, 0])
     ]
 )
-def test_check_solution_matrix_exception(test_grid_obj: Grid, rows: list[int]):
+def test_solution_matrix_exception(test_grid_data: tuple, rows: list[int]):
+    rows_guides, columns_guides, _ = test_grid_data
     solution: list[int] = [
         *rows,
         [0, 1, 0, 1, 0],
@@ -65,7 +57,7 @@ def test_check_solution_matrix_exception(test_grid_obj: Grid, rows: list[int]):
     ]
 
     with pytest.raises(ValueError):
-        test_grid_obj._check_solution_matrix(solution, 5, 5)
+        Grid(rows_guides, columns_guides, solution)
 
 
 def test_draw_frame(test_grid_obj: Grid):
@@ -219,3 +211,90 @@ def test_repr(test_grid_obj: Grid):
     )
 
     assert board_draw == str(test_grid_obj)
+
+def test_draw_changed_rows(test_grid_obj: Grid):
+    test_grid_obj._draw_changed_rows()
+
+    test_grid_obj.draw_pixel("3,3")
+    test_grid_obj.draw_pixel("3,4")
+    test_grid_obj.draw_pixel("d/3,4")
+
+    assert test_grid_obj._draw_changed_rows() == (
+        "\x1b[6;1H    1  1 [ ][ ][■][ ][ ]\x1b[K"
+    )
+    assert test_grid_obj._draw_changed_rows() == ""
+
+def test_draw_pixel_wraps_negative_coordinates(test_grid_obj: Grid):
+    test_grid_obj.draw_pixel("3,0")
+
+    assert test_grid_obj._board_matrix[2][4] == 1
+
+def test_from_solution(test_grid_data: tuple):
+    rows_guides, columns_guides, solution = test_grid_data
+
+    grid: Grid = Grid.from_solution(solution)
+
+    assert grid._rows_guides == rows_guides and grid._columns_guides == columns_guides
+    assert str(grid) == str(Grid(*test_grid_data))
+
+def test_undo_redo(test_grid_obj: Grid):
+    test_grid_obj.draw_pixel("3,3")
+    test_grid_obj.draw_pixel("3,3")
+    test_grid_obj.draw_pixel("d/3,3")
+
+    test_grid_obj.handle_input("u")
+    assert test_grid_obj._board_matrix[2][2] == 1
+
+    test_grid_obj.handle_input("u")
+    assert test_grid_obj._board_matrix[2][2] == 0
+    assert not test_grid_obj.undo()
+
+    test_grid_obj.handle_input("r")
+    assert test_grid_obj._board_matrix[2][2] == 1
+
+def test_save_restore_session(tmp_path, test_grid_data: tuple, test_grid_obj: Grid):
+    test_grid_obj.draw_pixel("1,2")
+    test_grid_obj.draw_pixel("1,3")
+    test_grid_obj.save_session(tmp_path / "game.session")
+
+    restored: Grid = Grid(*test_grid_data)
+    restored.restore_session(tmp_path / "game.session")
+
+    assert str(restored) == str(test_grid_obj)
+    assert restored.undo() and restored._board_matrix[0][2] == 0
+
+def test_record_moves(tmp_path, test_grid_data: tuple):
+    grid: Grid = Grid(*test_grid_data, record_path=tmp_path / "game.moves")
+    grid.draw_pixel("1,3")
+    grid.draw_pixel("d/1,3")
+    grid.draw_pixel("9,9")
+    grid.handle_input("u")
+    grid.close()
+
+    log: MoveLog = read_move_log(tmp_path / "game.moves")
+
+    assert log.moves == [LoggedMove(SET, 2, 0, 1), LoggedMove(SET, 2, 0, 0), LoggedMove(UNDO)]
+
+
+def test_record_restored_session(tmp_path, test_grid_data: tuple, test_grid_obj: Grid):
+    test_grid_obj.draw_pixel("1,2")
+    test_grid_obj.save_session(tmp_path / "game.session")
+
+    grid: Grid = Grid(*test_grid_data, record_path=tmp_path / "game.moves")
+    grid.restore_session(tmp_path / "game.session")
+    grid.draw_pixel("1,3")
+    grid.close()
+
+    log: MoveLog = read_move_log(tmp_path / "game.moves")
+
+    assert log.start.board == test_grid_obj._board_matrix
+    assert log.moves == [LoggedMove(SET, 2, 0, 1)]
+
+
+def test_console_mode_does_not_import_textual():
+    modules: str = subprocess.check_output(
+        [sys.executable, "-c", "import sys, pycross.console_mode.game; print(sorted(sys.modules))"],
+        text=True,
+    )
+
+    assert "textual" not in modules
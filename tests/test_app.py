@@ -1,8 +1,10 @@
 from typing import Tuple
 
 import pytest
+from textual.geometry import Size
 
 from pycross import Pycross
+from pycross.app import GameState, board_layout
 
 
 @pytest.mark.parametrize(
@@ -53,3 +55,87 @@ def test_init_incorrect_guides(top_guides: Tuple[Tuple[int]], left_guides: Tuple
 
     with pytest.raises(ValueError):
         Pycross(top_guides, left_guides, solution)
+
+
+def test_game_state_tracks_mismatches(game_parameters: Tuple[Tuple[int]]):
+    *_, solution = game_parameters
+    game_state = GameState(solution)
+
+    for y, row in enumerate(solution):
+        for x, cell in enumerate(row):
+            if cell:
+                game_state.update_state(x, y)
+
+    assert game_state.solved
+
+    game_state.update_state(0, 0)
+    assert not game_state.solved
+
+    game_state.update_state(0, 0)
+    assert game_state.solved
+
+
+def test_from_solution(game_parameters: Tuple[Tuple[int]]):
+    top_guides, left_guides, solution = game_parameters
+    app = Pycross.from_solution([list(row) for row in solution])
+
+    assert (app.top_guides, app.left_guides, app.game_state.solution) == (top_guides, left_guides, solution)
+
+
+def test_game_state_undo_redo(game_parameters: Tuple[Tuple[int]]):
+    *_, solution = game_parameters
+    game_state = GameState(solution)
+    game_state.update_state(0, 0)
+    game_state.update_state(1, 0)
+
+    assert game_state.undo() == [(1, 0, 0)]
+    assert (game_state.state[0][0], game_state.state[0][1]) == (1, 0)
+
+    assert game_state.undo() == [(0, 0, 0)]
+    assert game_state.undo() == []
+    assert game_state.state.filled() == 0
+
+    assert game_state.redo() == [(0, 0, 0)]
+    assert game_state.state[0][0] == 1
+
+
+def test_game_state_paint_region(game_parameters: Tuple[Tuple[int]]):
+    *_, solution = game_parameters
+    game_state = GameState(solution)
+    game_state.update_state(1, 0)
+
+    moves = game_state.paint_region(0, 0, 5, 1, 1)
+
+    assert [(move.x, move.y) for move in moves] == [(0, 0), (2, 0), (3, 0), (4, 0)]
+    assert game_state.state[0] == [1, 1, 1, 1, 1]
+
+    # The whole stroke comes back in a single undo
+    assert len(game_state.undo()) == 4
+    assert game_state.state[0] == [0, 1, 0, 0, 0]
+
+    with pytest.raises(IndexError):
+        game_state.paint_region(3, 0, 3, 1, 1)
+
+
+def test_game_state_paint_region_solves(game_parameters: Tuple[Tuple[int]]):
+    *_, solution = game_parameters
+    game_state = GameState(solution)
+    game_state.paint_region(0, 0, 5, 5, 1)
+
+    for y, row in enumerate(solution):
+        for x, cell in enumerate(row):
+            if not cell:
+                game_state.paint_region(x, y, 1, 1, 0)
+
+    assert game_state.solved
+
+
+def test_board_layout_is_cached():
+    board_layout.cache_clear()
+    first = board_layout(5, 5, 5, 3, Size(50, 24), False)
+
+    assert board_layout(5, 5, 5, 3, Size(50, 24), False) is first
+    assert board_layout.cache_info().hits == 1
+    assert (first.tile_width, first.tile_height) == (6, 3)
+    assert board_layout(5, 5, 5, 3, Size(50, 14), False).tile_width < 6
+    assert board_layout(5, 5, 5, 3, None, False) == first
@@ -0,0 +1,80 @@
+from copy import deepcopy
+from typing import List, Tuple
+
+import pytest
+
+from pycross.bitboard import BitBoard, mask_clue, pack_line
+
+
+@pytest.fixture
+def board(game_parameters: Tuple[Tuple[int]]) -> BitBoard:
+    *_, solution = game_parameters
+    return BitBoard.from_matrix(solution)
+
+
+@pytest.mark.parametrize(
+    "line, clue",
+    (
+        pytest.param([0, 0, 0, 0], (), id="Empty line"),
+        pytest.param([1, 1, 1, 1], (4,), id="Full line"),
+        pytest.param([1, 0, 1, 1, 0, 0, 1], (1, 2, 1), id="Several runs"),
+        pytest.param([0, 0, 1, 1, 1, 0], (3,), id="Padded run"),
+    )
+)
+def test_mask_clue(line: List[int], clue: Tuple[int]):
+    assert mask_clue(pack_line(line)) == clue
+
+
+def test_from_matrix_round_trip(board: BitBoard, game_parameters: Tuple[Tuple[int]]):
+    *_, solution = game_parameters
+
+    assert board.to_matrix() == [list(row) for row in solution]
+    assert board == solution
+    assert (board.width, board.height) == (5, 5)
+
+
+def test_get_set_toggle():
+    board = BitBoard(3, 2)
+
+    assert board.set(2, 1, 1) == 0
+    assert board.get(2, 1) == 1
+    assert board.toggle(2, 1) == 0
+    assert board.toggle(0, 0) == 1
+    assert board.rows == [0b001, 0b000]
+
+
+def test_row_views(board: BitBoard):
+    board[0][0] = 1
+
+    assert board[0] == [1, 1, 1, 1, 0]
+    assert board[-1][-2] == 1
+    assert deepcopy(board) == board
+
+
+@pytest.mark.parametrize("x, y", ((5, 0), (0, 5), (-6, 0)))
+def test_index_out_of_range(board: BitBoard, x: int, y: int):
+    with pytest.raises(IndexError):
+        board.get(x, y)
+
+
+def test_clues(board: BitBoard, game_parameters: Tuple[Tuple[int]]):
+    top_guides, left_guides, _ = game_parameters
+
+    assert tuple(board.row_clue(y) for y in range(board.height)) == left_guides
+    assert tuple(board.column_clue(x) for x in range(board.width)) == top_guides
+    assert board.transpose().transpose() == board
+
+
+def test_mismatches(board: BitBoard):
+    other = BitBoard(5, 5)
+
+    assert board.mismatches(other) == board.filled() == 11
+
+
+def test_filled_cells(board: BitBoard, game_parameters: Tuple[Tuple[int]]):
+    *_, solution = game_parameters
+
+    assert list(board.filled_cells()) == [
+        (x, y) for y, row in enumerate(solution) for x, cell in enumerate(row) if cell
+    ]
+    assert list(BitBoard(3, 2).filled_cells()) == []
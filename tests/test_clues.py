@@ -0,0 +1,65 @@
+from typing import List, Tuple
+
+import pytest
+
+from pycross.bitboard import BitBoard, pack_line
+from pycross.clues import LineStatus, RunLengths, generate_clues, line_status
+
+
+@pytest.mark.parametrize(
+    "line, clue, status",
+    (
+        pytest.param([0, 0, 0, 0, 0], (3,), LineStatus.PENDING, id="Empty line"),
+        pytest.param([0, 1, 1, 0, 0], (3,), LineStatus.PENDING, id="Block in progress"),
+        pytest.param([0, 1, 1, 1, 0], (3,), LineStatus.COMPLETE, id="Clue satisfied"),
+        pytest.param([0, 0, 0, 0, 0], (), LineStatus.COMPLETE, id="Empty clue"),
+        pytest.param([1, 1, 1, 1, 0], (3,), LineStatus.ERROR, id="Too many painted cells"),
+        pytest.param([1, 0, 0, 0, 1], (3,), LineStatus.ERROR, id="Painted cells cannot be covered"),
+    )
+)
+def test_line_status(line: List[int], clue: Tuple[int], status: LineStatus):
+    assert line_status(pack_line(line), len(line), clue) is status
+
+
+def test_generate_clues(game_parameters: Tuple[Tuple[int]]):
+    top_guides, left_guides, solution = game_parameters
+
+    assert generate_clues(solution) == (top_guides, left_guides)
+
+
+def test_generate_clues_empty_lines():
+    assert generate_clues([[0, 0, 0], [1, 0, 1]]) == (((1,), (), (1,)), ((), (1, 1)))
+
+
+def test_generate_clues_numpy(game_parameters: Tuple[Tuple[int]]):
+    np = pytest.importorskip("numpy")
+    top_guides, left_guides, solution = game_parameters
+
+    assert generate_clues(np.array(solution)) == (top_guides, left_guides)
+    assert generate_clues(np.zeros((2, 3), dtype=int)) == (((), (), ()), ((), ()))
+
+
+def test_generate_clues_exception():
+    with pytest.raises(ValueError):
+        generate_clues([[0, 1, 0], [1, 0]])
+
+
+def test_run_lengths(game_parameters: Tuple[Tuple[int]]):
+    top_guides, left_guides, solution = game_parameters
+    runs = RunLengths(top_guides, left_guides)
+    board = BitBoard(5, 5)
+
+    assert runs.unmatched == 10 and not runs.matches
+
+    board.set(0, 3, 1)
+    runs.update(board, [(0, 3)])
+
+    assert runs.rows_runs[3] == (1,) and runs.columns_runs[0] == (1,)
+    assert runs.unmatched == 9
+
+    runs.reset(BitBoard.from_matrix(solution))
+
+    assert runs.matches
+    # A board that does not fit the clues is rejected instead of compared in part
+    with pytest.raises(ValueError):
+        runs.reset(BitBoard(6, 5))
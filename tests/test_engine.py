@@ -0,0 +1,163 @@
+import subprocess
+import sys
+from typing import Tuple
+
+import pytest
+
+from pycross.clues import COLUMN, ROW, LineChange, LineStatus
+from pycross.engine import CLUES_WIN, SOLUTION_WIN, GameState, check_game_parameters
+
+
+def test_check_game_parameters(game_parameters: Tuple[Tuple[int]]):
+    top_guides, left_guides, solution = game_parameters
+
+    check_game_parameters(top_guides, left_guides, solution)
+    with pytest.raises(ValueError, match="rows"):
+        check_game_parameters(top_guides, left_guides[:-1], solution)
+    with pytest.raises(ValueError, match="columns"):
+        check_game_parameters(top_guides[:-1], left_guides, solution)
+
+
+def test_line_changes_only_report_touched_lines(game_parameters: Tuple[Tuple[int]]):
+    top_guides, left_guides, solution = game_parameters
+    game_state = GameState(solution, top_guides, left_guides)
+
+    assert game_state.line_changes() == []
+
+    for x in (1, 2, 3):
+        game_state.set_cell(x, 0, 1)
+
+    assert game_state.line_changes() == [LineChange(ROW, 0, LineStatus.COMPLETE)]
+    assert game_state.line_changes() == []
+
+    game_state.set_cell(0, 0, 1)
+    assert game_state.line_changes() == [
+        LineChange(ROW, 0, LineStatus.ERROR),
+        LineChange(COLUMN, 0, LineStatus.COMPLETE),
+    ]
+
+
+def test_set_cell(game_parameters: Tuple[Tuple[int]]):
+    *_, solution = game_parameters
+    game_state = GameState(solution)
+
+    assert game_state.set_cell(-1, -1, 1) == 0
+    assert game_state.set_cell(4, 4, 1) == 1
+    assert game_state.state.rows[4] == 1 << 4
+    assert len(game_state.history) == 1
+
+    assert game_state.undo() == [(4, 4, 0)]
+    assert game_state.state.rows[4] == 0
+
+
+def test_update_state_wraps_negative_indices():
+    game_state = GameState(((1,),))
+
+    assert game_state.update_state(-1, 0) == 1
+    assert game_state.solved
+    assert game_state.undo() == [(0, 0, 0)]
+    assert not game_state.solved
+
+    with pytest.raises(IndexError):
+        game_state.update_state(1, 0)
+    assert len(game_state.history) == 0
+
+
+def test_reset(game_parameters: Tuple[Tuple[int]]):
+    *_, solution = game_parameters
+    game_state = GameState(solution)
+    game_state.state = solution
+    assert game_state.solved
+
+    game_state.line_changes()
+
+    cleared = game_state.reset()
+
+    assert sorted(cleared) == sorted((x, y) for y, row in enumerate(solution) for x, cell in enumerate(row) if cell)
+    assert not game_state.solved
+    assert not game_state.history.can_undo
+    assert game_state.state.rows == [0] * game_state.height
+    assert {(axis, index) for axis, index, _ in game_state.line_changes()} <= {
+        (axis, index) for x, y in cleared for axis, index in ((ROW, y), (COLUMN, x))
+    }
+
+
+def test_engine_imports_no_front_end_or_io_layer():
+    modules: str = subprocess.check_output(
+        [sys.executable, "-c", "import sys, pycross.engine; print(sorted(sys.modules))"],
+        text=True,
+    )
+
+    assert "textual" not in modules
+    assert "numpy" not in modules
+    assert "pycross.library" not in modules
+
+
+def test_clue_win_accepts_any_solution():
+    # Either diagonal satisfies these guides
+    guides = ((1,), (1,))
+    game_state = GameState(None, guides, guides)
+
+    assert game_state.win_mode == CLUES_WIN
+    game_state.set_cell(1, 0, 1)
+    game_state.set_cell(0, 1, 1)
+    assert game_state.solved
+
+    game_state.undo()
+    assert not game_state.solved
+
+    # Switching to the other diagonal wins as well
+    game_state.set_cell(1, 0, 0)
+    game_state.paint_region(0, 0, 2, 2, 1)
+    assert not game_state.solved
+    game_state.paint_region(1, 0, 1, 1, 0)
+    game_state.paint_region(0, 1, 1, 1, 0)
+    assert game_state.solved
+
+
+def test_solution_win_rejects_other_solutions():
+    guides = ((1,), (1,))
+    game_state = GameState(((1, 0), (0, 1)), guides, guides)
+    game_state.state = ((0, 1), (1, 0))
+
+    assert game_state.win_mode == SOLUTION_WIN and not game_state.solved
+
+
+@pytest.mark.parametrize(
+    "arguments",
+    (
+        pytest.param((None,), id="No guides"),
+        pytest.param((None, ((1,),), ((1,),), 8, SOLUTION_WIN), id="No solution to match"),
+        pytest.param((((1,),), None, None, 8, "cells"), id="Unknown win mode"),
+    )
+)
+def test_win_mode_exceptions(arguments):
+    with pytest.raises(ValueError):
+        GameState(*arguments)
+
+
+def test_clue_win_sessions(tmp_path):
+    guides = ((1,), (1,))
+    game_state = GameState(None, guides, guides)
+    game_state.set_cell(0, 0, 1)
+    game_state.save(tmp_path / "game.session")
+
+    restored = GameState(None, guides, guides)
+    restored.restore(tmp_path / "game.session")
+
+    assert restored.state.rows == [1, 0]
+    with pytest.raises(ValueError):
+        GameState(None, ((1,), (1,), ()), ((1,), (1,), ())).restore(tmp_path / "game.session")
+
+
+def test_sessions_carry_over_win_modes(tmp_path, game_parameters: Tuple[Tuple[int]]):
+    top_guides, left_guides, solution = game_parameters
+    game_state = GameState(solution, top_guides, left_guides)
+    game_state.set_cell(1, 0, 1)
+    game_state.save(tmp_path / "game.session")
+
+    restored = GameState(None, top_guides, left_guides)
+    restored.restore(tmp_path / "game.session")
+
+    assert restored.checksum() == game_state.checksum()
+    assert restored.state == game_state.state
@@ -0,0 +1,68 @@
+import random
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from pycross.clues import generate_clues
+from pycross.generator import BOTH, HORIZONTAL, ROTATIONAL, VERTICAL, generate_puzzle, generate_puzzles, main, random_solution
+from pycross.library import load_pack
+from pycross.solver import SolveStatus, solve
+
+
+@pytest.mark.parametrize(
+    "symmetry, mirror",
+    (
+        pytest.param(HORIZONTAL, lambda grid: [row[::-1] for row in grid], id="Horizontal"),
+        pytest.param(VERTICAL, lambda grid: grid[::-1], id="Vertical"),
+        pytest.param(BOTH, lambda grid: [row[::-1] for row in grid[::-1]], id="Both"),
+        pytest.param(ROTATIONAL, lambda grid: [row[::-1] for row in grid[::-1]], id="Rotational"),
+    )
+)
+def test_random_solution_symmetry(symmetry: str, mirror):
+    grid: List[List[int]] = random_solution(7, 6, 0.5, symmetry, random.Random(0))
+
+    assert mirror(grid) == grid
+
+
+def test_random_solution_density():
+    grid: List[List[int]] = random_solution(20, 20, 1.0, rng=random.Random(0))
+
+    assert all(all(row) for row in grid)
+
+
+def test_random_solution_exception():
+    with pytest.raises(ValueError):
+        random_solution(5, 5, symmetry="diagonal")
+
+
+def test_generate_puzzle_is_unique():
+    puzzle = generate_puzzle(10, 10, seed=3)
+
+    assert generate_clues(puzzle.solution) == (puzzle.top_guides, puzzle.left_guides)
+    assert solve(puzzle.top_guides, puzzle.left_guides).status is SolveStatus.UNIQUE
+    assert puzzle.name == "generated-10x10-3"
+
+
+def test_generate_unseeded_puzzle_names():
+    names = {generate_puzzle(5, 5).name for _ in range(5)}
+
+    assert len(names) == 5 and not any(name.endswith("None") for name in names)
+
+
+def test_generate_puzzles():
+    puzzles = list(generate_puzzles(4, 5, 8, seed=1, workers=2))
+
+    assert len(puzzles) == 4 and all(5 <= puzzle.width <= 8 for puzzle in puzzles if puzzle)
+
+
+def test_main(tmp_path: Path, capsys: pytest.CaptureFixture):
+    output: Path = tmp_path / "generated.jsonl"
+
+    main([str(output), "-n", "3", "--min-size", "6", "-j", "1"])
+    seed: str = capsys.readouterr().out.splitlines()[0].split()[1]
+    main([str(tmp_path / "again.jsonl"), "-n", "3", "--min-size", "6", "-j", "1", "--seed", seed])
+
+    assert len(load_pack(output)) == 3
+    # Puzzles are written as workers finish them, so only the order may differ
+    assert sorted(load_pack(tmp_path / "again.jsonl")) == sorted(load_pack(output))
@@ -0,0 +1,65 @@
+from typing import Tuple
+
+import pytest
+
+from pycross import hints
+from pycross.engine import GameState
+from pycross.hints import Hint, HintEngine
+from pycross.solver import EMPTY, FILLED
+
+
+def test_hints_solve_puzzle(game_parameters: Tuple[Tuple[int]]):
+    *_, solution = game_parameters
+    game_state = GameState(solution)
+
+    hint = game_state.hint()
+    while hint is not None:
+        assert hint.value == FILLED and solution[hint.y][hint.x] == 1
+        game_state.update_state(hint.x, hint.y)
+        hint = game_state.hint()
+
+    assert game_state.solved
+
+
+@pytest.mark.parametrize(
+    "painted, expected",
+    (
+        pytest.param([(0, 1)], Hint(0, 1, EMPTY), id="Too many blocks in a row"),
+        pytest.param([(0, 0), (4, 0)], Hint(0, 0, EMPTY), id="Run does not fit"),
+    )
+)
+def test_hint_mistakes(game_parameters: Tuple[Tuple[int]], painted: list, expected: Hint):
+    *_, solution = game_parameters
+    game_state = GameState(solution)
+    for x, y in painted:
+        game_state.update_state(x, y)
+
+    assert game_state.hint() == expected
+
+
+def test_hint_ignores_solution(game_parameters: Tuple[Tuple[int]]):
+    top_guides, left_guides, solution = game_parameters
+    game_state = GameState([[0] * 5] * 5, top_guides, left_guides)
+
+    assert game_state.hint() == GameState(solution).hint()
+
+
+def test_hint_solves_only_changed_lines(monkeypatch: pytest.MonkeyPatch, game_parameters: Tuple[Tuple[int]]):
+    top_guides, left_guides, solution = game_parameters
+    engine = HintEngine(top_guides, left_guides)
+    game_state = GameState(solution)
+
+    solved_lines: list = []
+    solve_line = hints.solve_line
+    monkeypatch.setattr(hints, "solve_line", lambda line, clue: solved_lines.append(clue) or solve_line(line, clue))
+
+    engine.hint(game_state.state)
+    first_run: int = len(solved_lines)
+
+    solved_lines.clear()
+    engine.hint(game_state.state)
+    assert solved_lines == []
+
+    game_state.update_state(2, 0)
+    engine.hint(game_state.state)
+    assert 0 < len(solved_lines) < first_run
@@ -0,0 +1,59 @@
+import pytest
+
+from pycross.history import Move, MoveHistory
+
+
+def test_undo_redo_order():
+    history = MoveHistory()
+    history.record(1, 2, 0)
+    history.record(3, 4, 1)
+
+    assert history.undo() == Move(3, 4, 1)
+    assert history.undo() == Move(1, 2, 0)
+    assert history.undo() is None
+
+    assert history.redo() == Move(1, 2, 0)
+    assert history.redo() == Move(3, 4, 1)
+    assert history.redo() is None
+
+
+def test_record_clears_redo():
+    history = MoveHistory()
+    history.record(0, 0, 0)
+    history.undo()
+    history.record(1, 1, 0)
+
+    assert not history.can_redo
+    assert history.undo() == Move(1, 1, 0)
+
+
+def test_limit_forgets_oldest_moves():
+    history = MoveHistory(limit=3)
+    for x in range(5):
+        history.record(x, 0, 0)
+
+    assert len(history) == 3
+    assert [history.undo().x for _ in range(3)] == [4, 3, 2]
+    assert history.undo() is None
+
+
+def test_invalid_history():
+    with pytest.raises(ValueError):
+        MoveHistory(limit=0)
+
+    with pytest.raises(ValueError):
+        MoveHistory().record(-1, 0, 0)
+
+
+def test_strokes():
+    history = MoveHistory()
+    history.record(0, 0, 0)
+    history.record_stroke([Move(1, 0, 0), Move(2, 0, 0), Move(3, 0, 0)])
+
+    assert history.undo_stroke() == [Move(3, 0, 0), Move(2, 0, 0), Move(1, 0, 0)]
+    assert history.undo_stroke() == [Move(0, 0, 0)]
+    assert history.undo_stroke() == []
+
+    assert history.redo_stroke() == [Move(0, 0, 0)]
+    assert history.redo_stroke() == [Move(1, 0, 0), Move(2, 0, 0), Move(3, 0, 0)]
+    assert history.redo_stroke() == []
@@ -1,10 +1,13 @@
 from copy import deepcopy
-from typing import List
+from typing import List, Tuple
 
 import pytest
 
 from pycross import Pycross
-from pycross.app import GameGrid, Tile, WinnerMessage
+from pycross.app import Board, GameGrid, GameState, Tile, VirtualGameGrid, WinnerMessage
+from pycross.bitboard import BitBoard
+from pycross.clues import LineStatus
+from pycross.session import load_session
 
 
 async def test_key_paint_tile(pycross_app: Pycross):
@@ -102,3 +105,241 @@ async def test_replay(pycross_app: Pycross, almost_solved_state: List[List[int]]
             not pycross_app.query_one(GameGrid).disabled and
             pycross_app.query_exactly_one(f"#tile_0_0").has_focus
         )
+
+
+async def test_virtual_key_paint_tile(virtual_pycross_app: Pycross):
+    async with virtual_pycross_app.run_test() as pilot:
+        await pilot.press("right", "down", "z")
+        grid: VirtualGameGrid = virtual_pycross_app.query_one(VirtualGameGrid)
+
+        assert (
+            grid.has_focus and
+            (grid.cursor_x, grid.cursor_y) == (1, 1) and
+            grid.painted[1][1] == 1 and
+            virtual_pycross_app.game_state.state[1][1] == 1
+        )
+
+
+async def test_virtual_click_paint_tile(virtual_pycross_app: Pycross):
+    async with virtual_pycross_app.run_test() as pilot:
+        grid: VirtualGameGrid = virtual_pycross_app.query_one(VirtualGameGrid)
+        await pilot.click(VirtualGameGrid, offset=(1 + 3 * VirtualGameGrid.TILE_WIDTH, 1 + 2 * VirtualGameGrid.TILE_HEIGHT))
+
+        assert (
+            (grid.cursor_x, grid.cursor_y) == (3, 2) and
+            grid.painted[2][3] == 1 and
+            virtual_pycross_app.game_state.state[2][3] == 1
+        )
+
+
+@pytest.mark.parametrize(
+    "start, target, key_press",
+    (
+        pytest.param((2, 2), (2, 1), "up", id="Move up from center"),
+        pytest.param((2, 2), (3, 2), "right", id="Move right from center"),
+        pytest.param((0, 0), (0, 0), "left", id="Keep position, can't go further left"),
+        pytest.param((4, 4), (4, 4), "down", id="Keep position, can't go further down"),
+    )
+)
+async def test_virtual_traverse_grid(virtual_pycross_app: Pycross, start: Tuple[int], target: Tuple[int], key_press: str):
+    async with virtual_pycross_app.run_test() as pilot:
+        grid: VirtualGameGrid = virtual_pycross_app.query_one(VirtualGameGrid)
+        grid.move_cursor_to(*start)
+
+        await pilot.press(key_press)
+        assert (grid.cursor_x, grid.cursor_y) == target
+
+
+async def test_virtual_win_and_replay(virtual_pycross_app: Pycross, almost_solved_state: List[List[int]]):
+    virtual_pycross_app.game_state.state = almost_solved_state
+
+    async with virtual_pycross_app.run_test() as pilot:
+        grid: VirtualGameGrid = virtual_pycross_app.query_one(VirtualGameGrid)
+        grid.painted = BitBoard.from_matrix(almost_solved_state)
+        grid.move_cursor_to(2, 0)
+        await pilot.press("z")
+
+        assert virtual_pycross_app.game_state.solved and grid.disabled
+
+        await pilot.press("r")
+        assert (
+            not virtual_pycross_app.game_state.solved and
+            not grid.disabled and
+            grid.has_focus and
+            grid.painted.filled() == 0 and
+            (grid.cursor_x, grid.cursor_y) == (0, 0) and
+            "visible" not in virtual_pycross_app.query_one(WinnerMessage).classes
+        )
+
+
+async def test_tile_index(pycross_app: Pycross):
+    async with pycross_app.run_test():
+        grid: GameGrid = pycross_app.query_one(GameGrid)
+
+        assert (
+            pycross_app._grid is grid and
+            all(grid.tile(tile.x, tile.y) is tile for tile in pycross_app.query(Tile))
+        )
+
+
+async def test_guides_status(pycross_app: Pycross):
+    async with pycross_app.run_test() as pilot:
+        for tile_id in ("#tile_1_0", "#tile_2_0", "#tile_3_0", "#tile_4_1", "#tile_4_2"):
+            await pilot.click(tile_id)
+
+        board: Board = pycross_app.query_one(Board)
+
+        assert (
+            "guide-complete" in board.left_frame.labels[0].classes and
+            "guide-error" in board.top_frame.labels[4].classes and
+            not board.left_frame.labels[2].classes & {"guide-complete", "guide-error"}
+        )
+
+
+async def test_virtual_guides_status(virtual_pycross_app: Pycross):
+    async with virtual_pycross_app.run_test() as pilot:
+        grid: VirtualGameGrid = virtual_pycross_app.query_one(VirtualGameGrid)
+        for x, y in ((1, 0), (2, 0), (3, 0), (4, 1), (4, 2)):
+            grid.move_cursor_to(x, y)
+            grid.focus()
+            await pilot.press("z")
+
+        board: Board = virtual_pycross_app.query_one(Board)
+
+        assert (
+            board.left_frame.statuses[0] is LineStatus.COMPLETE and
+            board.top_frame.statuses[4] is LineStatus.ERROR and
+            board.left_frame.statuses[2] is LineStatus.PENDING and
+            board.left_frame.render_line(0).text.strip() == "3"
+        )
+
+
+async def test_undo_redo_keys(pycross_app: Pycross):
+    async with pycross_app.run_test() as pilot:
+        await pilot.click("#tile_1_0")
+        await pilot.press("u")
+
+        assert "painted" not in pycross_app.query_one("#tile_1_0").classes
+        assert pycross_app.game_state.state[0][1] == 0
+
+        await pilot.press("y")
+
+        assert "painted" in pycross_app.query_one("#tile_1_0").classes
+        assert pycross_app.game_state.state[0][1] == 1
+
+
+@pytest.mark.parametrize("virtual_grid", (False, True), ids=("Tiles", "Virtual grid"))
+async def test_restore_session(tmp_path, game_parameters: Tuple[Tuple[int]], almost_solved_state: List[List[int]], virtual_grid: bool):
+    *_, solution = game_parameters
+    saved_state = GameState(solution)
+    saved_state.state = almost_solved_state
+    saved_state.save(tmp_path / "game.session")
+
+    app = Pycross(*game_parameters, virtual_grid=virtual_grid, session_path=tmp_path / "game.session")
+    async with app.run_test() as pilot:
+        grid = app.query_one(VirtualGameGrid if virtual_grid else GameGrid)
+        if virtual_grid:
+            assert grid.painted == almost_solved_state
+        else:
+            assert all(
+                ("painted" in tile.classes) == bool(almost_solved_state[tile.y][tile.x])
+                for tile in grid.tiles
+            )
+
+        await pilot.click(VirtualGameGrid if virtual_grid else "#tile_0_0", offset=(1, 1))
+        await pilot.press("s")
+
+        assert load_session(tmp_path / "game.session").board == app.game_state.state != almost_solved_state
+
+
+async def test_drag_paint_region(pycross_app: Pycross):
+    async with pycross_app.run_test() as pilot:
+        await pilot.mouse_down("#tile_1_0")
+        await pilot.mouse_up("#tile_3_1")
+        await pilot.pause()
+
+        grid: GameGrid = pycross_app.query_one(GameGrid)
+        painted = {(tile.x, tile.y) for tile in grid.tiles if "painted" in tile.classes}
+
+        assert painted == {(1, 0), (2, 0), (3, 0), (1, 1), (2, 1), (3, 1)}
+        assert pycross_app.game_state.state.filled() == 6
+
+        await pilot.press("u")
+
+        assert pycross_app.game_state.state.filled() == 0
+        assert not any("painted" in tile.classes for tile in grid.tiles)
+
+
+async def test_virtual_drag_paint_region(virtual_pycross_app: Pycross):
+    async with virtual_pycross_app.run_test() as pilot:
+        await pilot.mouse_down(VirtualGameGrid, offset=(2, 2))
+        await pilot.mouse_up(VirtualGameGrid, offset=(2, 4))
+        await pilot.pause()
+
+        grid: VirtualGameGrid = virtual_pycross_app.query_one(VirtualGameGrid)
+
+        assert grid.painted == virtual_pycross_app.game_state.state
+        assert grid.painted.filled() == 3 and grid.painted.filled_in(0, 1, 1, 3) == 3
+
+
+async def test_fill_row_and_column(pycross_app: Pycross):
+    async with pycross_app.run_test() as pilot:
+        await pilot.click("#tile_2_1")
+        await pilot.press("f")
+
+        assert pycross_app.game_state.state[1] == [1, 1, 1, 1, 1]
+
+        await pilot.press("f")
+        await pilot.press("g")
+
+        assert pycross_app.game_state.state.to_matrix() == [[0, 0, 1, 0, 0]] * 5
+        assert "painted" in pycross_app.query_one("#tile_2_4").classes
+
+
+async def test_hint_focuses_tile(pycross_app: Pycross):
+    async with pycross_app.run_test() as pilot:
+        await pilot.click("#tile_0_0")
+        await pilot.click("#tile_0_0")
+        await pilot.press("h")
+
+        assert pycross_app.focused is pycross_app.query_one("#tile_2_0")
+
+
+async def test_larger_tile_board():
+    solution: List[List[int]] = [[(x + y) % 3 == 0 for x in range(12)] for y in range(12)]
+    app: Pycross = Pycross.from_solution(solution, virtual_grid=False)
+    async with app.run_test(size=(120, 60)) as pilot:
+        await pilot.click("#tile_11_11")
+
+        tile: Tile = app.query_one("#tile_11_11")
+        assert app.game_state.state[11][11] == 1 and "painted" in tile.classes
+        assert (tile.region.width, tile.region.height) == (app._board.board_layout.tile_width, app._board.board_layout.tile_height)
+        assert tile.region.right <= app.query_one(GameGrid).region.right
+
+
+async def test_resize_rescales_tiles(pycross_app: Pycross):
+    async with pycross_app.run_test(size=(80, 34)) as pilot:
+        board: Board = pycross_app.query_one(Board)
+        tile: Tile = pycross_app.query_one("#tile_4_4")
+        assert board.board_layout.tile_width == 6
+
+        await pilot.resize_terminal(60, 20)
+        await pilot.pause()
+
+        assert pycross_app.query_one("#tile_4_4") is tile
+        assert (tile.region.width, tile.region.height) == (2, 1)
+        assert "compact" in pycross_app.query_one(GameGrid).classes
+
+        await pilot.click("#tile_4_4")
+        assert pycross_app.game_state.state[4][4] == 1
+
+
+async def test_win_by_clues_with_another_solution():
+    guides = ((1,), (1,))
+    app: Pycross = Pycross(guides, guides, ((1, 0), (0, 1)), win_mode="clues")
+    async with app.run_test() as pilot:
+        await pilot.click("#tile_1_0")
+        await pilot.click("#tile_0_1")
+
+        assert app.game_state.solved and app.query_one(GameGrid).disabled
+        assert "visible" in app.query_one(WinnerMessage).classes
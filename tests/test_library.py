@@ -0,0 +1,126 @@
+import json
+from pathlib import Path
+from typing import Tuple
+
+import pytest
+
+from pycross.library import Puzzle, PuzzleLibrary, check_puzzle, load_pack, load_puzzle, open_library, parse_non, write_cache
+
+NON_PUZZLE: str = """
+catalogue "pycross"
+title "Cat"
+width 5
+height 5
+
+rows
+3
+1
+1,1
+1,1,1
+1,1
+
+columns
+1
+1,1,1
+2,1
+1,1,1
+1
+
+goal "0111000100010101010101010"
+"""
+
+
+@pytest.fixture
+def puzzle(game_parameters: Tuple[Tuple[int]]) -> Puzzle:
+    return Puzzle("Cat", *game_parameters)
+
+
+@pytest.fixture
+def json_pack(tmp_path: Path, puzzle: Puzzle) -> Path:
+    entries = [puzzle._asdict() for _ in range(3)]
+    entries[1]["name"] = "No solution"
+    del entries[1]["solution"]
+
+    path = tmp_path / "pack.json"
+    path.write_text(json.dumps({"puzzles": entries}))
+    return path
+
+
+def test_parse_non(puzzle: Puzzle):
+    assert parse_non(NON_PUZZLE) == puzzle
+
+
+@pytest.mark.parametrize(
+    "solution",
+    (
+        pytest.param(((0, 1, 1, 1, 0),), id="Incorrect number of rows"),
+        pytest.param(((0, 1, 1, 1),) * 5, id="Incorrect number of columns"),
+        pytest.param(((1, 1, 1, 0, 0),) + ((0, 0, 1, 0, 0),) * 4, id="Guides do not match solution"),
+    )
+)
+def test_check_puzzle_exception(puzzle: Puzzle, solution: Tuple[Tuple[int]]):
+    with pytest.raises(ValueError):
+        check_puzzle(puzzle._replace(solution=solution))
+
+
+def test_load_pack_directory(tmp_path: Path, json_pack: Path):
+    (tmp_path / "cat.non").write_text(NON_PUZZLE)
+
+    puzzles = load_pack(tmp_path)
+
+    assert [puzzle.name for puzzle in puzzles] == ["Cat", "Cat", "No solution", "Cat"]
+
+
+def test_open_library(json_pack: Path, puzzle: Puzzle):
+    with open_library(json_pack) as library:
+        assert len(library) == 3
+        assert library[0] == library[-1] == puzzle
+        assert library[1] == puzzle._replace(name="No solution", solution=None)
+        assert list(library) == [library[0], library[1], library[2]]
+
+        with pytest.raises(IndexError):
+            library[3]
+
+    assert json_pack.with_name("pack.json.cache").exists()
+
+
+def test_open_library_reuses_cache(json_pack: Path):
+    open_library(json_pack).close()
+    cache_path = json_pack.with_name("pack.json.cache")
+    cache_mtime: int = cache_path.stat().st_mtime_ns
+
+    open_library(json_pack).close()
+    assert cache_path.stat().st_mtime_ns == cache_mtime
+
+    json_pack.write_text(json.dumps([json.loads(json_pack.read_text())["puzzles"][0]]))
+    with open_library(json_pack) as library:
+        assert len(library) == 1
+
+
+@pytest.mark.parametrize("size", (0, 5, 40, -8))
+def test_open_library_rebuilds_damaged_cache(json_pack: Path, puzzle: Puzzle, size: int):
+    open_library(json_pack).close()
+    cache_path = json_pack.with_name("pack.json.cache")
+    data: bytes = cache_path.read_bytes()
+    cache_path.write_bytes(data[:size])
+
+    with pytest.raises(ValueError):
+        PuzzleLibrary(cache_path)
+    with open_library(json_pack) as library:
+        assert library[0] == puzzle
+    assert cache_path.read_bytes() == data
+
+
+def test_write_cache_failure_leaves_no_file(tmp_path: Path, puzzle: Puzzle):
+    def puzzles():
+        yield puzzle
+        raise ValueError("Malformed puzzle")
+
+    with pytest.raises(ValueError):
+        write_cache(puzzles(), tmp_path / "pack.cache")
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_load_puzzle_solves_missing_solution(json_pack: Path, puzzle: Puzzle):
+    assert load_puzzle(json_pack, 1).solution == puzzle.solution
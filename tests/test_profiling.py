@@ -0,0 +1,81 @@
+from typing import Tuple
+
+import pytest
+
+from pycross import Pycross
+from pycross.profiling import (
+    DISPATCH,
+    MOVE,
+    NULL_PROFILER,
+    PLAY,
+    PROFILE_ENV,
+    RESTYLE,
+    SOLVED,
+    STAGES,
+    LatencyHistogram,
+    Profiler,
+)
+
+
+def test_histogram_percentiles():
+    histogram = LatencyHistogram()
+    for elapsed_ns in (100, 120, 150, 900, 5_000):
+        histogram.record(elapsed_ns)
+
+    assert (histogram.count, histogram.max_ns, histogram.mean_ns) == (5, 5_000, 1_254)
+    assert histogram.percentile(0.5) == 255
+    assert histogram.percentile(0.8) == 1_023
+    assert histogram.percentile(1.0) == 5_000
+    assert LatencyHistogram().percentile(0.5) == 0
+
+
+def test_profiler_stages():
+    profiler = Profiler()
+    with profiler.stage(PLAY):
+        pass
+    profiler.record(DISPATCH, 2_000)
+
+    report: str = profiler.report()
+
+    assert profiler.histograms[PLAY].count == 1 and profiler.histograms[DISPATCH].max_ns == 2_000
+    assert [line.split()[0] for line in report.splitlines()[1:]] == STAGES
+
+
+def test_null_profiler_records_nothing():
+    with NULL_PROFILER.stage(PLAY):
+        NULL_PROFILER.record(DISPATCH, 10)
+
+    assert NULL_PROFILER.clock() == 0
+    assert all(histogram.count == 0 for histogram in NULL_PROFILER.histograms.values())
+
+
+async def test_app_move_stages(game_parameters: Tuple[Tuple[int]]):
+    app: Pycross = Pycross(*game_parameters, profile=True)
+    async with app.run_test() as pilot:
+        await pilot.press("z", "right", "z")
+
+    counts = {name: histogram.count for name, histogram in app.profiler.histograms.items()}
+    assert counts == {DISPATCH: 2, PLAY: 2, SOLVED: 2, MOVE: 1, RESTYLE: 2}
+
+
+async def test_virtual_grid_move_stages(game_parameters: Tuple[Tuple[int]]):
+    app: Pycross = Pycross(*game_parameters, virtual_grid=True, profile=True)
+    async with app.run_test() as pilot:
+        await pilot.press("right", "right", "z", "down", "z")
+
+    counts = {name: histogram.count for name, histogram in app.profiler.histograms.items()}
+    assert counts == {DISPATCH: 2, PLAY: 2, SOLVED: 2, MOVE: 3, RESTYLE: 2}
+
+
+def test_profiling_is_opt_in(game_parameters: Tuple[Tuple[int]], monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delenv(PROFILE_ENV, raising=False)
+    assert Pycross(*game_parameters).profiler is NULL_PROFILER
+
+    monkeypatch.setenv(PROFILE_ENV, "1")
+    assert Pycross(*game_parameters).profiler.enabled
+    monkeypatch.setenv(PROFILE_ENV, "Yes")
+    assert Pycross(*game_parameters).profiler.enabled
+    for value in ("0", "false", "no", ""):
+        monkeypatch.setenv(PROFILE_ENV, value)
+        assert Pycross(*game_parameters).profiler is NULL_PROFILER
+    assert Pycross(*game_parameters, profile=False).profiler is NULL_PROFILER
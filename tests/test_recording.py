@@ -0,0 +1,147 @@
+from pathlib import Path
+from typing import Tuple
+
+import pytest
+
+from pycross import Pycross
+from pycross.engine import GameState
+from pycross.recording import (
+    REDO,
+    REGION,
+    RESET,
+    SET,
+    TOGGLE,
+    UNDO,
+    LoggedMove,
+    MoveLog,
+    MoveRecorder,
+    read_move_log,
+    replay_moves,
+)
+
+
+def test_move_log_round_trip(tmp_path: Path):
+    game = GameState(None, [()] * 200, [()] * 120)
+    game.set_cell(5, 6, 1)
+    with MoveRecorder(tmp_path / "game.moves", game) as recorder:
+        recorder.toggle(199, 119)
+        recorder.set(3, 4, 1)
+        recorder.region(1, 2, 30, 40, 0)
+        recorder.undo()
+        recorder.redo()
+        recorder.reset()
+
+    log: MoveLog = read_move_log(tmp_path / "game.moves")
+
+    assert (log.start.board, log.start.checksum) == (game.state, game.checksum())
+    assert len(log.start.history) == 1
+    assert log.moves == [
+        LoggedMove(TOGGLE, 199, 119),
+        LoggedMove(SET, 3, 4, 1),
+        LoggedMove(REGION, 1, 2, 0, 30, 40),
+        LoggedMove(UNDO),
+        LoggedMove(REDO),
+        LoggedMove(RESET),
+    ]
+
+
+def test_truncated_move_log(tmp_path: Path, game_parameters: Tuple[Tuple[int]]):
+    path: Path = tmp_path / "game.moves"
+    with MoveRecorder(path, GameState(game_parameters[2])) as recorder:
+        recorder.toggle(1, 1)
+        recorder.region(0, 0, 2, 2, 1)
+    # Cut in the middle of the region's size word
+    path.write_bytes(path.read_bytes()[:-2])
+
+    assert read_move_log(path).moves == [LoggedMove(TOGGLE, 1, 1)]
+
+
+def test_invalid_move_log(tmp_path: Path):
+    path: Path = tmp_path / "game.moves"
+    path.write_bytes(b"not a move log at all")
+
+    with pytest.raises(ValueError):
+        read_move_log(path)
+
+
+def test_replay_moves(tmp_path: Path, game_parameters: Tuple[Tuple[int]]):
+    *_, solution = game_parameters
+    game = GameState(solution)
+    with MoveRecorder(tmp_path / "game.moves", game) as recorder:
+        for x, y in ((1, 0), (2, 0), (4, 4)):
+            recorder.toggle(x, y)
+            game.update_state(x, y)
+        recorder.region(0, 2, 5, 1, 1)
+        game.paint_region(0, 2, 5, 1, 1)
+        recorder.undo()
+        game.undo()
+        recorder.set(3, 0, 1)
+        game.set_cell(3, 0, 1)
+
+    log: MoveLog = read_move_log(tmp_path / "game.moves")
+    replayed = GameState(solution)
+
+    assert replay_moves(replayed, log.moves, log.start) == 6
+    assert replayed.state == game.state
+    assert replayed.redo() == game.redo()
+
+
+async def test_app_records_moves(tmp_path: Path, game_parameters: Tuple[Tuple[int]]):
+    app: Pycross = Pycross(*game_parameters, record_path=tmp_path / "game.moves")
+    async with app.run_test() as pilot:
+        await pilot.press("z", "right", "z", "u", "y", "f")
+
+    log: MoveLog = read_move_log(tmp_path / "game.moves")
+    replayed = GameState(game_parameters[2])
+    replay_moves(replayed, log.moves, log.start)
+
+    assert log.moves == [
+        LoggedMove(TOGGLE, 0, 0),
+        LoggedMove(TOGGLE, 1, 0),
+        LoggedMove(UNDO),
+        LoggedMove(REDO),
+        LoggedMove(REGION, 0, 0, 1, 5, 1),
+    ]
+    assert replayed.state == app.game_state.state
+
+
+def test_replay_resumed_game(tmp_path: Path, game_parameters: Tuple[Tuple[int]]):
+    *_, solution = game_parameters
+    game = GameState(solution)
+    for x in (0, 1, 2):
+        game.update_state(x, 0)
+    with MoveRecorder(tmp_path / "game.moves", game) as recorder:
+        # Undoes a move made before recording started
+        recorder.undo()
+        game.undo()
+        recorder.toggle(4, 4)
+        game.update_state(4, 4)
+
+    log: MoveLog = read_move_log(tmp_path / "game.moves")
+    replayed = GameState(solution)
+    replay_moves(replayed, log.moves, log.start)
+
+    assert replayed.state == game.state
+    assert replayed.undo() == game.undo()
+
+    with pytest.raises(ValueError):
+        replay_moves(GameState([[1 - cell for cell in row] for row in solution]), log.moves, log.start)
+
+
+async def test_app_records_from_restored_session(tmp_path: Path, game_parameters: Tuple[Tuple[int]]):
+    saved = GameState(game_parameters[2])
+    saved.update_state(2, 2)
+    saved.save(tmp_path / "game.session")
+
+    app: Pycross = Pycross(
+        *game_parameters, session_path=tmp_path / "game.session", record_path=tmp_path / "game.moves"
+    )
+    async with app.run_test() as pilot:
+        await pilot.press("z", "u", "u")
+
+    log: MoveLog = read_move_log(tmp_path / "game.moves")
+    replayed = GameState(game_parameters[2])
+    replay_moves(replayed, log.moves, log.start)
+
+    assert log.start.board == saved.state
+    assert replayed.state == app.game_state.state
@@ -0,0 +1,93 @@
+import asyncio
+from pathlib import Path
+from typing import List, Tuple
+
+import pytest
+
+from pycross.library import Puzzle
+from pycross.server import GameServer
+
+
+@pytest.fixture
+def game_server(game_parameters: Tuple[Tuple[int]]) -> GameServer:
+    return GameServer([Puzzle("cross", *game_parameters)], history_limit=8)
+
+
+def test_move_undo_and_status(game_server: GameServer):
+    assert game_server.execute("new") == "ok 1 5 5"
+    assert game_server.execute("move 1 2 0") == "ok 1 0"
+    assert game_server.execute("move 1 3 0") == "ok 1 0"
+    assert game_server.execute("undo 1") == "ok 1 0"
+    assert game_server.execute("status 1") == "ok solved=0 painted=1 undoable=1"
+    assert game_server.execute("redo 1") == "ok 1 0"
+    assert game_server.execute("status 1") == "ok solved=0 painted=2 undoable=2"
+
+
+def test_solving_a_session(game_server: GameServer, game_parameters: Tuple[Tuple[int]]):
+    *_, solution = game_parameters
+    session_id: str = game_server.execute("new 0").split()[1]
+
+    replies: List[str] = [
+        game_server.execute(f"move {session_id} {x} {y}")
+        for y, row in enumerate(solution)
+        for x, cell in enumerate(row)
+        if cell
+    ]
+
+    assert replies[-1] == "ok 1 1"
+    assert all(reply == "ok 1 0" for reply in replies[:-1])
+
+
+def test_sessions_are_independent(game_server: GameServer):
+    game_server.execute("new")
+    game_server.execute("new")
+    game_server.execute("move 1 0 0")
+
+    assert game_server.execute("status 2") == "ok solved=0 painted=0 undoable=0"
+    assert game_server.execute("close 1") == "ok"
+    assert game_server.execute("status 1") == "err 1: no such session"
+
+
+def test_sessions_belong_to_their_connection(game_server: GameServer):
+    mine: set = set()
+    theirs: set = set()
+    game_server.execute("new", mine)
+
+    assert game_server.execute("move 1 0 0", theirs) == "err 1: no such session"
+    assert game_server.execute("close 1", theirs) == "err 1: no such session"
+    assert game_server.execute("status 1", mine) == "ok solved=0 painted=0 undoable=0"
+    assert mine == {1}
+
+
+@pytest.mark.parametrize(
+    "command",
+    ("", "jump 1", "move 1 5 0", "move 1 0", "move one 0 0", "new 3", "undo"),
+)
+def test_invalid_commands(game_server: GameServer, command: str):
+    game_server.execute("new")
+
+    assert game_server.execute(command).startswith("err ")
+
+
+def test_stats(game_server: GameServer):
+    game_server.execute("new")
+    game_server.execute("move 1 0 0")
+
+    session_stats: dict = dict(field.split("=") for field in game_server.execute("stats 1").split()[1:])
+    server_stats: dict = dict(field.split("=") for field in game_server.execute("stats").split()[1:])
+
+    assert int(session_stats["memory"]) > 0 and int(session_stats["commands"]) == 2
+    assert int(server_stats["sessions"]) == 1 and int(server_stats["commands"]) == 3
+
+
+async def test_sessions_end_with_their_connection(game_server: GameServer, tmp_path: Path):
+    server = await game_server.start(path=str(tmp_path / "pycross.sock"))
+    async with server:
+        reader, writer = await asyncio.open_unix_connection(str(tmp_path / "pycross.sock"))
+        writer.write(b"new\nmove 1 1 0\nstatus 1\nquit\n")
+        replies: List[bytes] = [await reader.readline() for _ in range(4)]
+        await reader.read()
+        writer.close()
+
+        assert replies == [b"ok 1 5 5\n", b"ok 1 0\n", b"ok solved=0 painted=1 undoable=1\n", b"ok\n"]
+        assert game_server.sessions == {}
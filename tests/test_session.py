@@ -0,0 +1,56 @@
+from pathlib import Path
+from typing import Tuple
+
+import pytest
+
+from pycross.engine import GameState
+from pycross.bitboard import BitBoard
+from pycross.history import Move, MoveHistory
+from pycross.session import load_session, save_session
+
+
+def test_session_round_trip(tmp_path: Path):
+    board = BitBoard(20, 3, [1 << 19, 0, 0b101])
+    history = MoveHistory(limit=4)
+    for x in range(6):
+        history.record(x, 1, 0)
+    history.undo()
+
+    save_session(tmp_path / "game.session", board, history, checksum=42)
+    restored_board, restored_history, checksum = load_session(tmp_path / "game.session")
+
+    assert (restored_board, checksum) == (board, 42)
+    assert (len(restored_history), restored_history.limit) == (3, 4)
+    assert restored_history.redo() == Move(5, 1, 0)
+    assert [restored_history.undo().x for _ in range(4)] == [5, 4, 3, 2]
+
+
+def test_invalid_session(tmp_path: Path):
+    path: Path = tmp_path / "game.session"
+    path.write_bytes(b"not a session file at all")
+
+    with pytest.raises(ValueError):
+        load_session(path)
+
+
+def test_game_state_save_restore(tmp_path: Path, game_parameters: Tuple[Tuple[int]]):
+    *_, solution = game_parameters
+    game_state = GameState(solution)
+    for x in (1, 2, 3):
+        game_state.update_state(x, 0)
+    game_state.save(tmp_path / "game.session")
+
+    restored = GameState(solution)
+    restored.restore(tmp_path / "game.session")
+
+    assert restored.state == game_state.state
+    assert restored.undo() == [(3, 0, 0)]
+    assert restored.state[0][3] == 0
+
+
+def test_restore_other_puzzle(tmp_path: Path, game_parameters: Tuple[Tuple[int]]):
+    *_, solution = game_parameters
+    GameState(solution).save(tmp_path / "game.session")
+
+    with pytest.raises(ValueError):
+        GameState([[1 - cell for cell in row] for row in solution]).restore(tmp_path / "game.session")
@@ -0,0 +1,50 @@
+from typing import List, Optional, Tuple
+
+import pytest
+
+from pycross.solver import EMPTY, FILLED, UNKNOWN, SolveStatus, find_solutions, solve, solve_line
+
+_ = UNKNOWN
+
+
+@pytest.mark.parametrize(
+    "line, clue, expected",
+    (
+        pytest.param([_] * 5, (3,), [_, _, FILLED, _, _], id="Overlap of left-most and right-most"),
+        pytest.param([_] * 5, (2, 2), [FILLED, FILLED, EMPTY, FILLED, FILLED], id="Clue fills the line"),
+        pytest.param([_] * 5, (), [EMPTY] * 5, id="Empty clue"),
+        pytest.param([_] * 5, (0,), [EMPTY] * 5, id="Zero clue"),
+        pytest.param([_, FILLED, _, _, _], (2,), [_, FILLED, _, EMPTY, EMPTY], id="Block anchored by known cell"),
+        pytest.param([_, _, EMPTY, _, _], (3,), None, id="Block does not fit"),
+        pytest.param([_] * 3, (2, 2), None, id="Clue longer than the line"),
+        pytest.param([FILLED, _, _], (), None, id="Filled cell without blocks"),
+    )
+)
+def test_solve_line(line: List[int], clue: Tuple[int], expected: Optional[List[int]]):
+    assert solve_line(line, clue) == expected
+
+
+def test_solve_unique(game_parameters: Tuple[Tuple[int]]):
+    top_guides, left_guides, solution = game_parameters
+
+    result = solve(top_guides, left_guides)
+
+    assert result.status is SolveStatus.UNIQUE and result.solution == solution
+
+
+def test_solve_ambiguous():
+    result = solve(((1,), (1,)), ((1,), (1,)))
+
+    assert result.status is SolveStatus.AMBIGUOUS and result.solution is None
+
+
+def test_solve_unsolvable():
+    result = solve(((2,), (0,)), ((1,), (0,)))
+
+    assert result.status is SolveStatus.UNSOLVABLE and result.solution is None
+
+
+def test_find_solutions_limit():
+    solutions = find_solutions(((1,), (1,), (1,)), ((1,), (1,), (1,)), limit=10)
+
+    assert len(solutions) == 6
@@ -0,0 +1,111 @@
+from time import perf_counter
+from typing import List
+
+import pytest
+from textual.geometry import Region, Size
+
+from pycross import Pycross
+from pycross.app import Board, GameGrid, VirtualGameGrid, VirtualLeftFrame, VirtualTopFrame, board_layout
+from pycross.engine import GameState
+
+LARGE_COLUMNS: int = 200
+LARGE_ROWS: int = 120
+# Generous budgets, meant to catch work that grows with the board rather than to benchmark it
+MOUNT_BUDGET_SECONDS: float = 5.0
+MOVE_BUDGET_MS: float = 5.0
+ENGINE_MOVE_BUDGET_US: float = 100.0
+
+
+def _solution(columns: int, rows: int) -> List[List[int]]:
+    return [[int((x * 7 + y * 3) % 5 < 2) for x in range(columns)] for y in range(rows)]
+
+
+@pytest.fixture(scope="module")
+def large_solution() -> List[List[int]]:
+    return _solution(LARGE_COLUMNS, LARGE_ROWS)
+
+
+async def test_large_board_mount(large_solution: List[List[int]]):
+    app: Pycross = Pycross.from_solution(large_solution)
+    start: float = perf_counter()
+    async with app.run_test(size=(160, 50)) as pilot:
+        elapsed: float = perf_counter() - start
+        grid: VirtualGameGrid = app.query_one(VirtualGameGrid)
+
+        assert elapsed < MOUNT_BUDGET_SECONDS
+        assert (grid.columns, grid.rows) == (LARGE_COLUMNS, LARGE_ROWS)
+        for widget in (grid, app.query_one(VirtualTopFrame), app.query_one(VirtualLeftFrame)):
+            assert app.screen.region.contains_region(widget.region)
+
+        grid.move_cursor_to(LARGE_COLUMNS - 1, LARGE_ROWS - 1)
+        await pilot.pause()
+
+        assert grid.scroll_offset.x > 0 and grid.scroll_offset.y > 0
+        assert app.query_one(VirtualTopFrame).scroll_offset.x == grid.scroll_offset.x
+        assert app.query_one(VirtualLeftFrame).scroll_offset.y == grid.scroll_offset.y
+
+
+async def test_large_board_move_latency(large_solution: List[List[int]]):
+    app: Pycross = Pycross.from_solution(large_solution)
+    async with app.run_test(size=(160, 50)):
+        grid: VirtualGameGrid = app.query_one(VirtualGameGrid)
+        app.set_focus(grid)
+
+        # A move is the cursor update plus the lines a frame then renders
+        moves: int = LARGE_COLUMNS + LARGE_ROWS
+        start: float = perf_counter()
+        for i in range(moves):
+            grid.action_move_cursor(*((1, 0) if i < LARGE_COLUMNS else (0, 1)))
+            for y in range(grid.size.height):
+                grid.render_line(y)
+        move_ms: float = (perf_counter() - start) / moves * 1000
+
+        assert (grid.cursor_x, grid.cursor_y) == (LARGE_COLUMNS - 1, LARGE_ROWS - 1)
+        assert move_ms < MOVE_BUDGET_MS
+
+
+def test_large_board_engine_move_latency(large_solution: List[List[int]]):
+    game_state = GameState(large_solution)
+
+    start: float = perf_counter()
+    for y, row in enumerate(large_solution):
+        for x, cell in enumerate(row):
+            if cell:
+                game_state.update_state(x, y)
+    moves: int = sum(map(sum, large_solution))
+    move_us: float = (perf_counter() - start) / moves * 1e6
+
+    assert game_state.solved
+    assert move_us < ENGINE_MOVE_BUDGET_US
+
+
+@pytest.mark.parametrize("available", (None, Size(160, 50), Size(80, 24), Size(20, 10)))
+def test_large_board_layout_fits(available: Size):
+    layout = board_layout(LARGE_COLUMNS, LARGE_ROWS, 119, 38, available, True)
+
+    if available is None:
+        assert (layout.grid_width, layout.grid_height) == (LARGE_COLUMNS * 2 + 1, LARGE_ROWS + 1)
+        assert (layout.top_frame_height, layout.left_frame_width) == (38, 119)
+    else:
+        assert layout.left_frame_width + Board.LEFT_FRAME_MARGIN + layout.grid_width <= available.width
+        assert layout.top_frame_height + layout.grid_height <= available.height
+    assert layout.top_frame_offset + layout.top_frame_width <= layout.left_frame_width + 1 + layout.grid_width
+
+
+async def test_non_square_tile_board():
+    app: Pycross = Pycross.from_solution(_solution(12, 8), virtual_grid=False)
+    async with app.run_test(size=(120, 50)) as pilot:
+        grid: GameGrid = app.query_one(GameGrid)
+        assert len(grid.tiles) == 12 * 8
+        assert grid.tile(11, 7) is app.query_one("#tile_11_7")
+
+        await pilot.click("#tile_11_7")
+        await pilot.press("down", "right")
+        assert app.focused is grid.tile(11, 7)
+
+        await pilot.press("left", "up")
+        assert app.focused is grid.tile(10, 6)
+        assert app.game_state.state[7][11] == 1
+
+        tile_region: Region = grid.tile(11, 7).region
+        assert grid.region.contains_region(tile_region)
@@ -0,0 +1,104 @@
+import json
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from pycross.library import Puzzle, puzzle_to_json
+from pycross.verify import Verdict, VerifyStatus, main, verify_pack, verify_puzzle, verify_puzzles
+
+PUZZLES: List[Puzzle] = [
+    Puzzle("valid", ((1,), (1,)), ((2,), ()), ((1, 1), (0, 0))),
+    Puzzle("mismatch", ((1,), (1,)), ((2,), ()), ((1, 0), (0, 1))),
+    Puzzle("unequal totals", ((2,), (1,)), ((2,), ())),
+    Puzzle("unsolvable", ((), (), (2,)), ((), (), (2,))),
+    Puzzle("ambiguous", ((1,), (1,)), ((1,), (1,))),
+    Puzzle("no solution given", ((1,), (2,)), ((2,), (1,))),
+]
+
+
+@pytest.mark.parametrize(
+    "puzzle, status",
+    zip(
+        PUZZLES,
+        (
+            VerifyStatus.VALID,
+            VerifyStatus.CLUE_MISMATCH,
+            VerifyStatus.UNSOLVABLE,
+            VerifyStatus.UNSOLVABLE,
+            VerifyStatus.AMBIGUOUS,
+            VerifyStatus.VALID,
+        ),
+    ),
+    ids=[puzzle.name for puzzle in PUZZLES],
+)
+def test_verify_puzzle(puzzle: Puzzle, status: VerifyStatus):
+    assert verify_puzzle(7, puzzle).status is status
+
+
+def test_clue_mismatch_detail():
+    assert verify_puzzle(1, PUZZLES[1]) == Verdict(
+        1, "mismatch", VerifyStatus.CLUE_MISMATCH, "mismatch: Left Guide does not match Solution at row 0"
+    )
+
+
+def test_verify_puzzles_in_chunks():
+    verdicts: List[Verdict] = sorted(verify_puzzles(PUZZLES * 3, workers=2, chunk_size=4))
+
+    assert [verdict.index for verdict in verdicts] == list(range(len(PUZZLES) * 3))
+    assert [verdict.name for verdict in verdicts] == [puzzle.name for puzzle in PUZZLES * 3]
+
+
+def test_chunk_size_must_be_positive(tmp_path: Path):
+    with pytest.raises(ValueError):
+        list(verify_puzzles(PUZZLES, workers=1, chunk_size=0))
+
+    with pytest.raises(SystemExit) as exit_info:
+        main([str(tmp_path / "pack.jsonl"), "--chunk-size", "0"])
+    assert exit_info.value.code == 2
+
+
+def test_main(tmp_path: Path, capsys: pytest.CaptureFixture):
+    pack: Path = tmp_path / "pack.jsonl"
+    pack.write_text("".join(f"{puzzle_to_json(puzzle)}\n" for puzzle in PUZZLES), encoding="utf-8")
+    report_path: Path = tmp_path / "report.json"
+
+    with pytest.raises(SystemExit) as exit_info:
+        main([str(pack), "-o", str(report_path), "-j", "1"])
+
+    report: dict = json.loads(report_path.read_text(encoding="utf-8"))
+    assert exit_info.value.code == 1
+    assert report["puzzles"] == len(PUZZLES)
+    assert report["counts"] == {"valid": 2, "clue mismatch": 1, "unsolvable": 2, "ambiguous": 1, "malformed": 0}
+    assert [problem["index"] for problem in report["problems"]] == [1, 2, 3, 4]
+    assert "Verified 6 puzzles" in capsys.readouterr().out
+
+
+def test_valid_pack(tmp_path: Path):
+    pack: Path = tmp_path / "pack.json"
+    pack.write_text(json.dumps([PUZZLES[0]._asdict()]), encoding="utf-8")
+
+    report: dict = verify_pack(pack, workers=1)
+
+    assert report["problems"] == [] and report["counts"]["valid"] == 1
+
+
+def test_malformed_entries(tmp_path: Path):
+    pack: Path = tmp_path / "pack"
+    pack.mkdir()
+    (pack / "a.jsonl").write_text(
+        f"{puzzle_to_json(PUZZLES[0])}\n"
+        '{"name": "no rows", "top_guides": [[1]]}\n'
+        "not json\n"
+        f"{puzzle_to_json(PUZZLES[4])}\n",
+        encoding="utf-8",
+    )
+    (pack / "b.non").write_text("width 2\nheight 2\nrows\n1\ncolumns\n1\n1\n", encoding="utf-8")
+
+    report: dict = verify_pack(pack, workers=1)
+
+    assert report["puzzles"] == 5
+    assert [(problem["index"], problem["status"]) for problem in report["problems"]] == [
+        (1, "malformed"), (2, "malformed"), (3, "ambiguous"), (4, "malformed")
+    ]
+    assert report["problems"][0]["detail"] == "no rows: Missing left_guides"
@@ -0,0 +1,7 @@
+from pycross.workers import run_in_processes
+
+
+def test_run_in_processes():
+    results = run_in_processes(pow, ((base, 2) for base in range(20)), workers=2)
+
+    assert sorted(results) == [base ** 2 for base in range(20)]